@@ -0,0 +1,328 @@
+# Cafe Life QR Benchmark
+# QR oluşturucunun süre / bellek / çıktı boyutu ölçümleri ve sürümler arası karşılaştırma
+#
+# Kullanım:
+#   python scr/qr_benchmark.py run --output bench_yeni.json
+#   python scr/qr_benchmark.py compare bench_eski.json bench_yeni.json
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from queue import Empty
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import qr_generator
+import qr_trace
+
+# Temsili URL'ler: kısa, uzun ve sorgu parametresi yoğun (farklı QR sürümleri üretir)
+BENCH_URLS = {
+    'short': "https://cafelife.netlify.app",
+    'long': "https://cafe-life-digital-menu-istanbul-kadikoy-moda-subesi.netlify.app/menu/tatlilar/waffle",
+    'query': ("https://cafelife.netlify.app/menu?lang=tr&masa=17&kampanya=yaz2025&utm_source=qr"
+              "&utm_medium=sticker&utm_campaign=masa_ustu&ref=print_station_01"),
+}
+
+# Toplu etiket testlerinde masa sayıları
+BATCH_SIZES = [4, 40, 100]
+
+# Tek durumun süre sınırı (sn); aşılırsa süreç sonlandırılır
+CASE_TIMEOUT = 600
+
+# Durum satırının altında gösterilen aşama sayısı
+STAGE_LINES = 4
+
+
+def build_cases(quick=False):
+    """
+    Çalıştırılacak ölçüm durumlarının listesi
+    """
+    urls = {'short': BENCH_URLS['short']} if quick else BENCH_URLS
+    cases = []
+    for url_kind, url in urls.items():
+        for generator in ('card', 'tent', 'stickers'):
+            cases.append({'name': f"{generator}/{url_kind}", 'generator': generator, 'url': url})
+    for size in ([4] if quick else BATCH_SIZES):
+        cases.append({'name': f"batch/{size}", 'generator': 'batch', 'url': BENCH_URLS['short'],
+                      'tables': size})
+    return cases
+
+
+def qr_version(url, error_correction):
+    """
+    URL'nin kodlandığı QR sürümü (raporda bağlam için)
+    """
+    qr = qr_generator.qrcode.QRCode(error_correction=error_correction)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr.version
+
+
+def _peak_rss_kb(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS bayt, Linux KB döndürür
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _cpu_seconds():
+    if resource is None:
+        return time.process_time()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _run_generator(case, output_dir, workers):
+    options = {'output_dir': output_dir, 'use_cache': False}
+    generator = case['generator']
+    if generator == 'card':
+        return qr_generator.create_cafe_qr_code(case['url'], **options)
+    if generator == 'tent':
+        return [qr_generator.create_table_tent_qr(case['url'], **options)]
+    if generator == 'stickers':
+        return [qr_generator.create_small_qr_stickers(case['url'], **options)]
+    return qr_generator.create_qr_sticker_batch(case['url'], tables=range(1, case['tables'] + 1),
+                                                workers=workers, **options)
+
+
+def _run_case(case, repeat, workers, queue):
+    """
+    Tek bir durumu ayrı süreçte ölçer (tepe bellek diğer durumlardan etkilenmez)
+    """
+    try:
+        samples = []
+        stage_samples = []
+        output_bytes = 0
+
+        # Oluşturucu çıktısını (etiket işlem havuzu dahil) sustur
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
+        # Aşama süreleri (bellek ölçümü süreleri şişirdiği için kapalı)
+        qr_trace.enable(memory=False)
+
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as output_dir:
+                qr_trace.reset()
+                wall_start, cpu_start = time.perf_counter(), _cpu_seconds()
+                files = _run_generator(case, output_dir, workers)
+                samples.append((time.perf_counter() - wall_start, _cpu_seconds() - cpu_start))
+                stage_samples.append(qr_trace.summarize(qr_trace.drain()))
+                output_bytes = sum(os.path.getsize(path) for path in files)
+
+        queue.put({
+            'wall_seconds': [round(wall, 4) for wall, _ in samples],
+            'cpu_seconds': [round(cpu, 4) for _, cpu in samples],
+            'stages': _stage_medians(stage_samples),
+            'peak_rss_kb': _peak_rss_kb(resource.RUSAGE_SELF) if resource else None,
+            'children_peak_rss_kb': _peak_rss_kb(resource.RUSAGE_CHILDREN) if resource else None,
+            'output_bytes': output_bytes,
+            'output_files': len(files),
+        })
+    except BaseException:
+        queue.put({'error': traceback.format_exc()})
+        raise
+
+
+def _stage_medians(stage_samples):
+    """
+    Tekrarlar boyunca aşama başına çağrı sayısı ve ortanca toplam süre (ms),
+    toplam süreye göre azalan sırada
+    """
+    stages = {}
+    for name in {name for sample in stage_samples for name in sample}:
+        totals = [sample[name]['total_ms'] if name in sample else 0.0 for sample in stage_samples]
+        counts = [sample[name]['count'] for sample in stage_samples if name in sample]
+        stages[name] = {'count': max(counts), 'total_ms': round(statistics.median(totals), 3)}
+    return dict(sorted(stages.items(), key=lambda item: -item[1]['total_ms']))
+
+
+def _wait_result(process, queue, timeout):
+    """
+    Alt sürecin sonucunu bekler. Süreç sonuç göndermeden çıkarsa veya süre
+    aşılırsa (süreç sonlandırılır) hata kaydı döner.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return queue.get(timeout=0.5)
+        except Empty:
+            pass
+        if not process.is_alive():
+            try:
+                return queue.get(timeout=0.5)
+            except Empty:
+                return {'error': f"Süreç sonuç göndermeden çıktı (çıkış kodu {process.exitcode})"}
+        if time.monotonic() > deadline:
+            process.terminate()
+            return {'error': f"Zaman aşımı ({timeout} sn)"}
+
+
+def run_benchmarks(repeat=3, workers=None, quick=False, timeout=CASE_TIMEOUT):
+    """
+    Tüm durumları çalıştırır ve ölçüm sonuçlarını döndürür. Hata veren veya
+    süresi aşan durumlar {'error': ...} olarak kaydedilir, diğerleri sürer.
+    """
+    if repeat < 1:
+        raise ValueError(f"Tekrar sayısı en az 1 olmalı: {repeat}")
+
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for case in build_cases(quick):
+        queue = context.Queue()
+        process = context.Process(target=_run_case, args=(case, repeat, workers, queue))
+        process.start()
+        result = _wait_result(process, queue, timeout)
+        process.join()
+        if 'error' not in result and process.exitcode != 0:
+            result = {'error': f"Süreç hatayla çıktı (çıkış kodu {process.exitcode})"}
+
+        if 'error' in result:
+            results[case['name']] = result
+            print(f"{case['name']:<20} HATA: {result['error'].strip().splitlines()[-1]}")
+            continue
+
+        # Toplu etiketlerde basılan QR masa URL'sini kodlar (en uzun: son masa)
+        encoded_url = case['url']
+        if case['generator'] == 'batch':
+            encoded_url = qr_generator.table_url(case['url'], case['tables'])
+        error_correction = (qr_generator.qrcode.constants.ERROR_CORRECT_H
+                            if case['generator'] in ('stickers', 'batch')
+                            else qr_generator.qrcode.constants.ERROR_CORRECT_M)
+        result['qr_version'] = qr_version(encoded_url, error_correction)
+        result['wall_median'] = round(statistics.median(result['wall_seconds']), 4)
+        result['cpu_median'] = round(statistics.median(result['cpu_seconds']), 4)
+        results[case['name']] = result
+
+        print(f"{case['name']:<20} v{result['qr_version']:<3} "
+              f"{result['wall_median'] * 1000:8.1f} ms  cpu {result['cpu_median'] * 1000:8.1f} ms  "
+              f"rss {result['peak_rss_kb'] or 0:>7} KB  {result['output_bytes'] / 1024:9.1f} KB")
+        print(' ' * 22 + ', '.join(f"{name} {stage['total_ms']:.1f} ms"
+                                   for name, stage in list(result['stages'].items())[:STAGE_LINES]))
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def environment_info():
+    """
+    Karşılaştırma için ortam bilgisi
+    """
+    import numpy
+    import PIL
+    return {
+        'revision': _git_revision(),
+        'renderer_version': qr_generator.RENDERER_VERSION,
+        'python': platform.python_version(),
+        'pillow': PIL.__version__,
+        'numpy': numpy.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare_results(old, new, threshold=0.10):
+    """
+    İki benchmark dosyasını karşılaştırır; süre, bellek veya çıktı boyutu
+    eşikten fazla artan durumları regresyon olarak döndürür
+    """
+    regressions = []
+    print(f"{'durum':<20} {'süre':>18} {'bellek':>18} {'çıktı':>18}")
+    for name, new_result in new['results'].items():
+        old_result = old['results'].get(name)
+        if not old_result:
+            print(f"{name:<20} (yeni durum)")
+            continue
+
+        row = []
+        for metric in ('wall_median', 'peak_rss_kb', 'output_bytes'):
+            before, after = old_result.get(metric), new_result.get(metric)
+            if not before or after is None:
+                row.append(f"{'-':>18}")
+                continue
+            change = (after - before) / before
+            row.append(f"{change * 100:+17.1f}%")
+            if change > threshold:
+                regressions.append((name, metric, before, after))
+        print(f"{name:<20} {' '.join(row)}")
+
+        # Süre regresyonunda en çok uzayan aşamalar
+        if regressions and regressions[-1][:2] == (name, 'wall_median'):
+            old_stages, new_stages = old_result.get('stages') or {}, new_result.get('stages') or {}
+            growth = sorted(((new_stages[stage]['total_ms'] - old_stages.get(stage, {}).get('total_ms', 0.0), stage)
+                             for stage in new_stages), reverse=True)
+            for delta, stage in growth[:STAGE_LINES]:
+                if delta > 0:
+                    print(f"{'':<22}{stage}: +{delta:.1f} ms")
+
+    for name, metric, before, after in regressions:
+        print(f"REGRESYON: {name} {metric}: {before} -> {after}")
+    return regressions
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"en az 1 olmalı: {value}")
+    return number
+
+
+def main(argv=None):
+    """Benchmark komut satırı"""
+    parser = argparse.ArgumentParser(description="Cafe Life QR benchmark")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Ölçümleri çalıştır")
+    run_parser.add_argument('--output', default='qr_benchmark.json', help="Sonuç JSON dosyası")
+    run_parser.add_argument('--repeat', type=_positive_int, default=3, help="Durum başına tekrar (en az 1)")
+    run_parser.add_argument('--workers', type=int, default=1, help="Toplu etiket işlem sayısı")
+    run_parser.add_argument('--quick', action='store_true', help="Sadece kısa URL ve küçük toplu iş")
+    run_parser.add_argument('--timeout', type=_positive_int, default=CASE_TIMEOUT, help="Durum başına süre sınırı (sn)")
+
+    compare_parser = commands.add_parser('compare', help="İki sonuç dosyasını karşılaştır")
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.10, help="Regresyon eşiği (0.10 = %%10)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = {
+            'environment': environment_info(),
+            'settings': {'repeat': args.repeat, 'workers': args.workers, 'quick': args.quick},
+            'results': run_benchmarks(args.repeat, args.workers, args.quick, args.timeout),
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Sonuçlar: {args.output}")
+        return 1 if any('error' in result for result in report['results'].values()) else 0
+
+    with open(args.old, 'r', encoding='utf-8') as f:
+        old = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = json.load(f)
+    return 1 if compare_results(old, new, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
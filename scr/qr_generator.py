@@ -1,16 +1,783 @@
 # Cafe Life QR Kod Oluşturucu
-# PyCharm'da çalıştırmak için gerekli kütüphaneler: pip install qrcode[pil] pillow
+# PyCharm'da çalıştırmak için gerekli kütüphaneler: pip install qrcode[pil] pillow numpy
 
 import qrcode
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 import os
-from datetime import datetime
+import sys
+import argparse
+import csv
+import hashlib
+import io
+import json
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import qr_trace
+from qr_imposition import SHEET_FORMATS, compute_sheet_layout, write_pages
+from qr_optimizer import format_report, optimize_qr
+from qr_styles import MODULE_STYLES, QR_GRADIENTS, gradient_pixels, render_styled_coverage
+from qr_vector import VectorDocument
+from qr_verify import verify_qr_region
+
+# Desteklenen çıktı formatları (png: raster, svg/pdf: vektör)
+OUTPUT_FORMATS = ('png', 'svg', 'pdf')
+
+# Raster kayıt profilleri: kodlama süresi ile dosya boyutu arasında seçim
+ENCODING_PROFILES = {
+    'fast-preview': {'format': 'PNG', 'extension': 'png', 'options': {'compress_level': 1}},
+    'balanced': {'format': 'PNG', 'extension': 'png', 'options': {'compress_level': 6}},
+    'archival-smallest': {'format': 'PNG', 'extension': 'png', 'options': {'optimize': True}},
+    'web-webp': {'format': 'WEBP', 'extension': 'webp', 'options': {'quality': 85, 'method': 4}},
+}
+DEFAULT_ENCODING_PROFILE = 'balanced'
+
+# Bu süreçte kaydedilen dosyaların kodlama süresi ve boyutu
+ENCODE_STATS = []
+
+# Bu süreçte üretilen raster çıktıların okunabilirlik kontrolleri
+VERIFY_REPORTS = []
+
+
+@qr_trace.traced('qr.mask')
+def render_qr_mask(matrix, size, light_index=0, dark_index=1):
+    """
+    QR modül matrisini tam sayı ölçekli, palet indeksli bir görüntüye çevirir.
+    Varsayılan: indeks 0 arka plan, 1 modül rengi; renkler apply_qr_theme ile
+    atanır ya da indeksler doğrudan hedef palet canvas'ına göre verilir.
+    """
+    modules = np.where(np.asarray(matrix, dtype=bool), dark_index, light_index).astype(np.uint8)
+    if modules.shape[0] > size:
+        raise ValueError(f"QR kod ({modules.shape[0]} modül) {size} piksele sığmıyor")
+    scale = size // modules.shape[0]
+
+    # Her modülü scale x scale piksellik bloğa genişlet (bulanıklık yok)
+    pixels = np.repeat(np.repeat(modules, scale, axis=0), scale, axis=1)
+
+    # Hedef boyuta tamamlamak için kalan pikselleri arka planla ortala
+    if pixels.shape[0] < size:
+        offset = (size - pixels.shape[0]) // 2
+        padded = np.full((size, size), light_index, dtype=np.uint8)
+        padded[offset:offset + pixels.shape[0], offset:offset + pixels.shape[1]] = pixels
+        pixels = padded
+
+    height, width = pixels.shape
+    return Image.frombytes('P', (width, height), pixels.tobytes())
+
+
+# Metin kenar yumuşatması için her renge ayrılan ton sayısı (palet canvas)
+TEXT_RAMP_LEVELS = 16
+
+
+def new_palette_canvas(size, back_color, ink_colors):
+    """
+    Düz renkli tasarımlar için palet ('P') modunda canvas oluşturur (RGB'nin 1/3'ü).
+    İndeks 0 arka plan, 1..n mürekkep renkleridir; her mürekkep için arka plandan
+    o renge geçen ara tonlar da ayrılır (yumuşak kenarlı metin için).
+    (canvas, inks) döner; inks[renk] = (tam_renk_indeksi, ara_ton_başlangıcı)
+    """
+    back = ImageColor.getrgb(back_color)[:3]
+    colors = [ImageColor.getrgb(color)[:3] for color in ink_colors]
+    palette = list(back)
+    for rgb in colors:
+        palette.extend(rgb)
+
+    inks = {}
+    steps = TEXT_RAMP_LEVELS - 1
+    for index, (ink, rgb) in enumerate(zip(ink_colors, colors), 1):
+        ramp_base = len(palette) // 3 - 1
+        for level in range(1, steps):
+            palette.extend(round(b + (c - b) * level / steps) for b, c in zip(back, rgb))
+        inks[ink] = (index, ramp_base)
+
+    canvas = Image.new('P', size, 0)
+    canvas.putpalette(palette)
+    return canvas, inks
+
+
+def apply_qr_theme(qr_mask, fill_color, back_color):
+    """
+    Palet indeksli QR maskesine renk teması uygular (sadece palet değişir)
+    """
+    themed = qr_mask.copy()
+    themed.putpalette(ImageColor.getrgb(back_color) + ImageColor.getrgb(fill_color))
+    return themed
+
+
+def is_styled(qr_style='square', qr_gradient=None):
+    """Klasik kare/tek renk dışında bir modül stili veya renk geçişi seçili mi"""
+    if qr_style not in MODULE_STYLES:
+        raise ValueError(f"Bilinmeyen modül stili: {qr_style} ({', '.join(MODULE_STYLES)})")
+    if qr_gradient is not None and qr_gradient not in QR_GRADIENTS:
+        raise ValueError(f"Bilinmeyen renk geçişi: {qr_gradient} ({', '.join(QR_GRADIENTS)})")
+    return qr_style != 'square' or qr_gradient is not None
+
+
+def style_params(qr_style='square', qr_gradient=None, output_format='png'):
+    """
+    Stilin içerik anahtarına katkısı. Varsayılan stilde ve vektör çıktıda
+    (stil sadece raster çizimde uygulanır) boştur; eski anahtarlar korunur.
+    """
+    if output_format != 'png' or not is_styled(qr_style, qr_gradient):
+        return {}
+    return {'qr_style': qr_style, 'qr_gradient': qr_gradient}
+
+
+def _style_note(qr_style, qr_gradient, output_format):
+    if output_format != 'png' and is_styled(qr_style, qr_gradient):
+        print("   Not: modül stili ve renk geçişi sadece raster (png/webp) çıktıda uygulanır")
+
+
+@qr_trace.traced('qr.styled')
+def paste_styled_qr(canvas, matrix, box, border, fill, inks=None, qr_style='rounded', qr_gradient=None):
+    """
+    Stilli QR'ı (qr_styles) canvas'ta box=(x, y, boyut) alanına yapıştırır;
+    açık modüller altta kalan zemini gösterir. Palet canvas'ta kenar tonları
+    inks[fill] rampasından gelir; renk geçişi için canvas RGB olmalıdır.
+    """
+    x, y, size = box
+    coverage = render_styled_coverage(matrix, size, qr_style, border)
+    if qr_gradient is None and canvas.mode == 'P':
+        lut, mask_lut = coverage_luts(*inks[fill])
+        coverage_img = Image.frombytes('L', (size, size), coverage.tobytes())
+        indices = Image.frombytes('P', (size, size), coverage_img.point(lut).tobytes())
+        canvas.paste(indices, (x, y), coverage_img.point(mask_lut))
+        return
+
+    if canvas.mode == 'P':
+        raise ValueError("Renk geçişi için canvas RGB olmalı")
+    mask = Image.frombytes('L', (size, size), coverage.tobytes())
+    if qr_gradient is None:
+        canvas.paste(fill, (x, y), mask)
+    else:
+        start, end = (ImageColor.getrgb(color)[:3] for color in QR_GRADIENTS[qr_gradient])
+        canvas.paste(Image.fromarray(gradient_pixels(size, start, end), 'RGB'), (x, y), mask)
+
+
+# Font dosyası adayları (tercih sırasına göre) ve aranacak klasörler
+FONT_NAMES = [
+    "arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
+    "NotoSans-Regular.ttf", "FreeSans.ttf",
+]
+FONT_DIRS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts"),  # Paketle gelen
+    os.path.join("assets", "fonts"),
+    r"C:\Windows\Fonts",
+    "/Library/Fonts",
+    "/System/Library/Fonts/Supplemental",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts"),
+    "/usr/local/share/fonts",
+    "/usr/share/fonts",
+]
+
+
+@lru_cache(maxsize=None)
+def find_font_path():
+    """
+    Kullanılacak TrueType fontu süreç başına bir kez bulur.
+    Sıra: CAFE_QR_FONT ortam değişkeni, paket/sistem klasörleri, fontconfig.
+    """
+    env_font = os.environ.get("CAFE_QR_FONT")
+    if env_font and os.path.isfile(env_font):
+        return env_font
+
+    for font_dir in FONT_DIRS:
+        if not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for name in FONT_NAMES:
+                if name in files:
+                    return os.path.join(root, name)
+
+    # Linux'ta fontconfig'e sor
+    if shutil.which("fc-match"):
+        try:
+            result = subprocess.run(["fc-match", "-f", "%{file}", "sans-serif:style=Regular"],
+                                    capture_output=True, text=True, timeout=5)
+            if result.returncode == 0 and os.path.isfile(result.stdout.strip()):
+                return result.stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    """
+    Verilen boyutta fontu döndürür, (yol, boyut) başına bir kez yüklenir
+    """
+    font_path = find_font_path()
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            pass
+
+    # Varsayılan font kullan
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1024)
+@qr_trace.traced('text.render')
+def get_label_sprite(text, size):
+    """
+    Metni bir kez gri tonlamalı maske olarak çizer ve önbelleğe alır.
+    (maske, (x_kayma, y_kayma)) döner; renk yapıştırırken verilir.
+    """
+    font = get_font(size)
+    left, top, right, bottom = font.getbbox(text)
+    sprite = Image.new('L', (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(sprite).text((-left, -top), text, fill=255, font=font)
+    return sprite, (left, top)
+
+
+@lru_cache(maxsize=1024)
+@qr_trace.traced('text.render')
+def get_palette_label(text, size, full_index, ramp_base):
+    """
+    Metin maskesini palet indekslerine çevirir (kenar tonları rampadan).
+    (indeks görüntüsü, yapıştırma maskesi, kayma) döner.
+    """
+    sprite, offset = get_label_sprite(text, size)
+    lut, mask_lut = coverage_luts(full_index, ramp_base)
+    indices = Image.frombytes('P', sprite.size, sprite.point(lut).tobytes())
+    mask = sprite.point(mask_lut)
+    return indices, mask, offset
+
+
+@lru_cache(maxsize=32)
+def coverage_luts(full_index, ramp_base):
+    """
+    Kapsama (0-255) -> palet indeksi tablosu (kenar tonları mürekkep
+    rampasından) ve yapıştırma maskesi tablosu
+    """
+    steps = TEXT_RAMP_LEVELS - 1
+    levels = [round(value * steps / 255) for value in range(256)]
+    lut = [0 if level == 0 else full_index if level == steps else ramp_base + level for level in levels]
+    return lut, [255 if level else 0 for level in levels]
+
+
+@qr_trace.traced('text.draw')
+def draw_label(canvas, position, text, size, fill, centered=False, inks=None):
+    """
+    Önbellekteki metin maskesini canvas'a tek renkle yapıştırır.
+    centered=True ise x yok sayılır ve metin yatayda ortalanır.
+    Palet canvas için inks (new_palette_canvas çıktısı) verilir; canvas
+    RGB'ye çevrilmişse inks yok sayılır ve tek renkle yapıştırılır.
+    """
+    if inks is not None and canvas.mode != 'P':
+        inks = None
+    if inks is not None:
+        sprite, mask, (offset_x, offset_y) = get_palette_label(text, size, *inks[fill])
+    else:
+        sprite, (offset_x, offset_y) = get_label_sprite(text, size)
+        mask = sprite
+    x, y = position
+    if centered:
+        x = (canvas.width - sprite.width) // 2
+    if inks is not None:
+        canvas.paste(sprite, (x + offset_x, y + offset_y), mask)
+    else:
+        canvas.paste(fill, (x + offset_x, y + offset_y), mask)
+
+
+def draw_vector_label(doc, position, text, size, fill, center_width=None):
+    """
+    draw_label'ın vektör karşılığı: position metin satırının üstüdür.
+    center_width verilirse metin x'ten başlayan bu genişlikte ortalanır;
+    ölçüler belgede çizilen fonta göre vektör katmanında yapılır.
+    """
+    x, y = position
+    if center_width is None:
+        doc.text(x, y, text, size, fill)
+    else:
+        doc.text(x + center_width / 2, y, text, size, fill, anchor='middle')
+
+
+# Logo dosyası adayları (çalışma klasörüne göre)
+LOGO_PATHS = [
+    os.path.join("assets", "images", "logo.jpg"),
+    os.path.join("assets", "images", "logo.png"),
+    "logo.jpg",
+    "logo.png",
+    # Başka klasörden çalıştırıldığında proje köküne göre
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "images", "logo.jpg"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "images", "logo.png"),
+]
+
+# QR ortasına gömülen logonun sembol kenarına oranı (alan ~%5, H seviyesi %30 kurtarır)
+CENTER_LOGO_RATIO = 0.22
+
+
+@lru_cache(maxsize=None)
+def find_logo_path():
+    """
+    Logo dosyasını süreç başına bir kez arar, bulunamazsa None döner
+    """
+    for logo_path in LOGO_PATHS:
+        if os.path.isfile(logo_path):
+            print(f"Logo bulundu: {logo_path}")
+            return logo_path
+
+    print(f"Logo bulunamadı (çalışma klasörü: {os.getcwd()})")
+    return None
+
+
+@lru_cache(maxsize=4)
+@qr_trace.traced('logo.decode')
+def _decode_logo(path, digest):
+    """Logo dosyasını bir kez açıp RGBA'ya çevirir (anahtar: içerik özeti)"""
+    with Image.open(path) as img:
+        return img.convert('RGBA')
+
+
+@lru_cache(maxsize=32)
+@qr_trace.traced('logo.resize')
+def _logo_variant(path, digest, size, circular):
+    """Yeniden boyutlandırılmış (ve istenirse daire maskeli) logo"""
+    logo = _decode_logo(path, digest).resize((size, size), Image.Resampling.LANCZOS)
+    if circular:
+        mask = Image.new('L', (size, size), 0)
+        ImageDraw.Draw(mask).ellipse([0, 0, size - 1, size - 1], fill=255)
+        logo.putalpha(Image.composite(logo.getchannel('A'), mask, mask))
+    return logo
+
+
+def get_logo(size, circular=False):
+    """
+    size x size RGBA logo; çözme ve LANCZOS küçültme logo dosyasının özeti ve
+    boyut başına bir kez yapılır. Logo yoksa None döner.
+    """
+    logo_path = find_logo_path()
+    if not logo_path:
+        return None
+    try:
+        return _logo_variant(os.path.abspath(logo_path), file_digest(logo_path), size, circular)
+    except Exception as e:
+        print(f"Logo yükleme hatası: {e}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _logo_badge(logo_digest, size, ring):
+    logo = get_logo(size)
+    badge = Image.new('RGBA', (size + 2 * ring, size + 2 * ring), (255, 255, 255, 0))
+    ImageDraw.Draw(badge).ellipse([0, 0, size + 2 * ring, size + 2 * ring], fill=(255, 255, 255, 255))
+    badge.paste(logo, (ring, ring), logo)
+    return badge
+
+
+def get_logo_badge(size=150, ring=10):
+    """
+    Beyaz daire zemin üzerine logo (masa çadırı için) - hazır RGBA, tek yapıştırma
+    """
+    logo_path = find_logo_path()
+    if not logo_path or get_logo(size) is None:
+        return None
+    return _logo_badge(file_digest(logo_path), size, ring)
+
+
+def center_logo_box(matrix_size, border, box):
+    """
+    QR ortasında logonun kaplayacağı kare alan (x, y, kenar, modül pikseli);
+    modül ızgarasına hizalıdır
+    """
+    x, y, size = box
+    module = max(1, size // matrix_size)
+    offset = (size - matrix_size * module) // 2
+    symbol = matrix_size - 2 * border
+    modules = max(3, round(symbol * CENTER_LOGO_RATIO))
+    if (symbol - modules) % 2:
+        modules -= 1
+    start = border + (symbol - modules) // 2
+    return x + offset + start * module, y + offset + start * module, modules * module, module
+
+
+@lru_cache(maxsize=16)
+def _center_logo(logo_digest, side, module):
+    plate = Image.new('RGBA', (side, side), (255, 255, 255, 255))
+    logo = get_logo(side - module, circular=True)
+    plate.paste(logo, (module // 2, module // 2), logo)
+    return plate
+
+
+def get_center_logo(side, module):
+    """
+    QR ortası için beyaz zeminli, daire maskeli logo (side x side)
+    """
+    logo_path = find_logo_path()
+    if not logo_path or get_logo(side - module, circular=True) is None:
+        return None
+    return _center_logo(file_digest(logo_path), side, module)
+
+
+@qr_trace.traced('tent.gradient')
+def render_tent_gradient(width, height):
+    """
+    Masa kartı arka plan gradyanını tek adımda oluşturur.
+    Satır renkleri bir kez hesaplanır ve 1 piksellik sütun tüm genişliğe
+    yayılır (ara tam boy dizi oluşturulmaz).
+    """
+    ratio = np.arange(height) / height
+    rows = np.stack([
+        255 * (1 - ratio * 0.1),
+        154 + 101 * ratio * 0.3,
+        86 + 169 * ratio * 0.2,
+    ], axis=1).astype(np.uint8)
+
+    column = Image.fromarray(rows.reshape(height, 1, 3), 'RGB')
+    return column.resize((width, height), Image.Resampling.NEAREST)
+
+
+# Raster çıktıyı değiştiren her çizim değişikliğinde artırılır; önbellekteki
+# eski çıktıları (aynı içerik özetli dosya adları) geçersiz kılar.
+#   1: içerik özetli dosya adları
+#   2: paletli kanvas, 16 seviyeli mürekkep rampası ve paletli yazılar
+#   3: statik katmanlar için önbellekli şablonlar
+#   4: vektör yazılar Helvetica ölçüleriyle ortalanır
+RENDERER_VERSION = 4
 
 
-def create_cafe_qr_code(url, output_dir="qr_codes"):
+def clear_input_caches(logo=False, font=False):
     """
-    Cafe Life için özelleştirilmiş QR kod oluşturur
+    Logo veya font dosyası değiştiğinde (izleme modu) süreç içi önbellekleri
+    temizler. Özetle anahtarlanan önbellekler kendiliğinden yenilenir; burada
+    dosya yolu ve font nesnesi gibi yalnızca bir kez çözülenler temizlenir.
     """
+    if logo:
+        find_logo_path.cache_clear()
+    if font:
+        for cached in (find_font_path, get_font, get_label_sprite, get_palette_label,
+                       _card_template, _tent_template, _sticker_sheet_template):
+            cached.cache_clear()
+
+
+def file_digest(path):
+    """
+    Dosya içeriğinin SHA-256 özeti (değişmeyen dosyalar tekrar okunmaz)
+    """
+    stat = os.stat(path)
+    return _file_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=64)
+def _file_digest(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def artifact_key(kind, **params):
+    """
+    Çıktıyı belirleyen tüm girdilerden (URL, tema, yerleşim, boyut, font,
+    renderer sürümü...) deterministik kısa bir içerik anahtarı üretir
+    """
+    font_path = find_font_path()
+    inputs = {
+        'kind': kind,
+        'renderer': RENDERER_VERSION,
+        'font': file_digest(font_path) if font_path else 'default',
+        **params,
+    }
+    encoded = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def output_extension(output_format, profile=DEFAULT_ENCODING_PROFILE):
+    """
+    Çıktı formatını ve kayıt profilini doğrular, dosya uzantısını döndürür
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Desteklenmeyen çıktı formatı: {output_format} ({', '.join(OUTPUT_FORMATS)})")
+    if profile not in ENCODING_PROFILES:
+        raise ValueError(f"Bilinmeyen kayıt profili: {profile} ({', '.join(ENCODING_PROFILES)})")
+
+    if output_format == 'png':
+        return ENCODING_PROFILES[profile]['extension']
+    return output_format
+
+
+def qr_module_count(url, error_correction='M', border=4):
+    """
+    URL'nin en küçük QR sürümündeki kenar boşluğu dahil modül sayısı (matris
+    ve maske hesaplanmaz); veri hiçbir sürüme sığmıyorsa ValueError
+    """
+    qr = qrcode.QRCode(error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{error_correction}"),
+                       border=border)
+    qr.add_data(url)
+    try:
+        version = qr.best_fit()
+    except (ValueError, qrcode.exceptions.DataOverflowError):
+        raise ValueError(f"Veri QR koda sığmayacak kadar uzun ({len(url)} karakter)")
+    return version * 4 + 17 + 2 * border
+
+
+def qr_image_min_size(url):
+    """render_qr_image'in QR'ı kırpmadan çizebileceği en küçük boyut (piksel, modül başına 1 piksel)"""
+    return qr_module_count(url, 'M', 4)
+
+
+def render_qr_image(url, theme='orange', size=400, output_format='png'):
+    """
+    Yazısız, temalı tek QR kodu bellekte çizer (kart QR ayarlarıyla):
+    raster için palet canvas, 'svg'/'pdf' için VectorDocument döner
+    """
+    fill_color, back_color = CAFE_THEMES[theme]
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=4)
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    if output_format in ('svg', 'pdf'):
+        doc = VectorDocument(size, size)
+        doc.rect(0, 0, size, size, back_color)
+        doc.qr(qr.get_matrix(), 0, 0, size, fill_color)
+        return doc
+    canvas = new_palette_canvas((size, size), back_color, [fill_color])[0]
+    canvas.paste(render_qr_mask(qr.get_matrix(), size), (0, 0))
+    return canvas
+
+
+def encode_artifact(canvas, output_format='png', profile=DEFAULT_ENCODING_PROFILE):
+    """
+    Canvas'ı (veya vektör belgeyi) diske yazmadan bayt olarak kodlar.
+    output_format: 'png', 'webp', 'svg' veya 'pdf'
+    """
+    if isinstance(canvas, VectorDocument):
+        return canvas.to_pdf() if output_format == 'pdf' else canvas.to_svg()
+    if output_format == 'webp':
+        profile = 'web-webp'
+    settings = ENCODING_PROFILES[profile]
+    if settings['format'] == 'WEBP' and canvas.mode == 'P':
+        canvas = canvas.convert('RGB')
+    buffer = io.BytesIO()
+    with qr_trace.span('encode', profile=profile):
+        canvas.save(buffer, settings['format'], **settings['options'])
+    return buffer.getvalue()
+
+
+class BackgroundWriter:
+    """
+    Kayıtları (PNG kodlama + disk yazımı) tek bir arka plan iş parçacığında
+    yapar; çizim ile G/Ç örtüşür. Kuyruk sınırlıdır: max_pending kayıt
+    bekliyorsa yeni kayıt isteyen çizim bekler (bellek sınırlı kalır).
+    """
+
+    def __init__(self, max_pending=2):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.errors = []
+        self.pid = os.getpid()
+        self.thread = threading.Thread(target=self._run, name='qr-writer', daemon=True)
+        self.thread.start()
+
+    def submit(self, *args, **kwargs):
+        """Kaydı kuyruğa ekler; kuyruk doluysa yer açılana kadar bekler"""
+        self.queue.put((args, kwargs))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            args, kwargs = item
+            try:
+                _write_artifact(*args, **kwargs)
+            except Exception as e:
+                self.errors.append(e)
+
+    def close(self, raise_errors=True):
+        """
+        Bekleyen tüm kayıtları bitirir; kayıt hatası varsa ilkini yükseltir.
+        raise_errors=False ise hatalar yalnızca yazdırılır.
+        """
+        self.queue.put(None)
+        self.thread.join()
+        if self.errors and raise_errors:
+            raise self.errors[0]
+        for error in self.errors:
+            print(f"   Kayıt hatası: {error}")
+
+
+# Etkin arka plan yazıcısı (yoksa save_artifact doğrudan yazar)
+_background_writer = None
+
+
+@contextmanager
+def background_writer(max_pending=2):
+    """
+    Blok içindeki save_artifact çağrılarını arka plan yazıcısına yönlendirir;
+    blok bitince tüm dosyalar yazılmış olur
+    """
+    global _background_writer
+    writer = BackgroundWriter(max_pending)
+    previous, _background_writer = _background_writer, writer
+    try:
+        yield writer
+    except BaseException:
+        _background_writer = previous
+        # Blok zaten hatayla bitti; kayıt hatası asıl hatanın yerine geçmesin
+        writer.close(raise_errors=False)
+        raise
+    _background_writer = previous
+    writer.close()
+
+
+def save_artifact(canvas, filepath, profile=DEFAULT_ENCODING_PROFILE, **save_options):
+    """
+    Görüntüyü (veya SVG/PDF belgesini) önce geçici dosyaya yazar, sonra
+    yerine taşır; böylece yarım kalan bir kayıt önbellekte hazır çıktı gibi görünmez.
+    Kodlama süresi ve yazılan bayt sayısı raporlanır ve ENCODE_STATS'a eklenir.
+    background_writer() bloğu içinde kayıt kuyruğa bırakılır; canvas artık değiştirilmemelidir.
+    """
+    # İşlem havuzuna kopyalanan (fork) süreçlerde yazıcı iş parçacığı yoktur
+    if _background_writer is not None and _background_writer.pid == os.getpid():
+        _background_writer.submit(canvas, filepath, profile, **save_options)
+        return filepath
+    return _write_artifact(canvas, filepath, profile, **save_options)
+
+
+def _write_artifact(canvas, filepath, profile=DEFAULT_ENCODING_PROFILE, **save_options):
+    temp_path = f"{filepath}.tmp"
+    start = time.perf_counter()
+    with qr_trace.span('save', file=os.path.basename(filepath)):
+        try:
+            if isinstance(canvas, VectorDocument):
+                profile = os.path.splitext(filepath)[1][1:]
+                canvas.save(temp_path, profile)
+            else:
+                settings = ENCODING_PROFILES[profile]
+                if settings['format'] == 'WEBP' and canvas.mode == 'P':
+                    # WebP palet desteklemez; RGB'ye ancak burada, kayıtta geçilir
+                    canvas = canvas.convert('RGB')
+                canvas.save(temp_path, settings['format'], **settings['options'], **save_options)
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(filepath)
+    ENCODE_STATS.append({'path': filepath, 'profile': profile, 'seconds': elapsed, 'bytes': size})
+    print(f"   Kayıt: {os.path.basename(filepath)} [{profile}] {elapsed * 1000:.0f} ms, {size / 1024:.1f} KB")
+    return filepath
+
+
+@lru_cache(maxsize=1024)
+@qr_trace.traced('qr.make')
+def build_qr(url, error_correction, border, size_px, module_mm=None, dpi=300, lock_level=False):
+    """
+    Hazır (matrisi oluşturulmuş) QRCode, kullanılan hata düzeltme seviyesi ve
+    optimizasyon raporu. module_mm verilmezse sabit seviye ile en küçük sürüm;
+    verilirse qr_optimizer baskı boyutuna (size_px @ dpi) göre sürüm, kodlama,
+    maske ve - lock_level değilse - en yüksek uygun seviyeyi seçer.
+    """
+    if module_mm is None:
+        qr = qrcode.QRCode(version=1, error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{error_correction}"),
+                           border=border)
+        qr.add_data(url)
+        qr.make(fit=True)
+        return qr, error_correction, None
+
+    qr, report = optimize_qr(url, size_px=size_px, dpi=dpi, border=border, min_module_mm=module_mm,
+                             error_correction=error_correction if lock_level else None)
+    return qr, report['error_correction'], report
+
+
+def check_scannability(canvas, matrix, box, border, error_correction, label, qr_report=None):
+    """
+    Son canvas üzerindeki QR'ı modül matrisiyle karşılaştırır (qr_verify).
+    Sorunlu baskıyı kayıttan önce ekrana yazar; raporu döndürür.
+    qr_report (build_qr) verilirse modül boyutu rapora eklenir, hedefin altındaysa uyarı verilir.
+    """
+    with qr_trace.span('verify'):
+        report = verify_qr_region(canvas, matrix, box, border, error_correction)
+    report['artifact'] = label
+    if qr_report:
+        report['qr'] = qr_report
+        if not qr_report['fits']:
+            report['warnings'].append(f"modül {qr_report['module_mm']:.2f} mm, hedef "
+                                      f"{qr_report['min_module_mm']} mm (yavaş okunabilir)")
+    if not report['ok']:
+        print(f"   OKUNABİLİRLİK HATASI ({label}): {'; '.join(report['errors'])} - basmadan önce kontrol edin!")
+    for warning in report['warnings']:
+        print(f"   Uyarı ({label}): {warning}")
+    return report
+
+
+# Sabit katman şablonlarının sürümü: kart/çadır/etiket yerleşimi değişince artırılır
+# (önbellekteki hazır katmanlar bu sürüm ve boyutla anahtarlanır)
+TEMPLATE_VERSION = 1
+
+
+# QR kod renkli tema - Cafe Life temasına uygun (ad: (QR rengi, arka plan))
+CAFE_THEMES = {
+    'orange': ('#ff6b35', 'white'),  # Ana tema: Turuncu-Beyaz
+    'light-orange': ('#ff9a56', 'white'),  # Açık turuncu-Beyaz
+    'black': ('black', 'white'),  # Klasik siyah-Beyaz
+    'brown': ('#8B4513', '#FFE4B3'),  # Kahverengi-Krem
+}
+
+
+@lru_cache(maxsize=8)
+@qr_trace.traced('template.card')
+def _card_template(version, size, fill_color, back_color):
+    """
+    Kartın sabit katmanı: arka plan, başlık, alt başlık ve açıklama.
+    Kart başına sadece QR ve URL yazısı bu katmanın kopyasına eklenir.
+    """
+    canvas, inks = new_palette_canvas(size, back_color, [fill_color, 'gray'])
+    draw_label(canvas, (0, 20), "CAFE LIFE", 48, fill_color, centered=True, inks=inks)
+    draw_label(canvas, (0, 70), "DİJİTAL MENÜ", 24, fill_color, centered=True, inks=inks)
+    draw_label(canvas, (0, 920), "Kameranızı QR koda tutun", 24, fill_color, centered=True, inks=inks)
+    return canvas, inks
+
+
+def card_filename(url, colors, output_format='png', profile=DEFAULT_ENCODING_PROFILE, logo_path=None,
+                  module_mm=None, qr_style='square', qr_gradient=None):
+    """
+    Kartın içerik anahtarlı dosya adı; colors: (QR rengi, arka plan),
+    logo_path: QR ortasına gömülen logo (yoksa None)
+    """
+    fill_color, back_color = colors
+    key = artifact_key('card', url=url, theme=(fill_color, back_color), size=(800, 1000),
+                       error_correction='H' if logo_path else 'M', border=4, format=output_format,
+                       profile=profile if output_format == 'png' else None,
+                       center_logo=file_digest(logo_path) if logo_path else None, module_mm=module_mm,
+                       **style_params(qr_style, qr_gradient, output_format))
+    color_name = fill_color.replace('#', '').replace(' ', '_')
+    return f"cafe_life_qr_{color_name}_{key}.{output_extension(output_format, profile)}"
+
+
+@qr_trace.traced('card')
+def create_cafe_qr_code(url, output_dir="qr_codes", use_cache=True, output_format='png',
+                        profile=DEFAULT_ENCODING_PROFILE, themes=None, center_logo=False, module_mm=None,
+                        qr_style='square', qr_gradient=None):
+    """
+    Cafe Life için özelleştirilmiş QR kod oluşturur.
+    output_format: 'png', 'svg' veya 'pdf'; profile: raster kayıt profili;
+    themes: CAFE_THEMES adları (varsayılan: hepsi);
+    center_logo: logoyu QR ortasına göm (hata düzeltme H'ye çıkar);
+    module_mm: hedef modül boyutu (mm) - verilirse QR baskı boyutuna göre optimize edilir;
+    qr_style: modül stili (square, rounded, dots), qr_gradient: QR_GRADIENTS adı - sadece raster çıktıda;
+    Aynı girdilerle daha önce üretilmiş kartlar önbellekten kullanılır.
+    """
+    output_extension(output_format, profile)
+    styled = is_styled(qr_style, qr_gradient) and output_format == 'png'
 
     # Çıktı klasörünü oluştur
     if not os.path.exists(output_dir):
@@ -21,94 +788,95 @@ def create_cafe_qr_code(url, output_dir="qr_codes"):
     print(f"URL: {url}")
     print(f"Çıktı klasörü: {output_dir}")
 
-    # QR kod ayarları
-    qr = qrcode.QRCode(
-        version=1,  # QR kodun boyutu (1-40 arası)
-        error_correction=qrcode.constants.ERROR_CORRECT_M,  # Hata düzeltme seviyesi
-        box_size=10,  # Her kutunun piksel boyutu
-        border=4,  # Kenar boşluğu
-    )
-
-    # URL'yi QR koda ekle
-    qr.add_data(url)
-    qr.make(fit=True)
+    # Seçilen renk temaları
+    unknown = [name for name in (themes or []) if name not in CAFE_THEMES]
+    if unknown:
+        raise ValueError(f"Bilinmeyen tema: {', '.join(unknown)} ({', '.join(CAFE_THEMES)})")
+    cafe_colors = [CAFE_THEMES[name] for name in (themes or CAFE_THEMES)]
 
-    # QR kod renkli tema - Cafe Life temasına uygun
-    cafe_colors = [
-        ('#ff6b35', 'white'),  # Ana tema: Turuncu-Beyaz
-        ('#ff9a56', 'white'),  # Açık turuncu-Beyaz
-        ('black', 'white'),  # Klasik siyah-Beyaz
-        ('#8B4513', '#FFE4B3'),  # Kahverengi-Krem
-    ]
+    # Ortaya gömülü logo için yüksek hata düzeltme
+    logo_path = find_logo_path() if center_logo else None
+    error_correction = 'H' if logo_path else 'M'
 
     qr_codes = []
+    qr = None
+    qr_mask = None
 
     for i, (fill_color, back_color) in enumerate(cafe_colors, 1):
-        # QR kodu oluştur
-        qr_img = qr.make_image(fill_color=fill_color, back_color=back_color)
-
-        # Boyutu ayarla (800x800 piksel)
-        qr_img = qr_img.resize((800, 800), Image.Resampling.LANCZOS)
-
-        # Yeni bir canvas oluştur (logo ve yazı için ekstra alan)
-        canvas_width, canvas_height = 800, 1000
-        canvas = Image.new('RGB', (canvas_width, canvas_height), back_color)
+        # Dosya adı - içerik anahtarı girdilerden türetilir
+        filename = card_filename(url, (fill_color, back_color), output_format, profile, logo_path, module_mm,
+                                 qr_style, qr_gradient)
+        filepath = os.path.join(output_dir, filename)
+        qr_codes.append(filepath)
 
-        # QR kodu ortala
-        qr_x = (canvas_width - 800) // 2
-        qr_y = 100  # Üstte biraz boşluk bırak
-        canvas.paste(qr_img, (qr_x, qr_y))
+        if use_cache and os.path.exists(filepath):
+            print(f"QR Kod {i}: {filename} (önbellekten)")
+            continue
 
-        # Yazı ekle
-        draw = ImageDraw.Draw(canvas)
+        if qr is None:
+            # QR kod: 800 piksellik alan, 4 modül kenar boşluğu
+            qr, qr_level, qr_report = build_qr(url, error_correction, 4, 800, module_mm,
+                                               lock_level=bool(logo_path))
+            if qr_report:
+                print(f"   {format_report(qr_report)}")
+            _style_note(qr_style, qr_gradient, output_format)
 
-        try:
-            # Sistem fontunu bul (Windows/Linux/Mac uyumlu)
-            title_font = ImageFont.truetype("arial.ttf", 48)
-            subtitle_font = ImageFont.truetype("arial.ttf", 24)
-            url_font = ImageFont.truetype("arial.ttf", 20)
-        except:
-            # Varsayılan font kullan
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-            url_font = ImageFont.load_default()
-
-        # Başlık
-        title_text = "CAFE LIFE"
-        title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_x = (canvas_width - title_width) // 2
-        draw.text((title_x, 20), title_text, fill=fill_color, font=title_font)
-
-        # Alt başlık
-        subtitle_text = "DİJİTAL MENÜ"
-        subtitle_bbox = draw.textbbox((0, 0), subtitle_text, font=subtitle_font)
-        subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
-        subtitle_x = (canvas_width - subtitle_width) // 2
-        draw.text((subtitle_x, 70), subtitle_text, fill=fill_color, font=subtitle_font)
-
-        # QR kod altına açıklama
-        instruction_text = "Kameranızı QR koda tutun"
-        instruction_bbox = draw.textbbox((0, 0), instruction_text, font=subtitle_font)
-        instruction_width = instruction_bbox[2] - instruction_bbox[0]
-        instruction_x = (canvas_width - instruction_width) // 2
-        draw.text((instruction_x, 920), instruction_text, fill=fill_color, font=subtitle_font)
-
-        # URL bilgisi (küçük yazıyla)
         url_text = f"{url[:50]}{'...' if len(url) > 50 else ''}"
-        url_bbox = draw.textbbox((0, 0), url_text, font=url_font)
-        url_width = url_bbox[2] - url_bbox[0]
-        url_x = (canvas_width - url_width) // 2
-        draw.text((url_x, 960), url_text, fill='gray', font=url_font)
-
-        # Dosya adı
-        color_name = fill_color.replace('#', '').replace(' ', '_')
-        filename = f"cafe_life_qr_{color_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        filepath = os.path.join(output_dir, filename)
+
+        if output_format != 'png':
+            # Vektör kart: aynı yerleşim, QR modülleri birleşik şeritler halinde
+            canvas = VectorDocument(800, 1000)
+            canvas.rect(0, 0, 800, 1000, back_color)
+            canvas.qr(qr.get_matrix(), 0, 100, 800, fill_color)
+            if logo_path:
+                _embed_vector_center_logo(canvas, qr.get_matrix(), 4, (0, 100, 800))
+            draw_vector_label(canvas, (0, 20), "CAFE LIFE", 48, fill_color, center_width=800)
+            draw_vector_label(canvas, (0, 70), "DİJİTAL MENÜ", 24, fill_color, center_width=800)
+            draw_vector_label(canvas, (0, 920), "Kameranızı QR koda tutun", 24, fill_color, center_width=800)
+            draw_vector_label(canvas, (0, 960), url_text, 20, 'gray', center_width=800)
+            save_artifact(canvas, filepath)
+            print(f"QR Kod {i}: {filename}")
+            continue
+
+        if qr_mask is None and not styled:
+            # Modül matrisini bir kez 800x800 piksele ölçekle (indeks 0/1), temalar
+            # sadece canvas paletini değiştirir
+            qr_mask = render_qr_mask(qr.get_matrix(), 800)
+
+        # Sabit katman (arka plan + yazılar) önbellekteki şablondan kopyalanır
+        # İndeks 0 arka plan, 1 tema rengi - QR maskesi doğrudan yapıştırılır
+        canvas_width, canvas_height = 800, 1000
+        template, inks = _card_template(TEMPLATE_VERSION, (canvas_width, canvas_height), fill_color, back_color)
+        with qr_trace.span('composite', theme=fill_color):
+            canvas = template.copy()
+
+            # QR kodu ortala
+            qr_x = (canvas_width - 800) // 2
+            qr_y = 100  # Üstte biraz boşluk bırak
+            if styled:
+                # Renk geçişi ve logo palete sığmaz; sadece bu modlarda RGB'ye geçilir
+                if logo_path or qr_gradient:
+                    canvas = canvas.convert('RGB')
+                paste_styled_qr(canvas, qr.get_matrix(), (qr_x, qr_y, 800), 4, fill_color, inks,
+                                qr_style, qr_gradient)
+            else:
+                canvas.paste(qr_mask, (qr_x, qr_y))
+
+            # URL bilgisi (küçük yazıyla)
+            draw_label(canvas, (0, 960), url_text, 20, 'gray', centered=True, inks=inks)
+
+            if logo_path:
+                # Logo renkleri palete sığmaz; sadece bu modda RGB'ye geçilir
+                if canvas.mode != 'RGB':
+                    canvas = canvas.convert('RGB')
+                embed_center_logo(canvas, qr.get_matrix(), 4, (qr_x, qr_y, 800))
+
+        # Okunabilirlik kontrolü (son canvas üzerinden)
+        VERIFY_REPORTS.append(check_scannability(canvas, qr.get_matrix(), (qr_x, qr_y, 800), 4,
+                                                 qr_level, filename, qr_report))
 
         # Kaydet
-        canvas.save(filepath, 'PNG', quality=95)
-        qr_codes.append(filepath)
+        save_artifact(canvas, filepath, profile)
 
         print(f"QR Kod {i}: {filename}")
         print(f"   Renk: {fill_color} / {back_color}")
@@ -117,209 +885,1074 @@ def create_cafe_qr_code(url, output_dir="qr_codes"):
     return qr_codes
 
 
-def create_table_tent_qr(url, output_dir="qr_codes"):
+def tent_filename(url, output_format='png', profile=DEFAULT_ENCODING_PROFILE, center_logo=False, module_mm=None,
+                  qr_style='square', qr_gradient=None):
+    """
+    Çadır kartının içerik anahtarlı dosya adı - logo içeriği de anahtara dahil
+    """
+    logo_path = find_logo_path()
+    key = artifact_key('table_tent', url=url, size=(2480, 1240),
+                       logo=file_digest(logo_path) if logo_path else None, format=output_format,
+                       profile=profile if output_format == 'png' else None,
+                       center_logo=bool(center_logo and logo_path), module_mm=module_mm,
+                       **style_params(qr_style, qr_gradient, output_format))
+    return f"cafe_life_table_tent_{key}.{output_extension(output_format, profile)}"
+
+
+@qr_trace.traced('tent')
+def create_table_tent_qr(url, output_dir="qr_codes", use_cache=True, output_format='png',
+                         profile=DEFAULT_ENCODING_PROFILE, center_logo=False, module_mm=None,
+                         qr_style='square', qr_gradient=None):
     """
     Masa üstü çadır tarzı QR kod kartı oluşturur - Logo ile
+    output_format: 'png', 'svg' veya 'pdf'; profile: raster kayıt profili;
+    center_logo: logoyu ayrıca QR ortasına göm (hata düzeltme H'ye çıkar);
+    module_mm: hedef modül boyutu (mm) - verilirse QR baskı boyutuna göre optimize edilir;
+    qr_style: modül stili (square, rounded, dots), qr_gradient: QR_GRADIENTS adı - sadece raster çıktıda
     """
     print("\nMASA ÇADİR KARTI OLUŞTURULUYOR...")
 
+    filename = tent_filename(url, output_format, profile, center_logo, module_mm, qr_style, qr_gradient)
+    tent_filepath = os.path.join(output_dir, filename)
+
+    if use_cache and os.path.exists(tent_filepath):
+        print(f"Masa çadır kartı: {filename} (önbellekten)")
+        return tent_filepath
+
     # A4 boyutu (300 DPI): 2480x3508 piksel
     # Yarım A4 yatay: 3508x1240 piksel (katlanacak)
     card_width, card_height = 2480, 1240
 
-    # Canvas oluştur
-    canvas = Image.new('RGB', (card_width, card_height), 'white')
-    draw = ImageDraw.Draw(canvas)
+    # Logo (çözülmüş ve 150x150'ye küçültülmüş hali süreç içinde önbellekte)
+    logo_img = get_logo(150)
+    center_logo = bool(center_logo and logo_img)
+    error_correction = 'H' if center_logo else 'M'
 
-    # Arka plan gradyanı benzeri efekt
-    for y in range(card_height):
-        ratio = y / card_height
-        r = int(255 * (1 - ratio * 0.1))
-        g = int(154 + 101 * ratio * 0.3)
-        b = int(86 + 169 * ratio * 0.2)
-        color = (r, g, b)
-        draw.rectangle([(0, y), (card_width, y + 1)], fill=color)
-
-        # Logo kontrol - debug bilgisi ekleyin
-        print("Mevcut dizin:", os.getcwd())
-        print("Logo dosyası aranıyor...")
-
-        logo_paths = [
-            "assets/images/logo.jpg",
-            "assets/images/logo.png",
-            "logo.jpg",
-            "logo.png"
-        ]
-
-        for path in logo_paths:
-            print(f"Kontrol ediliyor: {path} - {'✓ VAR' if os.path.exists(path) else '✗ YOK'}")
-
-        # Dosya listesini göster
-        if os.path.exists("assets/images"):
-            print("assets/images klasöründeki dosyalar:")
-            for f in os.listdir("assets/images"):
-                print(f"  - {f}")
-
-    # Logo yüklemeyi dene
-    logo_img = None
-    logo_paths = [
-        "assets/images/logo.jpg",
-        "assets/images/logo.png",
-        "assets\\images\\logo.jpg",
-        "assets\\images\\logo.png"
-    ]
-
-    for logo_path in logo_paths:
-        if os.path.exists(logo_path):
-            try:
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((150, 150), Image.Resampling.LANCZOS)
-                print(f"Logo bulundu: {logo_path}")
-                break
-            except Exception as e:
-                print(f"Logo yükleme hatası: {e}")
-                continue
+    # Sol yarı: QR kod (400 piksellik alan)
+    qr, error_correction, qr_report = build_qr(url, error_correction, 4, 400, module_mm, lock_level=center_logo)
+    if qr_report:
+        print(f"   {format_report(qr_report)}")
+    _style_note(qr_style, qr_gradient, output_format)
 
-    # Sol yarı: QR kod
-    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_M,
-                       box_size=8, border=4)
-    qr.add_data(url)
-    qr.make(fit=True)
+    os.makedirs(output_dir, exist_ok=True)
+
+    if output_format != 'png':
+        save_artifact(_tent_vector(qr.get_matrix(), logo_img, card_width, card_height, center_logo), tent_filepath)
+        print(f"Masa çadır kartı: {filename}")
+        return tent_filepath
+
+    # Gradyan, logo ve yazılar önbellekteki şablondan kopyalanır
+    template = _tent_template(TEMPLATE_VERSION, (card_width, card_height),
+                              file_digest(find_logo_path()) if logo_img else None)
+
+    styled = is_styled(qr_style, qr_gradient)
+    if not styled:
+        qr_img = apply_qr_theme(render_qr_mask(qr.get_matrix(), 400), '#ff6b35', 'white')
+
+    with qr_trace.span('composite'):
+        canvas = template.copy()
+
+        # QR kodu sol tarafa yerleştir (stilli QR beyaz kare zemin üzerine)
+        qr_box = (200, (card_height - 400) // 2, 400)
+        if styled:
+            canvas.paste('white', (qr_box[0], qr_box[1], qr_box[0] + 400, qr_box[1] + 400))
+            paste_styled_qr(canvas, qr.get_matrix(), qr_box, 4, '#ff6b35', None, qr_style, qr_gradient)
+        else:
+            canvas.paste(qr_img, qr_box[:2])
+
+        if center_logo:
+            embed_center_logo(canvas, qr.get_matrix(), 4, qr_box)
+
+    # Okunabilirlik kontrolü (logo ve gradyan dahil son canvas üzerinden)
+    VERIFY_REPORTS.append(check_scannability(canvas, qr.get_matrix(), qr_box, 4, error_correction,
+                                             filename, qr_report))
 
-    qr_img = qr.make_image(fill_color='#ff6b35', back_color='white')
-    qr_img = qr_img.resize((400, 400), Image.Resampling.LANCZOS)
+    # Kaydet
+    save_artifact(canvas, tent_filepath, profile, dpi=(300, 300))
+
+    print(f"Masa çadır kartı: {filename}")
+    return tent_filepath
 
-    # QR kodu sol tarafa yerleştir
-    canvas.paste(qr_img, (200, (card_height - 400) // 2))
+
+@lru_cache(maxsize=4)
+@qr_trace.traced('template.tent')
+def _tent_template(version, size, logo_digest=None):
+    """
+    Çadır kartının sabit katmanı: gradyan arka plan, QR üstündeki logo rozeti
+    ve sağ yarıdaki yazılar. logo_digest önbellek anahtarıdır (logo değişirse
+    şablon yeniden çizilir). Kart başına bu şablonun kopyasına sadece QR eklenir.
+    """
+    card_width, card_height = size
+    canvas = render_tent_gradient(card_width, card_height)
 
     # Logo varsa, QR kodun üstüne yerleştir
-    if logo_img:
+    if logo_digest:
         logo_x = 200 + (400 - 150) // 2  # QR kodun ortasına
         logo_y = (card_height - 400) // 2 - 180  # QR kodun üstüne
 
-        # Logo için beyaz arka plan (daire)
-        logo_bg = Image.new('RGBA', (170, 170), (255, 255, 255, 0))
-        logo_bg_draw = ImageDraw.Draw(logo_bg)
-        logo_bg_draw.ellipse([0, 0, 170, 170], fill=(255, 255, 255, 255))
-
-        # Logo arka planını yapıştır
-        canvas.paste(logo_bg, (logo_x - 10, logo_y - 10), logo_bg)
-
-        # Logoyu yapıştır
-        if logo_img.mode == 'RGBA':
-            canvas.paste(logo_img, (logo_x, logo_y), logo_img)
-        else:
-            canvas.paste(logo_img, (logo_x, logo_y))
+        # Beyaz daire zemin + logo (önbellekteki hazır rozet)
+        logo_badge = get_logo_badge(150, 10)
+        canvas.paste(logo_badge, (logo_x - 10, logo_y - 10), logo_badge)
 
     # Sağ yarı: Yazılar
-    try:
-        big_font = ImageFont.truetype("arial.ttf", 120)
-        medium_font = ImageFont.truetype("arial.ttf", 60)
-        small_font = ImageFont.truetype("arial.ttf", 40)
-    except:
-        big_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_x = card_width // 2 + 200
 
     # Başlık
-    title_x = card_width // 2 + 200
-    draw.text((title_x, 150), "CAFE LIFE", fill='white', font=big_font)
-    draw.text((title_x, 280), "DİJİTAL MENÜ", fill='white', font=medium_font)
+    draw_label(canvas, (title_x, 150), "CAFE LIFE", 120, 'white')
+    draw_label(canvas, (title_x, 280), "DİJİTAL MENÜ", 60, 'white')
 
     # Açıklama
-    draw.text((title_x, 450), "QR kodu okut", fill='white', font=medium_font)
-    draw.text((title_x, 520), "Menüyü görüntüle", fill='white', font=medium_font)
-    draw.text((title_x, 590), "Siparişini ver", fill='white', font=medium_font)
+    draw_label(canvas, (title_x, 450), "QR kodu okut", 60, 'white')
+    draw_label(canvas, (title_x, 520), "Menüyü görüntüle", 60, 'white')
+    draw_label(canvas, (title_x, 590), "Siparişini ver", 60, 'white')
 
     # WiFi bilgisi (isteğe bağlı)
-    draw.text((title_x, 700), "WiFi: CafeLife_Guest", fill='lightgray', font=small_font)
+    draw_label(canvas, (title_x, 700), "WiFi: CafeLife_Guest", 40, 'lightgray')
+    return canvas
 
-    # Kaydet
-    tent_filename = f"cafe_life_table_tent_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    tent_filepath = os.path.join(output_dir, tent_filename)
-    canvas.save(tent_filepath, 'PNG', quality=95, dpi=(300, 300))
 
-    print(f"Masa çadır kartı: {tent_filename}")
-    return tent_filepath
+@qr_trace.traced('logo.embed')
+def embed_center_logo(canvas, matrix, border, box):
+    """
+    Logoyu (beyaz zeminli) RGB canvas'taki QR'ın ortasına yapıştırır
+    """
+    x, y, side, module = center_logo_box(len(matrix), border, box)
+    logo = get_center_logo(side, module)
+    if logo:
+        canvas.paste(logo, (x, y), logo)
 
 
-def create_small_qr_stickers(url, output_dir="qr_codes"):
+def _embed_vector_center_logo(doc, matrix, border, box):
+    """Vektör belgede QR ortasına beyaz zemin ve daire maskeli logo"""
+    x, y, side, module = center_logo_box(len(matrix), border, box)
+    logo = get_logo(side - module, circular=True)
+    if logo:
+        doc.rect(x, y, side, side, 'white')
+        doc.image('center_logo', logo, x + module // 2, y + module // 2, side - module, side - module)
+
+
+def _tent_vector(qr_matrix, logo_img, card_width, card_height, center_logo=False):
     """
-    Küçük QR kod etiketleri oluşturur (masalar için)
+    Masa çadır kartının vektör sürümü (raster yerleşimin aynısı)
     """
-    print("\nKÜÇÜK QR ETİKETLERİ OLUŞTURULUYOR...")
+    doc = VectorDocument(card_width, card_height)
 
-    # 5x5 cm sticker boyutu (300 DPI): 590x590 piksel
-    sticker_size = 590
-    stickers_per_sheet = 4  # A4'te 4 adet
+    # Gradyan satır formülünün uç renkleri (formül doğrusal)
+    doc.gradient(0, 0, card_width, card_height, (255, 154, 86), (229, 184, 119))
 
-    # A4 boyutu
-    sheet_width, sheet_height = 2480, 3508
-    canvas = Image.new('RGB', (sheet_width, sheet_height), 'white')
+    qr_y = (card_height - 400) // 2
+    doc.rect(200, qr_y, 400, 400, 'white')
+    doc.qr(qr_matrix, 200, qr_y, 400, '#ff6b35')
+    if center_logo:
+        _embed_vector_center_logo(doc, qr_matrix, 4, (200, qr_y, 400))
 
-    # QR kod oluştur
-    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_H,
-                       box_size=6, border=2)
-    qr.add_data(url)
-    qr.make(fit=True)
+    if logo_img:
+        logo_x = 200 + (400 - 150) // 2
+        logo_y = qr_y - 180
+        doc.ellipse(logo_x - 10, logo_y - 10, 170, 170, 'white')
+        doc.image('logo', logo_img, logo_x, logo_y, 150, 150)
 
-    positions = [
-        (300, 400),  # Sol üst
-        (1590, 400),  # Sağ üst
-        (300, 2500),  # Sol alt
-        (1590, 2500)  # Sağ alt
-    ]
+    title_x = card_width // 2 + 200
+    draw_vector_label(doc, (title_x, 150), "CAFE LIFE", 120, 'white')
+    draw_vector_label(doc, (title_x, 280), "DİJİTAL MENÜ", 60, 'white')
+    draw_vector_label(doc, (title_x, 450), "QR kodu okut", 60, 'white')
+    draw_vector_label(doc, (title_x, 520), "Menüyü görüntüle", 60, 'white')
+    draw_vector_label(doc, (title_x, 590), "Siparişini ver", 60, 'white')
+    draw_vector_label(doc, (title_x, 700), "WiFi: CafeLife_Guest", 40, 'lightgray')
+    return doc
 
-    for i, (x, y) in enumerate(positions):
-        # QR kod oluştur
-        qr_img = qr.make_image(fill_color='#ff6b35', back_color='white')
-        qr_img = qr_img.resize((400, 400), Image.Resampling.LANCZOS)
 
-        # Sticker alanı
-        sticker_canvas = Image.new('RGB', (sticker_size, sticker_size), 'white')
-        draw = ImageDraw.Draw(sticker_canvas)
+# A4 sayfasında etiket konumları (300 DPI)
+STICKER_POSITIONS = [
+    (300, 400),  # Sol üst
+    (1590, 400),  # Sağ üst
+    (300, 2500),  # Sol alt
+    (1590, 2500)  # Sağ alt
+]
 
-        # Kenarlık
-        draw.rectangle([0, 0, sticker_size - 1, sticker_size - 1], outline='#ff6b35', width=5)
 
-        # QR kodu ortala
-        qr_x = (sticker_size - 400) // 2
-        qr_y = 50
-        sticker_canvas.paste(qr_img, (qr_x, qr_y))
+def table_url(url, table):
+    """
+    Masa numarasını URL'ye sorgu parametresi olarak ekler (örn. ?masa=17)
+    """
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != 'masa']
+    query.append(('masa', str(table)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def load_table_manifest(manifest_path, base_url=None):
+    """
+    Masa listesini CSV veya JSON manifest dosyasından okur.
+    CSV: 'masa,url' başlıklı satırlar. JSON: [{"masa": 17, "url": "..."}, 18, ...]
+    URL verilmeyen masalar için base_url'den masa URL'si türetilir.
+    """
+    if manifest_path.lower().endswith('.json'):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+        rows = [row if isinstance(row, dict) else {'masa': row} for row in rows]
+    else:
+        with open(manifest_path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+    tables = []
+    for row in rows:
+        table = str(row['masa']).strip()
+        url = (row.get('url') or '').strip()
+        if not url:
+            if not base_url:
+                raise ValueError(f"Masa {table} için URL yok ve temel URL verilmedi")
+            url = table_url(base_url, table)
+        tables.append((table, url))
+
+    return tables
+
+
+def _sticker_qr(url, qr_size=400, module_mm=None, dpi=300):
+    """
+    Etiket QR kodu (yüksek hata düzeltme, dar kenar): (QRCode, seviye, rapor)
+    """
+    return build_qr(url, 'H', 2, qr_size, module_mm, dpi)
+
+
+def _draw_sticker_static(canvas, inks, x, y, sticker_size=590, bleed=0):
+    """
+    Etiketin her masada aynı olan katmanı: kenarlık (taşma payı dahil) ve
+    "CAFE LIFE MENÜ" yazısı. Yerleşim 590 piksellik (5x5 cm, 300 DPI)
+    etikete göre ölçeklenir; bleed > 0 ise kenarlık rengi kesim çizgisinin
+    dışına taşırılır.
+    """
+    scale = sticker_size / 590
+    orange = inks['#ff6b35'][0]
+
+    draw = ImageDraw.Draw(canvas)
+    draw.rectangle([x - bleed, y - bleed, x + sticker_size - 1 + bleed, y + sticker_size - 1 + bleed],
+                   outline=orange, width=max(1, round(5 * scale)) + bleed)
+    _draw_sticker_label(canvas, inks, x, y, "CAFE LIFE MENÜ", 480, '#ff6b35', sticker_size)
+
+
+def _draw_sticker_label(canvas, inks, x, y, text, text_y, color, sticker_size):
+    """Etiket içinde yatayda ortalı yazı"""
+    scale = sticker_size / 590
+    font_size = round(28 * scale)
+    sprite = get_palette_label(text, font_size, *inks[color])[0]
+    text_x = x + (sticker_size - sprite.width) // 2
+    draw_label(canvas, (text_x, y + round(text_y * scale)), text, font_size, color, inks=inks)
+
+
+def _draw_sticker_dynamic(canvas, inks, x, y, url, table, sticker_size=590, module_mm=None, dpi=300,
+                          qr_style='square', qr_gradient=None):
+    """
+    Etiketin masaya göre değişen katmanı: QR kod ve masa numarası.
+    Renk geçişli stilde canvas RGB olmalıdır (sticker_sheet_canvas(rgb=True)).
+    Doğrulama için QR matrisi, canvas'taki alanı, hata düzeltme seviyesi ve
+    optimizasyon raporu döner.
+    """
+    scale = sticker_size / 590
+    orange = inks['#ff6b35'][0]
+
+    # QR kodu ortala (indeksler sayfa paletine göre)
+    qr_size = round(400 * scale)
+    qr, level, qr_report = _sticker_qr(url, qr_size, module_mm, dpi)
+    matrix = qr.get_matrix()
+    qr_box = (x + (sticker_size - qr_size) // 2, y + round(50 * scale), qr_size)
+    if is_styled(qr_style, qr_gradient):
+        paste_styled_qr(canvas, matrix, qr_box, 2, '#ff6b35', inks, qr_style, qr_gradient)
+    else:
+        qr_img = render_qr_mask(matrix, qr_size, light_index=0, dark_index=orange)
+        with qr_trace.span('composite', table=str(table)):
+            canvas.paste(qr_img, qr_box[:2])
+
+    _draw_sticker_label(canvas, inks, x, y, f"MASA {table}", 520, 'gray', sticker_size)
+    return matrix, qr_box, level, qr_report
+
+
+def _draw_sticker(canvas, inks, x, y, url, table, sticker_size=590, bleed=0, module_mm=None, dpi=300,
+                  qr_style='square', qr_gradient=None):
+    """
+    Tek bir masa etiketini (kenarlık, QR kod, yazılar) doğrudan palet
+    sayfasına çizer; etiket başına ayrı canvas açılmaz.
+    _draw_sticker_dynamic ile aynı değerleri döner.
+    """
+    _draw_sticker_static(canvas, inks, x, y, sticker_size, bleed)
+    return _draw_sticker_dynamic(canvas, inks, x, y, url, table, sticker_size, module_mm, dpi, qr_style, qr_gradient)
+
+
+@lru_cache(maxsize=4)
+@qr_trace.traced('template.stickers')
+def _sticker_sheet_template(version, page_size, positions, sticker_size=590, bleed=0):
+    """
+    Etiket sayfasının sabit katmanı: positions'taki her etiketin kenarlığı ve
+    başlığı bir kez çizilir. Sayfa başına bu şablonun kopyasına sadece QR'lar
+    ve masa numaraları eklenir. (canvas, inks) döner - canvas değiştirilmemeli.
+    """
+    canvas, inks = new_palette_canvas(page_size, 'white', ['#ff6b35', 'gray'])
+    for x, y in positions:
+        _draw_sticker_static(canvas, inks, x, y, sticker_size, bleed)
+    return canvas, inks
+
+
+def sticker_sheet_canvas(page_size, positions, sticker_size=590, bleed=0, rgb=False):
+    """
+    Sabit katmanı hazır etiket sayfası (önbellekteki şablonun kopyası) ve mürekkep indeksleri.
+    rgb=True: renk geçişli QR için RGB kopya (palet sayfanın 3 katı bellek).
+    """
+    template, inks = _sticker_sheet_template(TEMPLATE_VERSION, tuple(page_size), tuple(positions),
+                                             sticker_size, bleed)
+    with qr_trace.span('composite'):
+        return template.convert('RGB') if rgb else template.copy(), inks
 
-        # Yazı
-        try:
-            font = ImageFont.truetype("arial.ttf", 28)
-        except:
-            font = ImageFont.load_default()
 
-        text = "CAFE LIFE MENÜ"
-        text_bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_x = (sticker_size - text_width) // 2
-        draw.text((text_x, 480), text, fill='#ff6b35', font=font)
+@qr_trace.traced('stickers.sheet')
+def _render_sticker_sheet(stickers, filepath, profile=DEFAULT_ENCODING_PROFILE, module_mm=None,
+                          qr_style='square', qr_gradient=None):
+    """
+    En fazla 4 etiketi bir A4 sayfasına dizer, her QR'ı doğrular ve kaydeder.
+    stickers: [(masa, url), ...] - işlem havuzunda da çalışır.
+    Sayfa palet modunda çizilir (A4 RGB 26 MB yerine 8.7 MB).
+    (dosya yolu, doğrulama raporları) döner.
+    """
+    # A4 boyutu; kenarlık ve başlıklar şablondan gelir
+    sheet_width, sheet_height = 2480, 3508
+    positions = STICKER_POSITIONS[:len(stickers)]
+    canvas, inks = sticker_sheet_canvas((sheet_width, sheet_height), positions, rgb=qr_gradient is not None)
 
-        # Masa numarası
-        table_text = f"MASA {i + 1}"
-        table_bbox = draw.textbbox((0, 0), table_text, font=font)
-        table_width = table_bbox[2] - table_bbox[0]
-        table_x = (sticker_size - table_width) // 2
-        draw.text((table_x, 520), table_text, fill='gray', font=font)
+    placed = [(table, *_draw_sticker_dynamic(canvas, inks, x, y, url, table, module_mm=module_mm,
+                                             qr_style=qr_style, qr_gradient=qr_gradient))
+              for (table, url), (x, y) in zip(stickers, positions)]
 
-        # Ana canvas'a yapıştır
-        canvas.paste(sticker_canvas, (x, y))
+    # Okunabilirlik kontrolü - sayfa tamamen çizildikten sonra
+    label = os.path.basename(filepath)
+    reports = [check_scannability(canvas, matrix, qr_box, 2, level, f"{label} masa {table}", qr_report)
+               for table, matrix, qr_box, level, qr_report in placed]
 
     # Kaydet
-    sticker_filename = f"cafe_life_stickers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+    save_artifact(canvas, filepath, profile, dpi=(300, 300))
+    return filepath, reports
+
+
+def _sticker_sheet_worker(stickers, filepath, profile=DEFAULT_ENCODING_PROFILE, module_mm=None,
+                          qr_style='square', qr_gradient=None):
+    """
+    İşlem havuzunda tek etiket sayfası; ebeveynden kopyalanan ölçümler
+    silinir, bu sayfanın ölçümleri sonuçla geri gönderilir
+    """
+    qr_trace.reset()
+    filepath, reports = _render_sticker_sheet(stickers, filepath, profile, module_mm, qr_style, qr_gradient)
+    return filepath, reports, qr_trace.drain()
+
+
+def _add_sticker_vector_page(doc, stickers, module_mm=None):
+    """
+    En fazla 4 etiketi vektör belgeye bir A4 sayfası olarak ekler
+    """
+    if doc.pages[-1]:
+        doc.new_page()
+
+    for (table, url), (x, y) in zip(stickers, STICKER_POSITIONS):
+        _draw_vector_sticker(doc, x, y, url, table, module_mm=module_mm)
+
+
+def _draw_vector_sticker(doc, x, y, url, table, sticker_size=590, module_mm=None):
+    """Tek etiketin vektör sürümü (_draw_sticker yerleşimi, aynı ölçekleme)"""
+    scale = sticker_size / 590
+    qr_size = round(400 * scale)
+    font_size = round(28 * scale)
+    matrix = _sticker_qr(url, qr_size, module_mm)[0].get_matrix()
+    doc.border(x, y, sticker_size, sticker_size, '#ff6b35', max(1, round(5 * scale)))
+    doc.qr(matrix, x + (sticker_size - qr_size) // 2, y + round(50 * scale), qr_size, '#ff6b35')
+    draw_vector_label(doc, (x, y + round(480 * scale)), "CAFE LIFE MENÜ", font_size, '#ff6b35',
+                      center_width=sticker_size)
+    draw_vector_label(doc, (x, y + round(520 * scale)), f"MASA {table}", font_size, 'gray',
+                      center_width=sticker_size)
+
+
+def sticker_min_size(url):
+    """render_sticker'ın QR'ı kırpmadan çizebileceği en küçük etiket boyutu (QR alanı etiketin 400/590'ı)"""
+    return -(-qr_module_count(url, 'H', 2) * 590 // 400)
+
+
+def render_sticker(url, table, size=590, output_format='png'):
+    """
+    Tek bir masa etiketini bellekte çizer (dosyaya yazmaz): raster için
+    palet canvas, 'svg'/'pdf' için VectorDocument döner
+    """
+    if output_format in ('svg', 'pdf'):
+        doc = VectorDocument(size, size)
+        _draw_vector_sticker(doc, 0, 0, url, table, size)
+        return doc
+    canvas, inks = sticker_sheet_canvas((size, size), [(0, 0)], size)
+    _draw_sticker_dynamic(canvas, inks, 0, 0, url, table, size)
+    return canvas
+
+
+def sticker_sheet_filename(stickers, output_format='png', profile=DEFAULT_ENCODING_PROFILE, module_mm=None,
+                           qr_style='square', qr_gradient=None):
+    """
+    Etiketlerden (masa, URL) içerik anahtarlı dosya adı üretir
+    """
+    extension = output_extension(output_format, profile)
+    key = artifact_key('stickers', stickers=[(str(table), url) for table, url in stickers],
+                       positions=STICKER_POSITIONS, size=(2480, 3508), format=output_format,
+                       profile=profile if output_format == 'png' else None, module_mm=module_mm,
+                       **style_params(qr_style, qr_gradient, output_format))
+    return f"cafe_life_stickers_{key}.{extension}"
+
+
+@qr_trace.traced('stickers')
+def create_small_qr_stickers(url, output_dir="qr_codes", use_cache=True, output_format='png',
+                             profile=DEFAULT_ENCODING_PROFILE, module_mm=None, qr_style='square', qr_gradient=None):
+    """
+    Küçük QR kod etiketleri oluşturur (masalar için)
+    output_format: 'png', 'svg' veya 'pdf'; profile: raster kayıt profili;
+    module_mm: hedef modül boyutu (mm) - verilirse QR baskı boyutuna göre optimize edilir;
+    qr_style: modül stili (square, rounded, dots), qr_gradient: QR_GRADIENTS adı - sadece raster çıktıda
+    """
+    print("\nKÜÇÜK QR ETİKETLERİ OLUŞTURULUYOR...")
+
+    # A4'te 4 adet, hepsi aynı URL
+    stickers = [(i, url) for i in range(1, len(STICKER_POSITIONS) + 1)]
+
+    sticker_filename = sticker_sheet_filename(stickers, output_format, profile, module_mm, qr_style, qr_gradient)
     sticker_filepath = os.path.join(output_dir, sticker_filename)
-    canvas.save(sticker_filepath, 'PNG', quality=95, dpi=(300, 300))
+    _style_note(qr_style, qr_gradient, output_format)
+
+    if use_cache and os.path.exists(sticker_filepath):
+        print(f"Sticker sayfası: {sticker_filename} (önbellekten)")
+        return sticker_filepath
+
+    os.makedirs(output_dir, exist_ok=True)
+    if output_format == 'png':
+        VERIFY_REPORTS.extend(_render_sticker_sheet(stickers, sticker_filepath, profile, module_mm,
+                                                    qr_style, qr_gradient)[1])
+    else:
+        doc = VectorDocument(2480, 3508)
+        _add_sticker_vector_page(doc, stickers, module_mm)
+        save_artifact(doc, sticker_filepath)
 
     print(f"Sticker sayfası: {sticker_filename}")
     return sticker_filepath
 
 
-def main():
-    """Ana program"""
+def _batch_stickers(url, tables, manifest):
+    """
+    Toplu iş için (masa, URL) listesi - manifest veya masa aralığı + URL
+    """
+    if manifest:
+        stickers = load_table_manifest(manifest, base_url=url)
+    elif tables is not None and url:
+        stickers = [(table, table_url(url, table)) for table in tables]
+    else:
+        raise ValueError("Toplu etiket için masa aralığı ve URL ya da manifest gerekli")
+
+    if not stickers:
+        raise ValueError("Etiket listesi boş")
+    return stickers
+
+
+@qr_trace.traced('stickers.batch')
+def create_qr_sticker_batch(url=None, tables=None, manifest=None, output_dir="qr_codes", workers=None,
+                            use_cache=True, output_format='png', profile=DEFAULT_ENCODING_PROFILE,
+                            module_mm=None, qr_style='square', qr_gradient=None):
+    """
+    Her masa için ayrı URL'li QR etiketlerini toplu oluşturur.
+    tables: masa numaraları (örn. range(1, 41)), manifest: CSV/JSON masa listesi,
+    module_mm: hedef modül boyutu (mm) - verilirse QR'lar baskı boyutuna göre optimize edilir;
+    qr_style / qr_gradient: modül stili ve renk geçişi (sadece PNG sayfalarda).
+    PNG sayfalar işlem havuzunda paralel çizilir (workers=1 veya tek sayfada bu
+    süreçte), önbellekte olanlar atlanır;
+    'pdf' tüm sayfaları tek çok sayfalı dosyaya, 'svg' her sayfayı ayrı dosyaya yazar.
+    Dosya yolları listesi döner.
+    """
+    print("\nTOPLU QR ETİKETLERİ OLUŞTURULUYOR...")
+    output_extension(output_format, profile)
+    stickers = _batch_stickers(url, tables, manifest)
+    _style_note(qr_style, qr_gradient, output_format)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Etiketleri 4'erli sayfalara böl
+    per_sheet = len(STICKER_POSITIONS)
+    sheets = [stickers[start:start + per_sheet] for start in range(0, len(stickers), per_sheet)]
+
+    if output_format == 'pdf':
+        # Tüm sayfalar tek PDF'te; QR'lar vektör olduğundan havuz gerekmez
+        filepath = os.path.join(output_dir, sticker_sheet_filename(stickers, output_format, module_mm=module_mm))
+        if use_cache and os.path.exists(filepath):
+            print(f"Sticker PDF: {os.path.basename(filepath)} (önbellekten)")
+            return [filepath]
+
+        doc = VectorDocument(2480, 3508)
+        for sheet in sheets:
+            _add_sticker_vector_page(doc, sheet, module_mm)
+        save_artifact(doc, filepath)
+        print(f"Sticker PDF: {os.path.basename(filepath)} ({len(sheets)} sayfa)")
+        return [filepath]
+
+    sheet_files = []
+    jobs = []
+    for sheet in sheets:
+        filepath = os.path.join(output_dir, sticker_sheet_filename(sheet, output_format, profile, module_mm,
+                                                                   qr_style, qr_gradient))
+        sheet_files.append(filepath)
+        if not (use_cache and os.path.exists(filepath)):
+            jobs.append((sheet, filepath, profile, module_mm, qr_style, qr_gradient))
+
+    print(f"{len(stickers)} etiket, {len(sheet_files)} sayfa "
+          f"({len(sheet_files) - len(jobs)} sayfa önbellekten)")
+
+    if jobs and output_format == 'svg':
+        for sheet, filepath, *_ in jobs:
+            doc = VectorDocument(2480, 3508)
+            _add_sticker_vector_page(doc, sheet, module_mm)
+            save_artifact(doc, filepath)
+            print(f"Sticker sayfası: {os.path.basename(filepath)}")
+    elif jobs:
+        workers = min(len(jobs), workers or os.cpu_count() or 1)
+        if workers <= 1:
+            # Tek işçi veya tek sayfa: süreç açmadan burada çizilir (varsa arka plan yazıcısıyla)
+            for sheet, filepath, *options in jobs:
+                VERIFY_REPORTS.extend(_render_sticker_sheet(sheet, filepath, *options)[1])
+                print(f"Sticker sayfası: {os.path.basename(filepath)}")
+        else:
+            with ProcessPoolExecutor(max_workers=workers, **qr_trace.pool_options()) as pool:
+                for sheet_file, reports, events in pool.map(_sticker_sheet_worker, *zip(*jobs)):
+                    VERIFY_REPORTS.extend(reports)
+                    qr_trace.extend(events)
+                    print(f"Sticker sayfası: {os.path.basename(sheet_file)}")
+
+    return sheet_files
+
+
+def _imposed_pages(stickers, layout, label, reports, render_times, module_mm=None, qr_style='square',
+                   qr_gradient=None):
+    """
+    Yerleşime göre sayfaları sırayla çizen üreteç; her seferinde tek bir
+    palet sayfası bellekte tutulur. Kenarlık ve başlıklar önbellekteki sayfa
+    şablonundan kopyalanır. Doğrulama raporları reports'a, sayfa başına
+    çizim ve doğrulama süresi render_times'a eklenir.
+    """
+    per_page = layout['per_page']
+    for start in range(0, len(stickers), per_page):
+        page_start = time.perf_counter()
+        page_stickers = stickers[start:start + per_page]
+        positions = layout['positions'][:len(page_stickers)]
+        canvas, inks = sticker_sheet_canvas(layout['page_size'], positions, layout['sticker_px'],
+                                            layout['bleed_px'], rgb=qr_gradient is not None)
+        page = start // per_page + 1
+        with qr_trace.span('stickers.page', page=page):
+            for (table, url), (x, y) in zip(page_stickers, positions):
+                matrix, qr_box, level, qr_report = _draw_sticker_dynamic(canvas, inks, x, y, url, table,
+                                                                         layout['sticker_px'], module_mm,
+                                                                         layout['dpi'], qr_style, qr_gradient)
+                reports.append(check_scannability(canvas, matrix, qr_box, 2, level,
+                                                  f"{label} sayfa {page} masa {table}", qr_report))
+        render_times.append(time.perf_counter() - page_start)
+        yield canvas
+
+
+def imposed_stickers(url, tables, manifest, layout):
+    """Yerleşimli iş için (masa, URL) listesi; masa/manifest yoksa aynı URL ile tek dolu sayfa"""
+    if tables is None and not manifest:
+        return [(i, url) for i in range(1, layout['per_page'] + 1)]
+    return _batch_stickers(url, tables, manifest)
+
+
+def imposed_filename(stickers, layout, sheet_format='pdf', module_mm=None, qr_style='square', qr_gradient=None):
+    """
+    Yerleşimli etiket dosyasının içerik anahtarlı adı
+    """
+    key = artifact_key('imposed', stickers=[(str(table), url) for table, url in stickers],
+                       page_size=layout['page_size'], positions=layout['positions'],
+                       sticker=layout['sticker_px'], bleed=layout['bleed_px'], dpi=layout['dpi'],
+                       format=sheet_format, module_mm=module_mm, **style_params(qr_style, qr_gradient))
+    return f"cafe_life_stickers_{layout['columns']}x{layout['rows']}_{key}.{sheet_format}"
+
+
+@qr_trace.traced('stickers.imposed')
+def create_imposed_stickers(url=None, tables=None, manifest=None, output_dir="qr_codes", use_cache=True,
+                            paper='A4', sticker_mm=50, bleed_mm=0, margin_mm=10, gap_mm=0, dpi=300,
+                            sheet_format='pdf', module_mm=None, qr_style='square', qr_gradient=None):
+    """
+    Etiketleri kağıt/etiket boyutu, taşma payı, kenar boşluğu ve DPI'ya göre
+    hesaplanan ızgaraya dizer ve tek çok sayfalı PDF veya TIFF dosyasına yazar.
+    Sayfalar tek tek çizilip diske yazıldığından bellek masa sayısından bağımsızdır.
+    tables/manifest verilmezse aynı URL ile tek dolu sayfa üretilir;
+    module_mm verilirse QR'lar gerçek baskı boyutuna göre optimize edilir;
+    qr_style / qr_gradient: modül stili ve renk geçişi (geçişte sayfalar RGB çizilir).
+    """
+    print("\nYERLEŞİMLİ ETİKET SAYFALARI OLUŞTURULUYOR...")
+    if sheet_format not in SHEET_FORMATS:
+        raise ValueError(f"Desteklenmeyen sayfa formatı: {sheet_format} ({', '.join(SHEET_FORMATS)})")
+
+    layout = compute_sheet_layout(paper, sticker_mm, bleed_mm, margin_mm, gap_mm, dpi)
+    stickers = imposed_stickers(url, tables, manifest, layout)
+
+    filename = imposed_filename(stickers, layout, sheet_format, module_mm, qr_style, qr_gradient)
+    filepath = os.path.join(output_dir, filename)
+
+    pages = -(-len(stickers) // layout['per_page'])
+    print(f"{len(stickers)} etiket, sayfa başına {layout['columns']}x{layout['rows']} "
+          f"({layout['orientation']}), {pages} sayfa")
+
+    if use_cache and os.path.exists(filepath):
+        print(f"Etiket dosyası: {filename} (önbellekten)")
+        return filepath
+
+    os.makedirs(output_dir, exist_ok=True)
+    reports = []
+    render_times = []
+    start = time.perf_counter()
+    write_pages(_imposed_pages(stickers, layout, filename, reports, render_times, module_mm, qr_style,
+                               qr_gradient),
+                filepath, sheet_format, dpi)
+    elapsed = time.perf_counter() - start
+    VERIFY_REPORTS.extend(reports)
+
+    # Sayfalar yazılırken çizildiğinden kodlama süresi toplamdan çizim süresi çıkarılarak bulunur
+    render_seconds = sum(render_times)
+    encode_seconds = elapsed - render_seconds
+    size = os.path.getsize(filepath)
+    ENCODE_STATS.append({'path': filepath, 'profile': sheet_format, 'seconds': encode_seconds,
+                         'render_seconds': render_seconds, 'bytes': size})
+    print(f"Etiket dosyası: {filename} ({pages} sayfa, çizim {render_seconds:.1f} sn, "
+          f"kodlama {encode_seconds:.1f} sn, {size / 1024:.1f} KB)")
+    return filepath
+
+
+# Manifestte seçilebilecek çıktı türleri
+LAYOUTS = ('card', 'tent', 'stickers')
+
+
+def _pack_job(kind, url, options):
+    """Baskı paketindeki tek bir işi arka plan yazıcısıyla çalıştırır; dosya listesi döner"""
+    with background_writer():
+        if kind == 'card':
+            return create_cafe_qr_code(url, **options)
+        if kind == 'tent':
+            return [create_table_tent_qr(url, **options)]
+        if kind == 'stickers':
+            return [create_small_qr_stickers(url, **options)]
+        if kind == 'batch':
+            return create_qr_sticker_batch(url, **options)
+        return [create_imposed_stickers(url, **options)]
+
+
+def pack_job_files(kind, url, options):
+    """
+    İşin üreteceği dosya yolları (önbellek kontrolü için, çizim yapılmaz);
+    ayarlar hatalıysa None - hata iş çalışınca raporlanır
+    """
+    output_dir = options.get('output_dir', 'qr_codes')
+    output_format = options.get('output_format', 'png')
+    profile = options.get('profile', DEFAULT_ENCODING_PROFILE)
+    module_mm = options.get('module_mm')
+    style = (options.get('qr_style', 'square'), options.get('qr_gradient'))
+    try:
+        if kind == 'card':
+            logo_path = find_logo_path() if options.get('center_logo') else None
+            names = [card_filename(url, CAFE_THEMES[theme], output_format, profile, logo_path, module_mm, *style)
+                     for theme in options.get('themes') or CAFE_THEMES]
+        elif kind == 'tent':
+            names = [tent_filename(url, output_format, profile, options.get('center_logo', False), module_mm, *style)]
+        elif kind == 'stickers':
+            stickers = [(i, url) for i in range(1, len(STICKER_POSITIONS) + 1)]
+            names = [sticker_sheet_filename(stickers, output_format, profile, module_mm, *style)]
+        elif kind == 'batch':
+            stickers = _batch_stickers(url, options.get('tables'), options.get('manifest'))
+            if output_format == 'pdf':
+                names = [sticker_sheet_filename(stickers, output_format, module_mm=module_mm)]
+            else:
+                per_sheet = len(STICKER_POSITIONS)
+                names = [sticker_sheet_filename(stickers[start:start + per_sheet], output_format, profile,
+                                                module_mm, *style)
+                         for start in range(0, len(stickers), per_sheet)]
+        else:
+            layout = compute_sheet_layout(options.get('paper', 'A4'), options.get('sticker_mm', 50),
+                                          options.get('bleed_mm', 0), options.get('margin_mm', 10),
+                                          options.get('gap_mm', 0), options.get('dpi', 300))
+            stickers = imposed_stickers(url, options.get('tables'), options.get('manifest'), layout)
+            names = [imposed_filename(stickers, layout, options.get('sheet_format', 'pdf'), module_mm, *style)]
+    except (KeyError, ValueError, OSError):
+        return None
+    return [os.path.join(output_dir, name) for name in names]
+
+
+def _pack_job_cached(kind, url, options):
+    """İşin tüm çıktıları önbellekte mi (bu durumda süreç açmaya gerek yok)"""
+    if not options.get('use_cache', True):
+        return False
+    paths = pack_job_files(kind, url, options)
+    return paths is not None and all(os.path.exists(path) for path in paths)
+
+
+def _pack_worker(kind, url, options):
+    """
+    İşlem havuzunda çalışan iş; süreç ebeveynden kopyalanmış olabileceğinden
+    raporlar temizlenip bu işe ait olanlar geri gönderilir. Toplu etiketler
+    havuz içinde yeni havuz açmaz (iç içe süreç ve fazla iş yükü olmasın).
+    """
+    VERIFY_REPORTS.clear()
+    ENCODE_STATS.clear()
+    qr_trace.reset()
+    if kind == 'batch':
+        options = dict(options, workers=1)
+    paths = _pack_job(kind, url, options)
+    return paths, list(VERIFY_REPORTS), list(ENCODE_STATS), qr_trace.drain()
+
+
+def render_print_pack(jobs, workers=None):
+    """
+    Bağımsız işleri [(çıktı türü, iş, url, ayarlar), ...] işlem havuzunda
+    paralel çalıştırır; her işte kayıtlar arka plan yazıcısına gider.
+    Çıktıları önbellekte olan işler bu süreçte çalışır (sadece dosya kontrolü);
+    workers=1, tek çekirdek veya çizilecek tek iş varsa havuz açılmaz.
+    Sırası korunmuş [(çıktı türü, dosya yolu), ...] döner.
+    """
+    pending = [index for index, (_, kind, url, options) in enumerate(jobs)
+               if not _pack_job_cached(kind, url, options)]
+    workers = min(len(pending), workers or os.cpu_count() or 1)
+    artifacts = []
+
+    if workers <= 1:
+        for layout, kind, url, options in jobs:
+            artifacts.extend((layout, path) for path in _pack_job(kind, url, options))
+        return artifacts
+
+    # Süreçler (fork) bu süreçte yazıcı iş parçacığı açılmadan önce başlatılır
+    with ProcessPoolExecutor(max_workers=workers, **qr_trace.pool_options()) as pool:
+        futures = {index: pool.submit(_pack_worker, *jobs[index][1:]) for index in pending}
+        for index, (layout, kind, url, options) in enumerate(jobs):
+            if index not in futures:
+                artifacts.extend((layout, path) for path in _pack_job(kind, url, options))
+                continue
+            paths, reports, stats, events = futures[index].result()
+            VERIFY_REPORTS.extend(reports)
+            ENCODE_STATS.extend(stats)
+            qr_trace.extend(events)
+            artifacts.extend((layout, path) for path in paths)
+    return artifacts
+
+
+def print_pack_jobs(url, layouts=LAYOUTS, themes=None, tables=None, imposition=None,
+                    center_logo=False, workers=None, **options):
+    """
+    Bir mekanın baskı paketini bağımsız işlere böler: tüm temaları tek QR
+    matrisinden çizen kart işi, çadır kartı ve etiketler (tek sayfa, masa
+    başına toplu veya yerleşimli)
+    """
+    jobs = []
+    if 'card' in layouts:
+        jobs.append(('card', 'card', url, dict(options, themes=themes, center_logo=center_logo)))
+    if 'tent' in layouts:
+        jobs.append(('tent', 'tent', url, dict(options, center_logo=center_logo)))
+    if 'stickers' in layouts:
+        if imposition:
+            jobs.append(('stickers', 'imposed', url, dict(imposition, tables=tables, output_dir=options['output_dir'],
+                                                          use_cache=options['use_cache'],
+                                                          module_mm=options.get('module_mm'),
+                                                          qr_style=options.get('qr_style', 'square'),
+                                                          qr_gradient=options.get('qr_gradient'))))
+        elif tables:
+            jobs.append(('stickers', 'batch', url, dict(options, tables=tables, workers=workers)))
+        else:
+            jobs.append(('stickers', 'stickers', url, options))
+    return jobs
+
+
+def normalize_url(url):
+    """
+    Şema verilmemişse https:// ekler
+    """
+    url = url.strip()
+    if url and not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    return url
+
+
+def parse_table_range(spec):
+    """
+    '1-40,45,50-52' biçimindeki masa aralığını listeye çevirir.
+    Liste verilirse olduğu gibi döner.
+    """
+    if isinstance(spec, (list, tuple, range)):
+        return list(spec)
+
+    tables = []
+    for part in str(spec).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+            tables.extend(range(start, end + 1))
+        else:
+            tables.append(int(part))
+    return tables
+
+
+def _split_list(value):
+    if value is None or isinstance(value, list):
+        return value
+    return [item.strip() for item in str(value).split(',') if item.strip()] or None
+
+
+def imposition_options(source):
+    """
+    Manifest satırı veya komut satırından yerleşim ayarları; 'paper' yoksa
+    None (etiketler sabit 4'lü A4 sayfalarına dizilir)
+    """
+    if not source.get('paper'):
+        return None
+    defaults = {'sticker_mm': 50, 'bleed_mm': 0, 'margin_mm': 10, 'gap_mm': 0}
+    options = {'paper': source['paper'], 'dpi': int(source.get('dpi') or 300),
+               'sheet_format': source.get('sheet_format') or 'pdf'}
+    for name, default in defaults.items():
+        value = source.get(name)
+        options[name] = float(value) if value not in (None, '') else default
+    return options
+
+
+def load_job_manifest(manifest_path):
+    """
+    Mekan listesini JSON veya CSV manifestten okur. Her iş:
+    venue, url, tables ('1-40' veya liste), themes, layouts, format, profile, center_logo, module_mm,
+    qr_style, qr_gradient;
+    yerleşimli baskı için paper, sticker_mm, bleed_mm, margin_mm, gap_mm, dpi, sheet_format.
+    JSON: [{...}, ...] ya da {"venues": [{...}]}; CSV: aynı adlı sütunlar,
+    listeler virgülle ayrılır (CSV'de tırnak içinde).
+    """
+    if manifest_path.lower().endswith('.json'):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+        if isinstance(rows, dict):
+            rows = rows.get('venues', [])
+    else:
+        with open(manifest_path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+    jobs = []
+    for index, row in enumerate(rows, 1):
+        url = normalize_url(row.get('url') or '')
+        if not url:
+            raise ValueError(f"Manifest satırı {index}: URL eksik")
+
+        layouts = _split_list(row.get('layouts')) or list(LAYOUTS)
+        unknown = [layout for layout in layouts if layout not in LAYOUTS]
+        if unknown:
+            raise ValueError(f"Manifest satırı {index}: bilinmeyen çıktı türü {', '.join(unknown)}")
+
+        qr_style, qr_gradient = row.get('qr_style') or 'square', row.get('qr_gradient') or None
+        try:
+            is_styled(qr_style, qr_gradient)
+        except ValueError as e:
+            raise ValueError(f"Manifest satırı {index}: {e}")
+
+        jobs.append({
+            'venue': row.get('venue') or f"mekan_{index}",
+            'url': url,
+            'tables': parse_table_range(row['tables']) if row.get('tables') else None,
+            'themes': _split_list(row.get('themes')),
+            'layouts': layouts,
+            'format': row.get('format') or 'png',
+            'profile': row.get('profile') or DEFAULT_ENCODING_PROFILE,
+            'imposition': imposition_options(row),
+            'center_logo': str(row.get('center_logo') or '').lower() in ('1', 'true', 'yes', 'evet'),
+            'module_mm': float(row['module_mm']) if row.get('module_mm') else None,
+            'qr_style': qr_style,
+            'qr_gradient': qr_gradient,
+        })
+
+    return jobs
+
+
+def venue_pack_jobs(job, output_dir="qr_codes", workers=None, use_cache=True):
+    """
+    Manifest işinin baskı paketi işleri (print_pack_jobs); çıktılar output_dir/venue altına
+    """
+    venue_dir = os.path.join(output_dir, job['venue'])
+    options = {'output_dir': venue_dir, 'use_cache': use_cache,
+               'output_format': job['format'], 'profile': job['profile'], 'module_mm': job.get('module_mm'),
+               'qr_style': job.get('qr_style', 'square'), 'qr_gradient': job.get('qr_gradient')}
+    return print_pack_jobs(job['url'], job['layouts'], themes=job['themes'], tables=job['tables'],
+                           imposition=job.get('imposition'), center_logo=job.get('center_logo', False),
+                           workers=workers, **options)
+
+
+def run_job(job, output_dir="qr_codes", workers=None, use_cache=True):
+    """
+    Tek bir mekan işini çalıştırır; çıktılar output_dir/venue altına yazılır.
+    Dosya listesi, süre ve önbellek isabetleri içeren özet döner.
+    """
+    os.makedirs(os.path.join(output_dir, job['venue']), exist_ok=True)
+
+    start = time.time()
+    # Kartlar, çadır ve etiketler birbirinden bağımsız - paralel çalışır
+    jobs = venue_pack_jobs(job, output_dir, workers, use_cache)
+    artifacts = render_print_pack(jobs, workers)
+
+    # Bu çalıştırmadan önce var olan dosyalar önbellek isabetidir
+    artifact_list = [{
+        'layout': layout,
+        'path': path,
+        'bytes': os.path.getsize(path),
+        'cached': os.path.getmtime(path) < start,
+    } for layout, path in artifacts]
+
+    return {
+        'venue': job['venue'],
+        'url': job['url'],
+        'seconds': round(time.time() - start, 3),
+        'artifacts': artifact_list,
+        'cache_hits': sum(item['cached'] for item in artifact_list),
+        'rendered': sum(not item['cached'] for item in artifact_list),
+    }
+
+
+def run_manifest(jobs, output_dir="qr_codes", summary_path=None, workers=None, use_cache=True):
+    """
+    Tüm manifest işlerini sırayla (her mekanın çıktıları paralel) çalıştırır
+    ve makine tarafından okunabilir JSON özet yazar
+    """
+    start = time.time()
+    results = []
+    failed = 0
+    for job in jobs:
+        print(f"\n### {job['venue']} - {job['url']}")
+        try:
+            results.append(run_job(job, output_dir, workers=workers, use_cache=use_cache))
+        except Exception as e:
+            failed += 1
+            print(f"Hata oluştu ({job['venue']}): {e}")
+            results.append({'venue': job['venue'], 'url': job['url'], 'error': str(e)})
+
+    summary = {
+        'renderer_version': RENDERER_VERSION,
+        'seconds': round(time.time() - start, 3),
+        'venues': results,
+        'cache_hits': sum(result.get('cache_hits', 0) for result in results),
+        'rendered': sum(result.get('rendered', 0) for result in results),
+        'failed': failed,
+        'encode_stats': ENCODE_STATS,
+        'verification': VERIFY_REPORTS,
+        'unscannable': [report['artifact'] for report in VERIFY_REPORTS if not report['ok']],
+    }
+    if qr_trace.is_enabled():
+        summary['stages'] = qr_trace.summarize()
+
+    summary_path = summary_path or os.path.join(output_dir, 'qr_summary.json')
+    os.makedirs(os.path.dirname(summary_path) or '.', exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{summary['rendered']} dosya oluşturuldu, {summary['cache_hits']} önbellekten, "
+          f"{failed} hata ({summary['seconds']} sn)")
+    if summary['unscannable']:
+        print(f"OKUNABİLİRLİK HATASI: {len(summary['unscannable'])} QR basılmadan önce kontrol edilmeli")
+    print(f"Özet: {summary_path}")
+    if 'stages' in summary:
+        print("\nAşama süreleri:")
+        for line in qr_trace.format_summary(summary['stages']):
+            print(f"   {line}")
+    return summary
+
+
+def build_arg_parser():
+    """
+    Komut satırı argümanları (argüman verilmezse etkileşimli mod çalışır)
+    """
+    parser = argparse.ArgumentParser(
+        description="Cafe Life QR kod oluşturucu - toplu / zamanlanmış çalıştırma")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--manifest', help="Mekan listesi (JSON veya CSV)")
+    source.add_argument('--url', help="Tek mekan için menü URL'si")
+    parser.add_argument('--venue', default='cafe_life', help="--url ile mekan adı (çıktı alt klasörü)")
+    parser.add_argument('--tables', help="Masa aralığı, örn. 1-40,45 (masa başına ayrı etiket)")
+    parser.add_argument('--themes', help=f"Virgülle ayrılmış temalar ({', '.join(CAFE_THEMES)})")
+    parser.add_argument('--layouts', default=','.join(LAYOUTS), help="Virgülle ayrılmış: card,tent,stickers")
+    parser.add_argument('--format', default='png', choices=OUTPUT_FORMATS, help="Çıktı formatı")
+    parser.add_argument('--profile', default=DEFAULT_ENCODING_PROFILE, choices=list(ENCODING_PROFILES),
+                        help="Raster kayıt profili")
+    parser.add_argument('--output-dir', default='qr_codes', help="Çıktı klasörü")
+    parser.add_argument('--summary', help="JSON özet dosyası (varsayılan: <output-dir>/qr_summary.json)")
+    parser.add_argument('--workers', type=int, help="Etiket sayfaları için işlem sayısı")
+    parser.add_argument('--no-cache', action='store_true', help="Önbelleği yok say, hepsini yeniden oluştur")
+    parser.add_argument('--center-logo', action='store_true',
+                        help="Logoyu kart ve çadır QR'ının ortasına göm (hata düzeltme H)")
+    parser.add_argument('--module-mm', type=float,
+                        help="Hedef modül boyutu (mm, örn. 0.5): QR sürümü, kodlama, maske ve hata "
+                             "düzeltme baskı boyutuna göre seçilir")
+    parser.add_argument('--qr-style', default='square', choices=MODULE_STYLES,
+                        help="QR modül stili: square, rounded (yuvarlak köşe), dots (nokta) - raster çıktıda")
+    parser.add_argument('--qr-gradient', choices=list(QR_GRADIENTS),
+                        help="QR modüllerine renk geçişi uygula (örn. orange) - raster çıktıda")
+    parser.add_argument('--trace', help=f"Aşama süre/bellek ölçümlerini bu dosyaya yaz (veya {qr_trace.TRACE_ENV})")
+    parser.add_argument('--trace-format', default='json', choices=qr_trace.TRACE_FORMATS,
+                        help="İz formatı: json (aşama özeti) veya chrome (chrome://tracing, Perfetto)")
+    parser.add_argument('--trace-no-memory', action='store_true',
+                        help="İzde bellek ölçme (tracemalloc süreleri birkaç kat uzatır)")
+
+    imposition = parser.add_argument_group("yerleşimli baskı (--paper verilirse etiketler için)")
+    imposition.add_argument('--paper', help="Kağıt boyutu: A3, A4, A5, letter veya 210x297 (mm)")
+    imposition.add_argument('--sticker-mm', type=float, help="Etiket kenarı (mm, varsayılan 50)")
+    imposition.add_argument('--bleed-mm', type=float, help="Taşma payı (mm, varsayılan 0)")
+    imposition.add_argument('--margin-mm', type=float, help="Sayfa kenar boşluğu (mm, varsayılan 10)")
+    imposition.add_argument('--gap-mm', type=float, help="Etiketler arası boşluk (mm, varsayılan 0)")
+    imposition.add_argument('--dpi', type=int, help="Çözünürlük (varsayılan 300)")
+    imposition.add_argument('--sheet-format', choices=SHEET_FORMATS, help="Çok sayfalı dosya formatı (varsayılan pdf)")
+    return parser
+
+
+def main(argv=None):
+    """Ana program - argümanla toplu mod, argümansız etkileşimli mod"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return interactive_main()
+
+    args = build_arg_parser().parse_args(argv)
+    if args.trace:
+        # --trace, CAFE_QR_TRACE'in yerine geçer; iz yalnızca sonda bir kez yazılır
+        qr_trace.write_on_exit(None)
+        qr_trace.enable(memory=not args.trace_no_memory)
+
+    try:
+        if args.manifest:
+            jobs = load_job_manifest(args.manifest)
+        elif args.url:
+            layouts = _split_list(args.layouts) or list(LAYOUTS)
+            unknown = [layout for layout in layouts if layout not in LAYOUTS]
+            if unknown:
+                raise ValueError(f"Bilinmeyen çıktı türü: {', '.join(unknown)}")
+            jobs = [{
+                'venue': args.venue,
+                'url': normalize_url(args.url),
+                'tables': parse_table_range(args.tables) if args.tables else None,
+                'themes': _split_list(args.themes),
+                'layouts': layouts,
+                'format': args.format,
+                'profile': args.profile,
+                'imposition': imposition_options(vars(args)),
+                'center_logo': args.center_logo,
+                'module_mm': args.module_mm,
+                'qr_style': args.qr_style,
+                'qr_gradient': args.qr_gradient,
+            }]
+        else:
+            print("--manifest veya --url gerekli (etkileşimli mod için argümansız çalıştırın)")
+            return 2
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Girdi hatası: {e}")
+        return 2
+
+    summary = run_manifest(jobs, args.output_dir, args.summary, workers=args.workers,
+                           use_cache=not args.no_cache)
+    if args.trace:
+        print(f"Ölçüm izi: {qr_trace.write_trace(args.trace, args.trace_format)}")
+    return 1 if summary['failed'] or summary['unscannable'] else 0
+
+
+def interactive_main():
+    """Etkileşimli mod - URL klavyeden sorulur"""
     print("=" * 60)
     print("CAFE LIFE QR KOD OLUŞTURUCU v1.0")
     print("=" * 60)
@@ -331,20 +1964,16 @@ def main():
         print("URL boş olamaz!")
         return
 
-    if not menu_url.startswith(('http://', 'https://')):
-        menu_url = 'https://' + menu_url
+    menu_url = normalize_url(menu_url)
 
     print(f"Hedef URL: {menu_url}")
 
     try:
-        # QR kodları oluştur
-        qr_files = create_cafe_qr_code(menu_url)
-
-        # Masa çadır kartı oluştur
-        tent_file = create_table_tent_qr(menu_url)
-
-        # Küçük sticker'lar oluştur
-        sticker_file = create_small_qr_stickers(menu_url)
+        # QR kodları, masa çadır kartı ve küçük sticker'lar paralel oluşturulur
+        artifacts = render_print_pack(print_pack_jobs(menu_url, output_dir="qr_codes", use_cache=True))
+        qr_files = [path for layout, path in artifacts if layout == 'card']
+        tent_file = next(path for layout, path in artifacts if layout == 'tent')
+        sticker_file = next(path for layout, path in artifacts if layout == 'stickers')
 
         print("\n" + "=" * 60)
         print("BAŞARIYLA TAMAMLANDI!")
@@ -381,4 +2010,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,185 @@
+# Cafe Life Baskı Yerleşimi
+# Kağıt / etiket boyutu, taşma payı, kenar boşluğu ve DPI'dan sayfa ızgarasını hesaplar,
+# sayfaları tek tek çok sayfalı PDF veya TIFF dosyasına yazar (bellekte hep tek sayfa)
+
+import os
+import zlib
+
+from PIL import TiffImagePlugin
+
+# Kağıt boyutları (mm, dikey)
+PAPER_SIZES = {
+    'A3': (297, 420),
+    'A4': (210, 297),
+    'A5': (148, 210),
+    'letter': (215.9, 279.4),
+}
+
+# Yerleşimli baskı çıktı formatları
+SHEET_FORMATS = ('pdf', 'tiff')
+
+
+def mm_to_px(mm, dpi):
+    """Milimetreyi verilen DPI'da piksele çevirir"""
+    return round(mm * dpi / 25.4)
+
+
+def parse_paper_size(paper):
+    """
+    'A4', 'letter' veya '210x297' (mm) biçimindeki kağıt boyutunu (genişlik, yükseklik) mm olarak döndürür
+    """
+    if isinstance(paper, (tuple, list)):
+        return tuple(float(value) for value in paper)
+    if paper in PAPER_SIZES:
+        return PAPER_SIZES[paper]
+    try:
+        width, height = (float(value) for value in str(paper).lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Bilinmeyen kağıt boyutu: {paper} ({', '.join(PAPER_SIZES)} veya 210x297)")
+    return width, height
+
+
+def _grid(page_px, cell_px, gap_px, margin_px):
+    """Bir eksene sığan hücre sayısı"""
+    usable = page_px - 2 * margin_px
+    return max(0, (usable + gap_px) // (cell_px + gap_px))
+
+
+def compute_sheet_layout(paper='A4', sticker_mm=50, bleed_mm=0, margin_mm=10, gap_mm=0, dpi=300):
+    """
+    Sayfaya en çok etiket sığdıran ızgarayı hesaplar (dikey ve yatay sayfa denenir).
+    Etiket kesim alanı sticker_mm, her yanda bleed_mm taşma payı vardır; ızgara
+    kenar boşlukları içinde ortalanır. positions: kesim alanlarının sol üst köşeleri (piksel).
+    """
+    paper_mm = parse_paper_size(paper)
+    if sticker_mm <= 0 or bleed_mm < 0 or margin_mm < 0 or gap_mm < 0 or dpi <= 0:
+        raise ValueError("Etiket boyutu ve DPI pozitif, taşma payı / boşluklar negatif olmamalı")
+
+    sticker_px = mm_to_px(sticker_mm, dpi)
+    bleed_px = mm_to_px(bleed_mm, dpi)
+    margin_px = mm_to_px(margin_mm, dpi)
+    gap_px = mm_to_px(gap_mm, dpi)
+    cell_px = sticker_px + 2 * bleed_px
+
+    best = None
+    for orientation, (width_mm, height_mm) in (('portrait', paper_mm), ('landscape', paper_mm[::-1])):
+        page_size = (mm_to_px(width_mm, dpi), mm_to_px(height_mm, dpi))
+        columns = _grid(page_size[0], cell_px, gap_px, margin_px)
+        rows = _grid(page_size[1], cell_px, gap_px, margin_px)
+        # Eşitlikte dikey sayfa tercih edilir
+        if best is None or columns * rows > best['columns'] * best['rows']:
+            best = {'orientation': orientation, 'page_size': page_size, 'columns': columns, 'rows': rows}
+
+    if not best['columns'] * best['rows']:
+        raise ValueError(f"{sticker_mm} mm etiket (taşma payı ve kenar boşluğuyla) {paper} sayfaya sığmıyor")
+
+    # Izgarayı sayfada ortala
+    page_width, page_height = best['page_size']
+    grid_width = best['columns'] * (cell_px + gap_px) - gap_px
+    grid_height = best['rows'] * (cell_px + gap_px) - gap_px
+    left = (page_width - grid_width) // 2 + bleed_px
+    top = (page_height - grid_height) // 2 + bleed_px
+
+    best.update({
+        'paper': paper,
+        'dpi': dpi,
+        'sticker_px': sticker_px,
+        'bleed_px': bleed_px,
+        'per_page': best['columns'] * best['rows'],
+        'positions': [(left + column * (cell_px + gap_px), top + row * (cell_px + gap_px))
+                      for row in range(best['rows']) for column in range(best['columns'])],
+    })
+    return best
+
+
+def _pdf_image_header(page):
+    """Sayfa görüntüsünün PDF renk uzayı (P: palet indeksli, kayıpsız)"""
+    if page.mode == 'P':
+        palette = page.getpalette()
+        return f"[/Indexed /DeviceRGB {len(palette) // 3 - 1} <{bytes(palette).hex()}>]"
+    if page.mode == 'L':
+        return "/DeviceGray"
+    return "/DeviceRGB"
+
+
+def _write_pdf(pages, f, dpi):
+    """
+    Sayfaları akış halinde PDF'e yazar: her sayfa Flate sıkıştırılmış tek bir
+    görüntü nesnesi olur ve hemen diske gider; bellekte yalnızca nesne
+    konumları tutulur. Pages ve Catalog nesneleri en sonda yazılır.
+    """
+    offsets = {}
+
+    def write_object(number, header, stream=None):
+        offsets[number] = f.tell()
+        f.write(f"{number} 0 obj\n".encode())
+        if stream is None:
+            f.write(header.encode() + b"\nendobj\n")
+        else:
+            f.write(f"{header[:-2]} /Length {len(stream)} >>\nstream\n".encode())
+            f.write(stream + b"\nendstream\nendobj\n")
+
+    f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    kids = []
+    number = 3  # 1: Catalog, 2: Pages
+    for page in pages:
+        if page.mode not in ('P', 'L', 'RGB'):
+            page = page.convert('RGB')
+        width_pt, height_pt = page.width * 72 / dpi, page.height * 72 / dpi
+        image, content, page_number = number, number + 1, number + 2
+        number += 3
+
+        write_object(image, f"<< /Type /XObject /Subtype /Image /Width {page.width} /Height {page.height} "
+                            f"/ColorSpace {_pdf_image_header(page)} /BitsPerComponent 8 /Filter /FlateDecode >>",
+                     zlib.compress(page.tobytes(), 6))
+        write_object(content, "<< >>",
+                     f"q {width_pt:.2f} 0 0 {height_pt:.2f} 0 0 cm /Im0 Do Q".encode())
+        write_object(page_number, f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt:.2f} {height_pt:.2f}] "
+                                  f"/Resources << /XObject << /Im0 {image} 0 R >> >> /Contents {content} 0 R >>")
+        kids.append(page_number)
+
+    if not kids:
+        return 0
+
+    write_object(2, f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] /Count {len(kids)} >>")
+    write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+
+    xref = f.tell()
+    f.write(f"xref\n0 {number}\n0000000000 65535 f \n".encode())
+    for object_number in range(1, number):
+        f.write(f"{offsets[object_number]:010d} 00000 n \n".encode())
+    f.write(f"trailer\n<< /Size {number} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return len(kids)
+
+
+def write_pages(pages, filepath, output_format, dpi):
+    """
+    pages üretecindeki sayfaları sırayla tek dosyaya yazar; her sayfa yazıldıktan
+    sonra bırakılır. PDF sayfaları kayıpsız Flate görüntü olarak akış halinde,
+    TIFF sayfaları AppendingTiffWriter ile eklenir. Önce geçici dosyaya yazılır.
+    Sayfa sayısı döner.
+    """
+    if output_format not in SHEET_FORMATS:
+        raise ValueError(f"Desteklenmeyen sayfa formatı: {output_format} ({', '.join(SHEET_FORMATS)})")
+
+    temp_path = f"{filepath}.tmp"
+    count = 0
+    try:
+        if output_format == 'pdf':
+            with open(temp_path, 'wb') as f:
+                count = _write_pdf(pages, f, dpi)
+        else:
+            with TiffImagePlugin.AppendingTiffWriter(temp_path, new=True) as tiff:
+                for page in pages:
+                    page.save(tiff, 'TIFF', dpi=(dpi, dpi), compression='tiff_adobe_deflate')
+                    tiff.newFrame()
+                    count += 1
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if not count:
+        raise ValueError("Yazılacak sayfa yok")
+    os.replace(temp_path, filepath)
+    return count
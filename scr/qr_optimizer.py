@@ -0,0 +1,170 @@
+# Cafe Life QR Optimizasyonu
+# Baskı boyutuna göre en düşük QR sürümü, en iyi maske, en verimli kodlama ve
+# modül hedefini karşılayan en yüksek hata düzeltme seviyesini seçer
+#
+# Kullanım:
+#   python scr/qr_optimizer.py https://cafelife.netlify.app/?masa=17 --print-mm 34
+
+import argparse
+import sys
+from urllib.parse import urlsplit
+
+import qrcode
+from qrcode import util
+
+# QR alfanümerik kümesi (byte moduna göre karakter başına ~%45 daha az bit)
+ALPHANUMERIC = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+
+# Hata düzeltme seviyeleri, en yüksekten en düşüğe
+ERROR_LEVELS = ('H', 'Q', 'M', 'L')
+ERROR_CONSTANTS = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H,
+}
+
+# Telefon kamerasının ~20 cm'den hızlı kilitlendiği en küçük modül (mm)
+DEFAULT_MODULE_MM = 0.5
+
+
+def url_segments(url):
+    """
+    Aday kodlamalar: URL olduğu gibi (qrcode kütüphanesinin kendi parçalaması)
+    ve şema + alan adı büyük harfle alfanümerik, kalanı ayrı parça.
+    Şema ve alan adı büyük/küçük harf duyarsızdır (RFC 3986), yol ve sorgu değildir.
+    """
+    candidates = [[(url, None)]]
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc or '@' in parts.netloc:
+        return candidates
+
+    head = f"{parts.scheme}://{parts.netloc}".upper()
+    rest = url[len(head):]
+    if not set(head) <= ALPHANUMERIC:
+        return candidates
+
+    if set(rest) <= ALPHANUMERIC:
+        candidates.append([(head + rest, util.MODE_ALPHA_NUM)])
+    else:
+        candidates.append([(head, util.MODE_ALPHA_NUM), (rest, None)])
+    return candidates
+
+
+def _new_qr(segments, error_correction, border):
+    qr = qrcode.QRCode(error_correction=ERROR_CONSTANTS[error_correction], border=border)
+    for text, mode in segments:
+        if mode is None:
+            qr.add_data(text)
+        else:
+            qr.add_data(util.QRData(text, mode=mode))
+    return qr
+
+
+def module_pitch_mm(total_modules, print_mm=None, size_px=None, dpi=300):
+    """
+    Kenar boşluğu dahil total_modules modüllük QR'ın modül boyutu (mm).
+    size_px verilirse render_qr_mask'ın tam sayı ölçeklemesi hesaba katılır.
+    """
+    if size_px is not None:
+        return (size_px // total_modules) / dpi * 25.4
+    return print_mm / total_modules
+
+
+def optimize_qr(url, print_mm=None, size_px=None, dpi=300, border=4, min_module_mm=DEFAULT_MODULE_MM,
+                error_correction=None):
+    """
+    Her hata düzeltme seviyesi için (yüksekten düşüğe) en kısa kodlamayla en
+    düşük sürümü bulur; modül boyutu min_module_mm'yi karşılayan ilk seviye seçilir.
+    Hiçbiri karşılamazsa en küçük sembol seçilir ve 'fits' False olur.
+    QR alanı print_mm (mm) veya size_px + dpi ile verilir (kenar boşluğu dahil).
+    Seçilen QRCode nesnesi (maske seçilmiş, matris hazır) ve rapor döner.
+    """
+    if print_mm is None and size_px is None:
+        raise ValueError("print_mm veya size_px gerekli")
+
+    levels = (error_correction,) if error_correction else ERROR_LEVELS
+    options = []
+    for level in levels:
+        best = None
+        for segments in url_segments(url):
+            qr = _new_qr(segments, level, border)
+            try:
+                version = qr.best_fit()
+            except qrcode.exceptions.DataOverflowError:
+                continue
+            # Eşitlikte URL'nin yazıldığı hali tercih edilir
+            if best is None or version < best[0]:
+                best = (version, segments)
+        if best is None:
+            continue
+
+        version, segments = best
+        total_modules = version * 4 + 17 + 2 * border
+        pitch = module_pitch_mm(total_modules, print_mm, size_px, dpi)
+        options.append({'error_correction': level, 'version': version, 'segments': segments,
+                        'modules': total_modules, 'module_mm': pitch})
+        if pitch >= min_module_mm:
+            break
+
+    if not options:
+        raise ValueError("URL QR koda sığmıyor")
+
+    fitting = [option for option in options if option['module_mm'] >= min_module_mm]
+    chosen = fitting[0] if fitting else min(options, key=lambda option: option['version'])
+
+    qr = _new_qr(chosen['segments'], chosen['error_correction'], border)
+    qr.version = chosen['version']
+    qr.mask_pattern = qr.best_mask_pattern()
+    qr.make(fit=False)
+
+    report = {
+        'version': chosen['version'],
+        'error_correction': chosen['error_correction'],
+        'mask': qr.mask_pattern,
+        'encoding': '+'.join('alfanümerik' if mode == util.MODE_ALPHA_NUM else 'otomatik'
+                             for _, mode in chosen['segments']),
+        'payload': ''.join(text for text, _ in chosen['segments']),
+        'modules': chosen['modules'],
+        'module_mm': round(chosen['module_mm'], 3),
+        'min_module_mm': min_module_mm,
+        'fits': bool(fitting),
+    }
+    return qr, report
+
+
+def format_report(report):
+    """Raporu tek satır olarak biçimlendirir"""
+    line = (f"QR: sürüm {report['version']}, {report['error_correction']} seviyesi, maske {report['mask']}, "
+            f"{report['encoding']}, modül {report['module_mm']:.2f} mm")
+    if not report['fits']:
+        line += f" (hedef {report['min_module_mm']} mm altında - baskıyı büyütün veya URL'yi kısaltın)"
+    return line
+
+
+def main(argv=None):
+    """Bir URL için seviye seviye sürüm ve modül boyutunu gösterir"""
+    parser = argparse.ArgumentParser(description="Baskı boyutuna göre QR optimizasyonu")
+    parser.add_argument('url')
+    parser.add_argument('--print-mm', type=float, required=True, help="QR alanı kenarı, kenar boşluğu dahil (mm)")
+    parser.add_argument('--min-module-mm', type=float, default=DEFAULT_MODULE_MM, help="Hedef modül boyutu (mm)")
+    parser.add_argument('--border', type=int, default=4, help="Kenar boşluğu (modül)")
+    args = parser.parse_args(argv)
+
+    for level in ERROR_LEVELS:
+        try:
+            _, report = optimize_qr(args.url, args.print_mm, border=args.border,
+                                    min_module_mm=args.min_module_mm, error_correction=level)
+        except ValueError as e:
+            print(f"{level}: {e}")
+            continue
+        print(f"{level}: {format_report(report)}")
+
+    qr, report = optimize_qr(args.url, args.print_mm, border=args.border, min_module_mm=args.min_module_mm)
+    print(f"Seçilen -> {format_report(report)}")
+    print(f"Kodlanan: {report['payload']}")
+    return 0 if report['fits'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+# Cafe Life QR Sunucusu
+# Masa QR kodlarını ve etiketlerini istek üzerine üreten küçük yerel HTTP servisi
+# (örn. hasar gören etiketi tabletten yeniden basmak için)
+#
+# Kullanım:
+#   python scr/qr_server.py --port 8080
+#   GET /qr?url=cafelife.netlify.app&table=17&theme=orange&size=400&format=png
+#   GET /sticker?url=cafelife.netlify.app&table=17&size=590&format=pdf
+#   GET /stats
+
+import argparse
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import qr_generator
+
+# Sunucunun verdiği formatlar ve içerik türleri
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'webp': 'image/webp',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+}
+
+# Uç noktalar ve kullandıkları çiziciler
+ENDPOINTS = {
+    '/qr': 'qr',
+    '/sticker': 'sticker',
+}
+
+MIN_SIZE, MAX_SIZE = 128, 2400
+
+# If-None-Match içindeki tek bir etiket: "*" veya (zayıfsa W/ önekli) tırnaklı ETag
+ETAG_PATTERN = re.compile(r'\*|(?:W/)?"[^"]*"')
+
+
+class ResultCache:
+    """
+    Kodlanmış çıktıların bellek içi LRU önbelleği (toplam bayt sınırlı),
+    iş parçacıkları arasında paylaşılır
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            data = self.items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.items:
+                return
+            self.items[key] = data
+            self.bytes += len(data)
+            while self.bytes > self.max_bytes:
+                _, evicted = self.items.popitem(last=False)
+                self.bytes -= len(evicted)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.items), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+def parse_request(path, query):
+    """
+    Uç nokta ve sorgu parametrelerini doğrular; (tür, url, masa, tema, boyut, format) döner
+    """
+    kind = ENDPOINTS.get(path)
+    if kind is None:
+        raise LookupError(path)
+
+    params = {name: values[-1] for name, values in parse_qs(query).items()}
+    url = qr_generator.normalize_url(params.get('url', ''))
+    if not url:
+        raise ValueError("url parametresi gerekli")
+
+    table = params.get('table', '').strip() or None
+    if kind == 'sticker' and not table:
+        raise ValueError("Etiket için table parametresi gerekli")
+    if table:
+        url = qr_generator.table_url(url, table)
+
+    theme = params.get('theme', 'orange')
+    if theme not in qr_generator.CAFE_THEMES:
+        raise ValueError(f"Bilinmeyen tema: {theme} ({', '.join(qr_generator.CAFE_THEMES)})")
+
+    output_format = params.get('format', 'png').lower()
+    if output_format not in CONTENT_TYPES:
+        raise ValueError(f"Desteklenmeyen format: {output_format} ({', '.join(CONTENT_TYPES)})")
+
+    try:
+        size = int(params.get('size') or (590 if kind == 'sticker' else 400))
+    except ValueError:
+        raise ValueError("size bir sayı olmalı")
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"size {MIN_SIZE}-{MAX_SIZE} arasında olmalı")
+
+    # Raster çıktıda QR modülü en az 1 piksel olmalı (yoksa QR kırpılır ve okunamaz);
+    # veri hiçbir QR sürümüne sığmıyorsa ValueError
+    if kind == 'sticker':
+        minimum = qr_generator.sticker_min_size(url)
+    else:
+        minimum = qr_generator.qr_image_min_size(url)
+    if output_format in ('png', 'webp') and size < minimum:
+        raise ValueError(f"Bu URL için size en az {minimum} olmalı")
+
+    # Etiket tema kullanmaz; aynı etiket tema başına ayrı önbelleğe / ETag'e düşmesin
+    if kind == 'sticker':
+        theme = None
+
+    return kind, url, table, theme, size, output_format
+
+
+def etag_matches(header_values, etag):
+    """
+    If-None-Match başlık(lar)ı ETag ile eşleşiyor mu: liste virgülle ayrılır,
+    "*" her şeyle eşleşir, karşılaştırma zayıftır (W/ öneki yok sayılır)
+    """
+    for value in header_values:
+        for tag in ETAG_PATTERN.findall(value):
+            if tag == '*' or tag.removeprefix('W/') == etag:
+                return True
+    return False
+
+
+def render(kind, url, table, theme, size, output_format):
+    """İsteği mevcut çizicilerle bellekte üretip kodlar"""
+    if kind == 'sticker':
+        canvas = qr_generator.render_sticker(url, table, size, output_format)
+    else:
+        canvas = qr_generator.render_qr_image(url, theme, size, output_format)
+    return qr_generator.encode_artifact(canvas, output_format)
+
+
+class QRRequestHandler(BaseHTTPRequestHandler):
+    """GET isteklerini önbellek ve ETag ile yanıtlar"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'CafeLifeQR/1.0'
+    # Başlık ve gövde tek pakette gider (keep-alive'da gecikmeli ACK beklenmez)
+    wbufsize = 1 << 16
+    disable_nagle_algorithm = True
+    cache = None
+    verbose = False
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == '/stats':
+            return self._send_json(200, self.cache.stats())
+
+        try:
+            request = parse_request(parts.path, parts.query)
+        except LookupError:
+            return self._send_json(404, {'error': f"Bilinmeyen adres: {parts.path}"})
+        except ValueError as e:
+            return self._send_json(400, {'error': str(e)})
+
+        # ETag girdilerden türetilir (renderer sürümü ve font dahil); aynı girdi = aynı çıktı
+        kind, url, table, theme, size, output_format = request
+        key = qr_generator.artifact_key('http', endpoint=kind, url=url, table=table, theme=theme,
+                                        size=size, format=output_format)
+        etag = f'"{key}"'
+        if etag_matches(self.headers.get_all('If-None-Match', []), etag):
+            return self._send(304, b'', etag=etag)
+
+        data = self.cache.get(key)
+        cache_state = 'hit'
+        if data is None:
+            cache_state = 'miss'
+            try:
+                data = render(*request)
+            except Exception as e:
+                return self._send_json(500, {'error': f"Oluşturma hatası: {e}"})
+            self.cache.put(key, data)
+
+        self._send(200, data, CONTENT_TYPES[output_format], etag=etag, cache_state=cache_state)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def _send(self, status, data, content_type=None, etag=None, cache_state=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'public, max-age=86400')
+        if cache_state:
+            self.send_header('X-Cache', cache_state)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8')
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(host='127.0.0.1', port=8080, cache_mb=64, verbose=False):
+    """Önbelleği bağlanmış sunucuyu oluşturur (serve_forever ile çalıştırılır)"""
+    handler = type('Handler', (QRRequestHandler,), {
+        'cache': ResultCache(cache_mb * 1024 * 1024),
+        'verbose': verbose,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    """Sunucu komut satırı"""
+    parser = argparse.ArgumentParser(description="Cafe Life QR sunucusu")
+    parser.add_argument('--host', default='127.0.0.1', help="Dinlenecek adres (tablet ağı için 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-mb', type=int, default=64, help="Önbellek sınırı (MB)")
+    parser.add_argument('--verbose', action='store_true', help="Her isteği logla")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.cache_mb, args.verbose)
+    print(f"QR sunucusu: http://{args.host}:{server.server_address[1]}/qr?url=...&table=1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nSunucu durduruldu")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# Cafe Life QR Modül Stilleri
+# Yuvarlak köşeli ve nokta modüller: her modül şekli bir kez süper örneklemeyle
+# çizilip küçültülür, sonra matris ızgarasına tek dizi işlemiyle basılır
+# (modül modül ImageDraw çizimi yok)
+
+from functools import lru_cache
+
+import numpy as np
+
+# Modül stilleri: square (klasik), rounded (komşuya göre yuvarlak köşe), dots (daire)
+MODULE_STYLES = ('square', 'rounded', 'dots')
+
+# Koda uygulanan renk geçişleri (sol üst -> sağ alt). Açık uç bile beyaz
+# zeminde yeterli kontrast verir (açık turuncu #ff9a56 okunabilirlik uyarısı alır)
+QR_GRADIENTS = {
+    'orange': ('#ff6b35', '#c2410c'),
+}
+
+# Şekil maskesi bu kat çözünürlükte çizilip ortalamayla küçültülür (kenar yumuşatma)
+SUPERSAMPLE = 4
+
+# Nokta yarıçapı (modül kenarına oranla); merkez her zaman koyu kalır
+DOT_RADIUS = 0.42
+
+# Konum desenleri (7x7) her stilde kare çizilir
+FINDER_SIZE = 7
+
+# Komşu bitleri (yuvarlak stil için): yukarı, sağ, aşağı, sol
+_UP, _RIGHT, _DOWN, _LEFT = 1, 2, 4, 8
+
+# Şekil tablosunda komşu kodlarından (0-15) sonraki özel karolar
+_EMPTY, _SQUARE = 16, 17
+
+
+def _shape(style, code, size):
+    """
+    Tek modülün size x size süper örneklenmiş kapsama maskesi (bool).
+    rounded: köşe, o köşedeki iki komşu da açık renkliyse yuvarlanır.
+    """
+    centers = (np.arange(size) + 0.5) / size
+    ys, xs = centers[:, np.newaxis], centers[np.newaxis, :]
+    outside_circle = (xs - 0.5) ** 2 + (ys - 0.5) ** 2 > 0.25
+
+    if style == 'dots':
+        return (xs - 0.5) ** 2 + (ys - 0.5) ** 2 <= DOT_RADIUS ** 2
+
+    inside = np.ones((size, size), dtype=bool)
+    if style == 'rounded':
+        top, left = ys < 0.5, xs < 0.5
+        for vertical, horizontal, rows, cols in ((_UP, _LEFT, top, left), (_UP, _RIGHT, top, ~left),
+                                                 (_DOWN, _LEFT, ~top, left), (_DOWN, _RIGHT, ~top, ~left)):
+            if not code & (vertical | horizontal):
+                inside &= ~(rows & cols & outside_circle)
+    return inside
+
+
+@lru_cache(maxsize=32)
+def module_tiles(style, scale, supersample=SUPERSAMPLE):
+    """
+    Stilin modül karoları (18, scale, scale) uint8 kapsama (0-255):
+    0-15 komşu kodları, 16 boş, 17 tam kare. Süper örneklenmiş şekiller
+    burada bir kez küçültülür; basma sırasında yeniden örnekleme yapılmaz.
+    """
+    size = scale * supersample
+    shapes = np.zeros((18, size, size), dtype=bool)
+    for code in range(16):
+        shapes[code] = _shape(style, code, size)
+    shapes[_SQUARE] = True
+
+    coverage = shapes.reshape(18, scale, supersample, scale, supersample).mean(axis=(2, 4))
+    tiles = np.rint(coverage * 255).astype(np.uint8)
+    tiles.setflags(write=False)
+    return tiles
+
+
+def module_codes(modules, border):
+    """
+    Her modülün karo indeksi: koyu modüller için komşu kodu, açıklar boş,
+    konum desenleri tam kare
+    """
+    padded = np.pad(modules, 1)
+    codes = (padded[:-2, 1:-1] * _UP | padded[1:-1, 2:] * _RIGHT
+             | padded[2:, 1:-1] * _DOWN | padded[1:-1, :-2] * _LEFT).astype(np.uint8)
+    codes[~modules] = _EMPTY
+
+    count = modules.shape[0]
+    finder = np.zeros_like(modules)
+    far = count - border - FINDER_SIZE
+    for row, col in ((border, border), (border, far), (far, border)):
+        finder[row:row + FINDER_SIZE, col:col + FINDER_SIZE] = True
+    codes[finder & modules] = _SQUARE
+    return codes
+
+
+def render_styled_coverage(matrix, size, style='rounded', border=4, supersample=SUPERSAMPLE):
+    """
+    Stilli QR'ın size x size kapsama dizisi (uint8, 255 = koyu). Yerleşim
+    render_qr_mask ile aynıdır (tam sayı modül boyutu, ortalanmış); karolar
+    modül kodlarıyla indekslenip tek bir yeniden şekillendirmeyle birleştirilir.
+    """
+    if style not in MODULE_STYLES:
+        raise ValueError(f"Bilinmeyen modül stili: {style} ({', '.join(MODULE_STYLES)})")
+    modules = np.asarray(matrix, dtype=bool)
+    count = modules.shape[0]
+    if count > size:
+        raise ValueError(f"QR kod ({count} modül) {size} piksele sığmıyor")
+    scale = size // count
+
+    if style == 'square':
+        tiles = module_tiles('square', scale, 1)
+    else:
+        tiles = module_tiles(style, scale, supersample)
+
+    # (satır, sütun, y, x) -> (satır*y, sütun*x)
+    stamped = tiles[module_codes(modules, border)]
+    pixels = stamped.transpose(0, 2, 1, 3).reshape(count * scale, count * scale)
+
+    if pixels.shape[0] < size:
+        offset = (size - pixels.shape[0]) // 2
+        padded = np.zeros((size, size), dtype=np.uint8)
+        padded[offset:offset + pixels.shape[0], offset:offset + pixels.shape[1]] = pixels
+        pixels = padded
+    return pixels
+
+
+@lru_cache(maxsize=8)
+def gradient_pixels(size, start, end):
+    """
+    size x size çapraz renk geçişi (RGB uint8), start/end (r, g, b) demetleri
+    """
+    ratio = np.add.outer(np.arange(size), np.arange(size)) / max(1, 2 * (size - 1))
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    pixels = np.rint(start + (end - start) * ratio[..., np.newaxis]).astype(np.uint8)
+    pixels.setflags(write=False)
+    return pixels
@@ -0,0 +1,301 @@
+# Cafe Life QR Ölçüm İzleri
+# Oluşturucu aşamalarının (QR, maske, logo, yazı, birleştirme, doğrulama, kayıt)
+# süre ve bellek ölçümü; kapalıyken span() hazır boş bağlamı döndürür
+#
+# Kullanım:
+#   python scr/qr_generator.py --url cafelife.netlify.app --trace iz.json
+#   python scr/qr_generator.py --url cafelife.netlify.app --trace iz.json --trace-format chrome
+#   CAFE_QR_TRACE=iz.json python scr/qr_benchmark.py run --quick
+# Chrome izi chrome://tracing veya https://ui.perfetto.dev ile açılır.
+
+import atexit
+import json
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from functools import wraps
+
+# Ortam değişkenleri: iz dosyası, format (json/chrome), bellek ölçümü (0: kapalı)
+TRACE_ENV = 'CAFE_QR_TRACE'
+FORMAT_ENV = 'CAFE_QR_TRACE_FORMAT'
+MEMORY_ENV = 'CAFE_QR_TRACE_MEMORY'
+
+TRACE_FORMATS = ('json', 'chrome')
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# Kapalıyken her span() aynı boş bağlamı döndürür (nesne oluşturulmaz)
+_NULL_SPAN = nullcontext()
+
+_enabled = False
+_memory = False
+_events = []
+_local = threading.local()
+# Ana süreç çıkarken izin yazılacağı (dosya, format); None ise çıkışta yazılmaz
+_exit_destination = None
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _rss_bytes():
+    """Sürecin anlık RSS'i (Linux); Pillow görüntü tamponları tracemalloc'a görünmez"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Span:
+    """
+    Tek bir aşama ölçümü. Süre perf_counter_ns ile, bellek tracemalloc
+    (Python + NumPy) ve RSS farkıyla ölçülür. İç içe aşamalarda tepe değer
+    üst aşamaya taşınır; tepe ölçümü süreç genelidir (arka plan yazıcısı
+    iş parçacığı aynı anda çalışıyorsa onun ayırmaları da görünür).
+    """
+
+    __slots__ = ('name', 'args', 'start', 'memory', 'peak', 'rss')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        stack = _stack()
+        if _memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.memory = self.peak = current
+            self.rss = _rss_bytes()
+        stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        stack = _stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+
+        event = {
+            'name': self.name,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'thread': threading.current_thread().name,
+            'start_ns': self.start,
+            'duration_ns': end - self.start,
+        }
+        if _memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.peak)
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            rss = _rss_bytes()
+            event['alloc_bytes'] = current - self.memory
+            event['peak_bytes'] = peak - self.memory
+            event['rss_bytes'] = rss - self.rss if rss is not None and self.rss is not None else None
+        if self.args:
+            event['args'] = self.args
+        _events.append(event)
+        return False
+
+
+def span(name, **args):
+    """
+    Aşama ölçümü: `with span('qr.make'):`. İzleme kapalıyken ek maliyet tek
+    bir global kontrolüdür.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name):
+    """Fonksiyonun tamamını tek aşama olarak ölçen dekoratör"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable(memory=True):
+    """İzlemeyi bu süreçte açar (fork ile açılan işlem havuzu süreçleri de ölçer)"""
+    global _enabled, _memory
+    _enabled = True
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _init_worker(enabled, memory):
+    if enabled and not _enabled:
+        enable(memory)
+
+
+def pool_options():
+    """
+    İşlem havuzu ayarları (ProcessPoolExecutor(**pool_options())): spawn ile
+    açılan süreçler ebeveynin izleme durumunu kopyalamaz, başlangıçta açılır
+    """
+    return {'initializer': _init_worker, 'initargs': (_enabled, _memory)}
+
+
+def reset():
+    """
+    Toplanan ölçümleri ve bu iş parçacığının açık aşamalarını siler
+    (ebeveynden kopyalanan işlem havuzu süreçlerinde iş başında çağrılır)
+    """
+    _events.clear()
+    _local.stack = []
+
+
+def drain():
+    """Toplanan ölçümleri döndürür ve listeden çıkarır"""
+    events = _events[:]
+    del _events[:len(events)]
+    return events
+
+
+def extend(events):
+    """Başka süreçten gelen ölçümleri ekler"""
+    _events.extend(events)
+
+
+def summarize(events=None):
+    """Aşama başına sayı, toplam / ortalama / en uzun süre (ms) ve bellek"""
+    stages = {}
+    for event in _events if events is None else events:
+        stage = stages.setdefault(event['name'], {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                                  'alloc_bytes': 0, 'peak_bytes': 0, 'rss_bytes': 0})
+        duration = event['duration_ns'] / 1e6
+        stage['count'] += 1
+        stage['total_ms'] += duration
+        stage['max_ms'] = max(stage['max_ms'], duration)
+        stage['alloc_bytes'] += event.get('alloc_bytes') or 0
+        stage['peak_bytes'] = max(stage['peak_bytes'], event.get('peak_bytes') or 0)
+        stage['rss_bytes'] += event.get('rss_bytes') or 0
+
+    for stage in stages.values():
+        stage['mean_ms'] = round(stage['total_ms'] / stage['count'], 3)
+        stage['total_ms'] = round(stage['total_ms'], 3)
+        stage['max_ms'] = round(stage['max_ms'], 3)
+    return dict(sorted(stages.items(), key=lambda item: -item[1]['total_ms']))
+
+
+def _chrome_trace(events):
+    """Chrome trace event formatı (tam süreli 'X' olayları, mikro saniye)"""
+    trace_events = []
+    threads = {}
+    for event in events:
+        threads[(event['pid'], event['tid'])] = event['thread']
+        args = dict(event.get('args') or {})
+        for field in ('alloc_bytes', 'peak_bytes', 'rss_bytes'):
+            if event.get(field) is not None:
+                args[field] = event[field]
+        trace_events.append({
+            'name': event['name'],
+            'cat': event['name'].split('.')[0],
+            'ph': 'X',
+            'ts': event['start_ns'] / 1000,
+            'dur': event['duration_ns'] / 1000,
+            'pid': event['pid'],
+            'tid': event['tid'],
+            'args': args,
+        })
+    for (pid, tid), name in threads.items():
+        trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+
+def write_trace(path, output_format='json', events=None):
+    """
+    Ölçümleri dosyaya yazar. 'json': aşama özeti + tüm ölçümler (ms),
+    'chrome': chrome://tracing / Perfetto ile açılan iz dosyası.
+    """
+    if output_format not in TRACE_FORMATS:
+        raise ValueError(f"Desteklenmeyen iz formatı: {output_format} ({', '.join(TRACE_FORMATS)})")
+    events = list(_events if events is None else events)
+    events.sort(key=lambda event: event['start_ns'])
+
+    if output_format == 'chrome':
+        data = _chrome_trace(events)
+    else:
+        origin = events[0]['start_ns'] if events else 0
+        data = {
+            'stages': summarize(events),
+            'spans': [{**{name: value for name, value in event.items() if name not in ('start_ns', 'duration_ns')},
+                       'start_ms': round((event['start_ns'] - origin) / 1e6, 3),
+                       'duration_ms': round(event['duration_ns'] / 1e6, 3)}
+                      for event in events],
+        }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+    return path
+
+
+def format_summary(stages, limit=12):
+    """Aşama özetini tablo satırları olarak döndürür"""
+    lines = [f"{'aşama':<20} {'adet':>6} {'toplam ms':>10} {'ort. ms':>9} {'py bellek':>10} {'rss':>10}"]
+    for name, stage in list(stages.items())[:limit]:
+        lines.append(f"{name:<20} {stage['count']:>6} {stage['total_ms']:>10.1f} {stage['mean_ms']:>9.2f} "
+                     f"{stage['alloc_bytes'] / 1024:>8.0f}KB {stage['rss_bytes'] / 1024:>8.0f}KB")
+    return lines
+
+
+def write_on_exit(path, output_format='json'):
+    """
+    Ana süreç çıkarken izin yazılacağı dosyayı belirler; tek hedef tutulur,
+    path=None önceki hedefi (örn. CAFE_QR_TRACE) iptal eder
+    """
+    global _exit_destination
+    _exit_destination = (path, output_format) if path else None
+
+
+def _write_at_exit():
+    if _exit_destination:
+        write_trace(*_exit_destination)
+
+
+def _configure_from_env():
+    """
+    CAFE_QR_TRACE verilmişse izlemeyi açar; ana süreç çıkışta dosyayı yazar
+    (spawn ile açılan alt süreçler sadece ölçer, sonuçları iş dönüşüyle gelir)
+    """
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return
+    enable(memory=os.environ.get(MEMORY_ENV, '1') != '0')
+    if multiprocessing.parent_process() is None:
+        write_on_exit(path, os.environ.get(FORMAT_ENV, 'json'))
+        atexit.register(_write_at_exit)
+
+
+_configure_from_env()
@@ -0,0 +1,361 @@
+# Cafe Life Vektör Çıktı
+# QR kartlarını piksel yerine SVG / PDF vektör olarak yazar (ek kütüphane gerekmez)
+
+import base64
+import io
+import unicodedata
+import zlib
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+from PIL import ImageColor
+
+# PDF'te Helvetica ile yazılacak Türkçe karakterler (WinAnsi'de olmayanlar)
+PDF_EXTRA_GLYPHS = {
+    'İ': (0x80, 'Idotaccent'),
+    'ı': (0x81, 'dotlessi'),
+    'Ş': (0x82, 'Scedilla'),
+    'ş': (0x83, 'scedilla'),
+    'Ğ': (0x84, 'Gbreve'),
+    'ğ': (0x85, 'gbreve'),
+}
+
+SVG_FONT_FAMILY = "Arial, Helvetica, 'DejaVu Sans', sans-serif"
+
+# Helvetica AFM karakter genişlikleri (1/1000 em, WinAnsi ASCII aralığı)
+HELVETICA_WIDTHS = dict(zip(
+    ' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~',
+    (278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+     556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+     1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+     667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+     333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+     556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584)))
+HELVETICA_WIDTHS['ı'] = 278
+
+# Metin satırının üstünden taban çizgisine mesafe (Arial/Helvetica ascent, em)
+TEXT_ASCENT = 0.905
+
+
+def qr_runs(matrix):
+    """
+    QR matrisindeki koyu modülleri satır satır yatay şeritlere birleştirir.
+    (satır, sütun, uzunluk) listesi döner.
+    """
+    modules = np.asarray(matrix, dtype=np.int8)
+    padded = np.pad(modules, ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+
+    runs = []
+    for row in range(modules.shape[0]):
+        starts = np.flatnonzero(edges[row] == 1)
+        ends = np.flatnonzero(edges[row] == -1)
+        runs.extend((row, int(start), int(end - start)) for start, end in zip(starts, ends))
+    return runs
+
+
+def _rgb(color):
+    if isinstance(color, tuple):
+        return color[:3]
+    return ImageColor.getrgb(color)[:3]
+
+
+def _hex(color):
+    return '#%02x%02x%02x' % _rgb(color)
+
+
+class VectorDocument:
+    """
+    Sayfa sayfa çizim komutlarını toplar ve SVG veya PDF olarak yazar.
+    Koordinatlar piksel cinsindendir, fiziksel boyut dpi ile hesaplanır.
+    Görseller (logo) belgeye bir kez gömülür, sayfalarda referans verilir.
+    """
+
+    def __init__(self, width, height, dpi=300):
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.pages = []
+        self.images = {}
+        self.new_page()
+
+    def new_page(self):
+        """Yeni boş sayfa başlatır"""
+        self.pages.append([])
+        return self
+
+    def _add(self, *op):
+        self.pages[-1].append(op)
+
+    def rect(self, x, y, width, height, fill):
+        """Dolu dikdörtgen"""
+        self._add('rect', x, y, width, height, _rgb(fill))
+
+    def border(self, x, y, width, height, color, line_width):
+        """Alanın içine çizilen kenarlık (PIL outline ile aynı)"""
+        self._add('border', x, y, width, height, _rgb(color), line_width)
+
+    def ellipse(self, x, y, width, height, fill):
+        """Dolu elips / daire"""
+        self._add('ellipse', x, y, width, height, _rgb(fill))
+
+    def gradient(self, x, y, width, height, top_color, bottom_color):
+        """Yukarıdan aşağıya doğrusal renk geçişi"""
+        self._add('gradient', x, y, width, height, top_color, bottom_color)
+
+    def qr(self, matrix, x, y, size, fill):
+        """
+        QR modüllerini tam sayı modül boyutuyla, alanın ortasına yerleştirir
+        (raster çizimle aynı yerleşim)
+        """
+        count = len(matrix)
+        module = max(1, size // count)
+        offset = max(0, (size - count * module) // 2)
+        self._add('qr', x + offset, y + offset, module, qr_runs(matrix), _rgb(fill))
+
+    def text(self, x, y, text, size, fill, anchor='start'):
+        """
+        Metin; y satırın üstüdür (PIL'deki gibi). anchor='middle' ise x metnin
+        ortasıdır, PDF'te genişlik çizilen fontun (Helvetica) ölçüleriyle bulunur.
+        """
+        self._add('text', x, y + TEXT_ASCENT * size, text, size, _rgb(fill), anchor)
+
+    def image(self, name, image, x, y, width, height):
+        """Görseli ad ile bir kez gömer ve bu sayfaya yerleştirir"""
+        if name not in self.images:
+            self.images[name] = image
+        self._add('image', name, x, y, width, height)
+
+    def save(self, filepath, output_format=None):
+        """Uzantıya (veya output_format'a) göre SVG ya da PDF yazar"""
+        output_format = (output_format or filepath.rsplit('.', 1)[-1]).lower()
+        data = self.to_pdf() if output_format == 'pdf' else self.to_svg()
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        return filepath
+
+    # SVG
+
+    def to_svg(self, page=0):
+        """Tek sayfayı SVG olarak döndürür"""
+        width_mm = self.width / self.dpi * 25.4
+        height_mm = self.height / self.dpi * 25.4
+        defs = []
+        body = []
+
+        for name, image in self.images.items():
+            buffer = io.BytesIO()
+            image.save(buffer, 'PNG')
+            data = base64.b64encode(buffer.getvalue()).decode('ascii')
+            defs.append(f'<image id={quoteattr(name)} width="{image.width}" height="{image.height}" '
+                        f'xlink:href="data:image/png;base64,{data}"/>')
+
+        for index, op in enumerate(self.pages[page]):
+            kind = op[0]
+            if kind == 'rect':
+                _, x, y, w, h, color = op
+                body.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{_hex(color)}"/>')
+            elif kind == 'border':
+                _, x, y, w, h, color, line = op
+                half = line / 2
+                body.append(f'<rect x="{x + half}" y="{y + half}" width="{w - line}" height="{h - line}" '
+                            f'fill="none" stroke="{_hex(color)}" stroke-width="{line}"/>')
+            elif kind == 'ellipse':
+                _, x, y, w, h, color = op
+                body.append(f'<ellipse cx="{x + w / 2}" cy="{y + h / 2}" rx="{w / 2}" ry="{h / 2}" '
+                            f'fill="{_hex(color)}"/>')
+            elif kind == 'gradient':
+                _, x, y, w, h, top, bottom = op
+                defs.append(f'<linearGradient id="g{index}" x1="0" y1="0" x2="0" y2="1">'
+                            f'<stop offset="0" stop-color="{_hex(top)}"/>'
+                            f'<stop offset="1" stop-color="{_hex(bottom)}"/></linearGradient>')
+                body.append(f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="url(#g{index})"/>')
+            elif kind == 'qr':
+                _, x, y, module, runs, color = op
+                path = ''.join(f'M{col} {row}h{length}v1h-{length}z' for row, col, length in runs)
+                body.append(f'<path transform="translate({x} {y}) scale({module})" fill="{_hex(color)}" '
+                            f'shape-rendering="crispEdges" d="{path}"/>')
+            elif kind == 'text':
+                _, x, y, text, size, color, anchor = op
+                body.append(f'<text x="{x}" y="{y}" font-size="{size}" fill="{_hex(color)}" '
+                            f'text-anchor="{anchor}" font-family={quoteattr(SVG_FONT_FAMILY)}>'
+                            f'{escape(text)}</text>')
+            elif kind == 'image':
+                _, name, x, y, w, h = op
+                image = self.images[name]
+                scale = f' transform="translate({x} {y}) scale({w / image.width} {h / image.height})"'
+                body.append(f'<use xlink:href="#{name}"{scale}/>')
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width_mm:.2f}mm" height="{height_mm:.2f}mm" '
+            f'viewBox="0 0 {self.width} {self.height}">\n'
+            f'<defs>{"".join(defs)}</defs>\n'
+            + '\n'.join(body) +
+            '\n</svg>\n'
+        ).encode('utf-8')
+
+    # PDF
+
+    def to_pdf(self):
+        """Tüm sayfaları tek bir PDF olarak döndürür"""
+        objects = []
+
+        def add_object(data):
+            objects.append(data)
+            return len(objects)
+
+        def add_stream(dictionary, data, compress=True):
+            if compress:
+                data = zlib.compress(data)
+                dictionary += b' /Filter /FlateDecode'
+            return add_object(b'<< ' + dictionary + b' /Length %d >>\nstream\n' % len(data)
+                              + data + b'\nendstream')
+
+        catalog_id = add_object(None)
+        pages_id = add_object(None)
+
+        differences = b' '.join(b'%d /%s' % (code, name.encode('ascii'))
+                                for code, name in PDF_EXTRA_GLYPHS.values())
+        font_id = add_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding '
+                             b'<< /Type /Encoding /BaseEncoding /WinAnsiEncoding /Differences [' +
+                             differences + b'] >> >>')
+
+        # Görseller belgeye bir kez gömülür
+        image_ids = {}
+        for index, (name, image) in enumerate(self.images.items()):
+            smask = b''
+            if image.mode in ('RGBA', 'LA', 'P'):
+                alpha = image.convert('RGBA').getchannel('A')
+                smask_id = add_stream(b'/Type /XObject /Subtype /Image /Width %d /Height %d '
+                                      b'/ColorSpace /DeviceGray /BitsPerComponent 8' % alpha.size,
+                                      alpha.tobytes())
+                smask = b' /SMask %d 0 R' % smask_id
+            rgb = image.convert('RGB')
+            image_ids[name] = (b'/Im%d' % index, add_stream(
+                b'/Type /XObject /Subtype /Image /Width %d /Height %d '
+                b'/ColorSpace /DeviceRGB /BitsPerComponent 8' % rgb.size + smask,
+                rgb.tobytes()))
+
+        scale = 72 / self.dpi
+        page_width, page_height = self.width * scale, self.height * scale
+        page_ids = []
+
+        for page in self.pages:
+            shadings = {}
+            # Piksel koordinatları: sol üst köşe orijin, y aşağı doğru
+            content = [b'%.6f 0 0 %.6f 0 %.4f cm' % (scale, -scale, page_height)]
+
+            for op in page:
+                kind = op[0]
+                if kind == 'rect':
+                    _, x, y, w, h, color = op
+                    content.append(b'%s rg %s %s %s %s re f' % (_pdf_color(color), *_pdf_nums(x, y, w, h)))
+                elif kind == 'border':
+                    _, x, y, w, h, color, line = op
+                    half = line / 2
+                    content.append(b'%s RG %s w %s %s %s %s re S' % (
+                        _pdf_color(color), *_pdf_nums(line, x + half, y + half, w - line, h - line)))
+                elif kind == 'ellipse':
+                    _, x, y, w, h, color = op
+                    content.append(_pdf_color(color) + b' rg ' + _pdf_ellipse(x, y, w, h) + b' f')
+                elif kind == 'gradient':
+                    _, x, y, w, h, top, bottom = op
+                    shading_name = b'/Sh%d' % len(shadings)
+                    shadings[shading_name] = add_object(
+                        b'<< /ShadingType 2 /ColorSpace /DeviceRGB /Coords [0 %s 0 %s] '
+                        b'/Function << /FunctionType 2 /Domain [0 1] /C0 [%s] /C1 [%s] /N 1 >> '
+                        b'/Extend [true true] >>' % (*_pdf_nums(y, y + h), _pdf_color(top), _pdf_color(bottom)))
+                    content.append(b'q %s %s %s %s re W n %s sh Q' % (*_pdf_nums(x, y, w, h), shading_name))
+                elif kind == 'qr':
+                    _, x, y, module, runs, color = op
+                    content.append(b'q %s 0 0 %s %s %s cm %s rg' % (
+                        *_pdf_nums(module, module, x, y), _pdf_color(color)))
+                    content.append(b'\n'.join(b'%d %d %d 1 re' % (col, row, length)
+                                              for row, col, length in runs) + b' f Q')
+                elif kind == 'text':
+                    _, x, y, text, size, color, anchor = op
+                    if anchor == 'middle':
+                        x -= helvetica_width(text, size) / 2
+                    content.append(b'%s rg BT /F1 %s Tf 1 0 0 -1 %s %s Tm (%s) Tj ET' % (
+                        _pdf_color(color), *_pdf_nums(size, x, y), _pdf_text(text)))
+                elif kind == 'image':
+                    _, name, x, y, w, h = op
+                    image_name = image_ids[name][0]
+                    content.append(b'q %s 0 0 %s %s %s cm %s Do Q' % (
+                        *_pdf_nums(w, -h, x, y + h), image_name))
+
+            content_id = add_stream(b'', b'\n'.join(content))
+            resources = (b'<< /Font << /F1 %d 0 R >> /XObject << %s >> /Shading << %s >> >>' % (
+                font_id,
+                b' '.join(b'%s %d 0 R' % ref for ref in image_ids.values()),
+                b' '.join(b'%s %d 0 R' % item for item in shadings.items())))
+            page_ids.append(add_object(
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] /Resources %s /Contents %d 0 R >>' % (
+                    pages_id, *_pdf_nums(page_width, page_height), resources, content_id)))
+
+        objects[catalog_id - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id
+        objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids))
+
+        output = io.BytesIO()
+        output.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, data in enumerate(objects, 1):
+            offsets.append(output.tell())
+            output.write(b'%d 0 obj\n' % number + data + b'\nendobj\n')
+
+        xref_offset = output.tell()
+        output.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            output.write(b'%010d 00000 n \n' % offset)
+        output.write(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+            len(objects) + 1, catalog_id, xref_offset))
+        return output.getvalue()
+
+
+def _pdf_nums(*values):
+    return tuple(b'%g' % round(value, 4) for value in values)
+
+
+def _pdf_color(color):
+    return b'%g %g %g' % tuple(round(channel / 255, 4) for channel in _rgb(color))
+
+
+def _pdf_ellipse(x, y, w, h):
+    """Elipsi dört Bezier eğrisiyle çizer"""
+    k = 0.5523
+    rx, ry = w / 2, h / 2
+    cx, cy = x + rx, y + ry
+    return b'%s %s m %s %s %s %s %s %s c %s %s %s %s %s %s c %s %s %s %s %s %s c %s %s %s %s %s %s c' % _pdf_nums(
+        cx + rx, cy,
+        cx + rx, cy + k * ry, cx + k * rx, cy + ry, cx, cy + ry,
+        cx - k * rx, cy + ry, cx - rx, cy + k * ry, cx - rx, cy,
+        cx - rx, cy - k * ry, cx - k * rx, cy - ry, cx, cy - ry,
+        cx + k * rx, cy - ry, cx + rx, cy - k * ry, cx + rx, cy)
+
+
+def helvetica_width(text, size):
+    """Metnin PDF'te çizildiği Helvetica ile genişliği; aksanlı harfler taban harfi kadardır"""
+    total = 0
+    for char in text:
+        width = HELVETICA_WIDTHS.get(char)
+        if width is None:
+            width = HELVETICA_WIDTHS.get(unicodedata.normalize('NFD', char)[0], 556)
+        total += width
+    return total * size / 1000
+
+
+def _pdf_text(text):
+    """Metni Helvetica (WinAnsi + Türkçe farkları) kodlamasına çevirir"""
+    encoded = bytearray()
+    for char in text:
+        if char in PDF_EXTRA_GLYPHS:
+            encoded.append(PDF_EXTRA_GLYPHS[char][0])
+            continue
+        try:
+            encoded += char.encode('cp1252')
+        except UnicodeEncodeError:
+            encoded += b'?'
+    return bytes(encoded).replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
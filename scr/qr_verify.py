@@ -0,0 +1,130 @@
+# Cafe Life QR Doğrulama
+# Son canvas üzerindeki QR kodun okunabilirliğini modül matrisine göre hızlıca kontrol eder
+
+import numpy as np
+
+# Hata düzeltme seviyesine göre kabul edilen hatalı modül oranı
+# (kurtarma kapasitesinin yarısı - güvenlik payı bırakılır)
+ERROR_TOLERANCE = {'L': 0.035, 'M': 0.075, 'Q': 0.125, 'H': 0.15}
+
+# Sembol kontrastı (ISO/IEC 15415'e benzer, gri seviyeden): altı hata, arası uyarı
+MIN_SYMBOL_CONTRAST = 0.20
+WARN_SYMBOL_CONTRAST = 0.40
+
+# Standart sessiz bölge (modül) ve ölçülecek en fazla genişlik
+REQUIRED_QUIET_ZONE = 4
+MAX_QUIET_ZONE_CHECK = 6
+
+
+def _sample_grid(gray, origin, module, first, count):
+    """
+    Modül merkezlerini tek seferde örnekler; canvas dışına düşenler NaN olur
+    """
+    centers = origin + (np.arange(first, first + count) + 0.5) * module
+    centers = np.floor(centers).astype(int)
+    ys, xs = centers[:, np.newaxis], centers[np.newaxis, :]
+    inside = (ys >= 0) & (ys < gray.shape[0]) & (xs >= 0) & (xs < gray.shape[1])
+    samples = np.full((count, count), np.nan)
+    samples[inside] = gray[np.clip(ys, 0, gray.shape[0] - 1), np.clip(xs, 0, gray.shape[1] - 1)][inside]
+    return samples
+
+
+def _finder_slices(size):
+    """Sembol içindeki üç konum deseninin (7x7) dilimleri"""
+    return [
+        (slice(0, 7), slice(0, 7)),
+        (slice(0, 7), slice(size - 7, size)),
+        (slice(size - 7, size), slice(0, 7)),
+    ]
+
+
+def verify_qr_region(canvas, matrix, box, border, error_correction='M'):
+    """
+    canvas'ta box=(x, y, boyut) alanına render_qr_mask ile yerleştirilen QR'ı
+    doğrular. Modül merkezlerini vektörel örnekler ve matrisle karşılaştırır,
+    konum desenlerini, sembol kontrastını ve gerçek sessiz bölgeyi ölçer.
+    Sonuç sözlüğünde 'ok', 'errors' ve 'warnings' bulunur.
+    """
+    modules = np.asarray(matrix, dtype=bool)
+    count = modules.shape[0]
+    x, y, size = box
+    module = max(1, size // count)
+    offset = max(0, (size - count * module) // 2)
+
+    # Sadece QR ve çevresini gri tona çevir (A4 sayfanın tamamı değil)
+    symbol_size = count - 2 * border
+    margin = (MAX_QUIET_ZONE_CHECK + 1) * module
+    left = x + offset + border * module - margin
+    top = y + offset + border * module - margin
+    crop = canvas.crop((left, top, left + symbol_size * module + 2 * margin,
+                        top + symbol_size * module + 2 * margin))
+    gray = np.asarray(crop.convert('L'), dtype=float)
+
+    # Kırpma dışına taşan kısımlar canvas dışıdır
+    visible_right, visible_bottom = canvas.width - left, canvas.height - top
+    if left < 0 or top < 0 or visible_right < gray.shape[1] or visible_bottom < gray.shape[0]:
+        outside = np.zeros(gray.shape, dtype=bool)
+        outside[:max(0, -top), :] = True
+        outside[:, :max(0, -left)] = True
+        outside[max(0, visible_bottom):, :] = True
+        outside[:, max(0, visible_right):] = True
+        gray[outside] = np.nan
+
+    # Sembol + ölçülecek sessiz bölge ızgarası
+    extra = MAX_QUIET_ZONE_CHECK
+    samples = _sample_grid(gray, margin - extra * module, module, 0, symbol_size + 2 * extra)
+    symbol = samples[extra:extra + symbol_size, extra:extra + symbol_size]
+    expected = modules[border:count - border, border:count - border]
+
+    errors, warnings = [], []
+
+    # Sembol kontrastı ve koyu/açık eşiği
+    dark_level = np.median(symbol[expected])
+    light_level = np.median(symbol[~expected])
+    contrast = (light_level - dark_level) / 255
+    threshold = (dark_level + light_level) / 2
+    if contrast < MIN_SYMBOL_CONTRAST:
+        errors.append(f"kontrast çok düşük (%{contrast * 100:.0f})")
+    elif contrast < WARN_SYMBOL_CONTRAST:
+        warnings.append(f"düşük kontrast (%{contrast * 100:.0f}), uzaktan okuma zorlaşabilir")
+
+    # Modül karşılaştırması
+    read = symbol < threshold
+    mismatches = int(np.count_nonzero(read != expected))
+    mismatch_ratio = mismatches / expected.size
+    if mismatch_ratio > ERROR_TOLERANCE.get(error_correction, ERROR_TOLERANCE['L']):
+        errors.append(f"{mismatches} modül hatalı (%{mismatch_ratio * 100:.1f}), "
+                      f"{error_correction} seviyesi kurtaramayabilir")
+    elif mismatches:
+        warnings.append(f"{mismatches} modül hatalı, hata düzeltme ile okunur")
+
+    # Konum desenleri eksiksiz olmalı
+    finder_ok = all(np.array_equal(read[rows, cols], expected[rows, cols])
+                    for rows, cols in _finder_slices(symbol_size))
+    if not finder_ok:
+        errors.append("konum deseni (köşe kareleri) bozuk")
+
+    # Sessiz bölge: sembolden dışarı doğru tamamen açık renkli halka sayısı
+    light = samples >= threshold
+    index = np.arange(symbol_size + 2 * extra)
+    distance_to_symbol = np.maximum(np.maximum(extra - index, index - (extra + symbol_size - 1)), 0)
+    ring = np.maximum(distance_to_symbol[:, np.newaxis], distance_to_symbol[np.newaxis, :])
+    quiet_zone = 0
+    for width in range(1, extra + 1):
+        if not light[ring == width].all():
+            break
+        quiet_zone = width
+    if quiet_zone < REQUIRED_QUIET_ZONE:
+        errors.append(f"sessiz bölge {quiet_zone} modül (en az {REQUIRED_QUIET_ZONE} gerekli)")
+
+    return {
+        'ok': not errors,
+        'errors': errors,
+        'warnings': warnings,
+        'modules': symbol_size,
+        'module_px': module,
+        'mismatches': mismatches,
+        'symbol_contrast': round(float(contrast), 3),
+        'finder_ok': finder_ok,
+        'quiet_zone': quiet_zone,
+    }
@@ -0,0 +1,204 @@
+# Cafe Life QR İzleme Modu
+# Manifest, logo ve font dosyalarını izler; değişen girdiye bağlı çıktıları
+# (bağımlılık grafiğine göre) yeniden üretir, diğerlerine dokunmaz
+#
+# Kullanım:
+#   python scr/qr_watch.py --manifest venues.json --output-dir qr_codes
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import qr_generator
+
+# Girdiler: manifest satırları, logo dosyası ve font dosyası
+WATCH_INPUTS = ('manifest', 'logo', 'font')
+
+# Proje kökü (logo ve paketle gelen fontlar buna göre de aranır)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def watched_files(manifest_path):
+    """
+    Girdi başına izlenecek dosyalar. Logo için assets/images/logo.* (yeni
+    eklenen dosya da görülür), font için kullanılan font, CAFE_QR_FONT ve
+    projedeki font klasörlerindeki dosyalar.
+    """
+    logos = {os.path.abspath(path) for path in qr_generator.LOGO_PATHS}
+    for root in ('.', PROJECT_ROOT):
+        logos.update(os.path.abspath(path) for path in glob.glob(os.path.join(root, 'assets', 'images', 'logo.*')))
+
+    fonts = set()
+    font_path = qr_generator.find_font_path()
+    if font_path:
+        fonts.add(os.path.abspath(font_path))
+    if os.environ.get("CAFE_QR_FONT"):
+        fonts.add(os.path.abspath(os.environ["CAFE_QR_FONT"]))
+    for font_dir in qr_generator.FONT_DIRS[:2]:  # Paketle gelen ve assets/fonts
+        fonts.update(os.path.abspath(path) for name in qr_generator.FONT_NAMES
+                     for path in glob.glob(os.path.join(font_dir, '**', name), recursive=True))
+
+    return {'manifest': {os.path.abspath(manifest_path)}, 'logo': logos, 'font': fonts}
+
+
+def snapshot(files):
+    """Girdi başına {dosya: (mtime_ns, boyut)}; olmayan dosya None"""
+    state = {}
+    for name, paths in files.items():
+        state[name] = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                state[name][path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                state[name][path] = None
+    return state
+
+
+def job_inputs(kind, options):
+    """
+    Bir baskı işinin bağlı olduğu girdiler: hepsi manifest satırına ve
+    fonta (yazılar), çadır ve ortası logolu kartlar logoya bağlıdır
+    """
+    inputs = {'manifest', 'font'}
+    if kind == 'tent' or (kind == 'card' and options.get('center_logo')):
+        inputs.add('logo')
+    return frozenset(inputs)
+
+
+def build_graph(jobs, output_dir, workers=1):
+    """
+    Bağımlılık grafiği: iş kimliği (mekan/çıktı) -> baskı işi, bağlı
+    olduğu girdiler ve manifestten gelen ayarların imzası
+    """
+    graph = {}
+    for job in jobs:
+        for layout, kind, url, options in qr_generator.venue_pack_jobs(job, output_dir, workers):
+            job_id = f"{job['venue']}/{kind}"
+            graph[job_id] = {
+                'job': (layout, kind, url, options),
+                'inputs': job_inputs(kind, options),
+                'signature': json.dumps([kind, url, options], sort_keys=True, default=str),
+            }
+    return graph
+
+
+def affected_jobs(old_graph, new_graph, changed):
+    """
+    Değişen girdilerden etkilenen işler: manifestte yeni eklenen veya ayarı
+    değişen işler ile logo/font değiştiyse o girdiye bağlı işler
+    """
+    affected = []
+    for job_id, node in new_graph.items():
+        old = old_graph.get(job_id)
+        if 'manifest' in changed and (old is None or old['signature'] != node['signature']):
+            affected.append(job_id)
+        elif node['inputs'] & (changed - {'manifest'}):
+            affected.append(job_id)
+    return affected
+
+
+def rebuild(graph, job_ids, workers=1):
+    """Seçilen işleri çalıştırır; üretilen dosya sayısı ve okunamayan QR'lar döner"""
+    qr_generator.VERIFY_REPORTS.clear()
+    artifacts = qr_generator.render_print_pack([graph[job_id]['job'] for job_id in job_ids], workers)
+    unscannable = [report['artifact'] for report in qr_generator.VERIFY_REPORTS if not report['ok']]
+    return artifacts, unscannable
+
+
+def apply_changes(manifest_path, graph, changed, output_dir, workers=1):
+    """
+    Değişen girdilere göre önbellekleri temizler, grafiği günceller ve
+    etkilenen işleri yeniden üretir. Yeni grafik döner; manifest hatalıysa
+    (örn. kaydetme yarım kaldıysa) önceki manifest geçerli kalır.
+    """
+    qr_generator.clear_input_caches(logo='logo' in changed, font='font' in changed)
+
+    new_graph = graph
+    if 'manifest' in changed:
+        try:
+            new_graph = build_graph(qr_generator.load_job_manifest(manifest_path), output_dir, workers)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Manifest okunamadı, önceki hali kullanılıyor: {e}")
+            changed = changed - {'manifest'}
+
+    job_ids = affected_jobs(graph, new_graph, changed)
+    removed = sorted(set(graph) - set(new_graph))
+    if removed:
+        print(f"Manifestten çıkan işler: {', '.join(removed)} (dosyaları silinmedi)")
+    if not job_ids:
+        print(f"Değişiklik ({', '.join(sorted(changed))}): etkilenen çıktı yok")
+        return new_graph
+
+    start = time.perf_counter()
+    try:
+        artifacts, unscannable = rebuild(new_graph, job_ids, workers)
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
+        return new_graph
+
+    print(f"Değişiklik ({', '.join(sorted(changed))}): {len(job_ids)} iş, {len(artifacts)} dosya "
+          f"({time.perf_counter() - start:.2f} sn) - {', '.join(job_ids)}")
+    if unscannable:
+        print(f"OKUNABİLİRLİK HATASI: {len(unscannable)} QR basılmadan önce kontrol edilmeli")
+    return new_graph
+
+
+def watch(manifest_path, output_dir="qr_codes", interval=0.2, debounce=0.3, workers=1, max_cycles=None):
+    """
+    Önce tüm çıktıları (önbellekten) hazırlar, sonra girdileri interval
+    saniyede bir yoklar. Değişiklikler debounce saniye durulduktan sonra tek
+    seferde işlenir (editörlerin art arda yazmaları tek yeniden üretim olur).
+    max_cycles: test için yoklama sınırı (None: Ctrl+C'ye kadar).
+    """
+    graph = build_graph(qr_generator.load_job_manifest(manifest_path), output_dir, workers)
+    artifacts, _ = rebuild(graph, list(graph), workers)
+    print(f"\n{len(artifacts)} çıktı hazır; izleniyor: {manifest_path}, logo, font (Ctrl+C ile çıkış)")
+
+    state = snapshot(watched_files(manifest_path))
+    pending, last_change = set(), None
+    cycles = 0
+    while max_cycles is None or cycles < max_cycles:
+        cycles += 1
+        time.sleep(interval)
+        current = snapshot(watched_files(manifest_path))
+        changed = {name for name in WATCH_INPUTS if current[name] != state[name]}
+        if changed:
+            pending |= changed
+            last_change = time.monotonic()
+            state = current
+            continue
+        if pending and time.monotonic() - last_change >= debounce:
+            graph = apply_changes(manifest_path, graph, pending, output_dir, workers)
+            pending = set()
+            # Yeniden üretim sırasında font/logo yolları değişmiş olabilir
+            state = snapshot(watched_files(manifest_path))
+    return graph
+
+
+def main(argv=None):
+    """İzleme modu komut satırı"""
+    parser = argparse.ArgumentParser(description="Cafe Life QR izleme modu")
+    parser.add_argument('--manifest', required=True, help="Mekan listesi (JSON veya CSV)")
+    parser.add_argument('--output-dir', default='qr_codes', help="Çıktı klasörü")
+    parser.add_argument('--interval', type=float, default=0.2, help="Yoklama aralığı (sn)")
+    parser.add_argument('--debounce', type=float, default=0.3, help="Son değişiklikten sonra bekleme (sn)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="İşlem sayısı (1: önbellekler sıcak kalır, tek değişiklikte en hızlısı)")
+    args = parser.parse_args(argv)
+
+    try:
+        watch(args.manifest, args.output_dir, args.interval, args.debounce, args.workers)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Girdi hatası: {e}")
+        return 2
+    except KeyboardInterrupt:
+        print("\nİzleme durduruldu")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,19 +2,145 @@
 # HTML dosyasını çeşitli platformlara otomatik yükler
 
 import os
+import sys
+import time
+import argparse
 import requests
 import json
 import zipfile
-import tempfile
 import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import quote
 import webbrowser
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Bağlantı ve okuma zaman aşımı (sn): takılan bir soket deploy'u sonsuza kadar bekletmez
+HTTP_TIMEOUT = (5, 60)
+
+# Geçici hatalarda tekrar sayısı ve bekleme çarpanı (0.5, 1, 2 sn...)
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Ana bilgisayar başına açık tutulan (keep-alive) bağlantı sayısı
+HTTP_POOL_SIZE = 8
+
+# Aynı anda yüklenen dosya sayısı (bağlantı havuzundan büyük olmamalı)
+UPLOAD_WORKERS = 4
+
+# Netlify API adresi (test için yerel sahte sunucu verilebilir)
+NETLIFY_API = os.environ.get('NETLIFY_API_URL', 'https://api.netlify.com/api/v1')
+
+# Vercel API adresi
+VERCEL_API = os.environ.get('VERCEL_API_URL', 'https://api.vercel.com')
+
+# GitHub API adresi
+GITHUB_API = os.environ.get('GITHUB_API_URL', 'https://api.github.com')
+
+# Paralel deploy hedefleri: token ortam değişkeni ve sorulacak metin
+DEPLOY_TARGETS = {
+    'netlify': ('NETLIFY_AUTH_TOKEN', "Netlify Token girin: "),
+    'vercel': ('VERCEL_TOKEN', "Vercel Token girin: "),
+    'github': ('GITHUB_TOKEN', "GitHub Token girin: "),
+}
+
+# Siteye dahil edilen görseller (HTML'deki assets/images/... yollarıyla)
+SITE_IMAGE_DIR = os.path.join('assets', 'images')
+SITE_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg')
+
+# Özet hesaplamada okunan parça boyutu
+DIGEST_CHUNK = 1024 * 1024
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """Zaman aşımı verilmeyen isteklere varsayılan (bağlantı, okuma) zaman aşımını uygular"""
+
+    def __init__(self, timeout=HTTP_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES, pool_size=HTTP_POOL_SIZE, idempotent_posts=()):
+    """
+    Tüm platformların paylaştığı HTTP oturumu: bağlantı havuzu (keep-alive,
+    TLS el sıkışması ana bilgisayar başına bir kez), zaman aşımı ve geçici
+    hatalarda artan beklemeyle tekrar. Sunucuya ulaşmış POST istekleri
+    tekrarlanmaz (çift site / çift deploy oluşmasın); sadece GET, PUT, DELETE
+    gibi idempotent istekler ve hiç gönderilemeyen (bağlantı hatası) istekler tekrarlanır.
+    idempotent_posts: POST'un da tekrarlanabileceği adres önekleri (örn. içerik
+    özetiyle adreslenen dosya yüklemeleri; aynı dosya iki kez gitse de tek blob olur).
+    """
+    def adapter(allowed_methods):
+        retry = Retry(total=retries, connect=retries, read=retries, status=retries,
+                      backoff_factor=HTTP_BACKOFF, status_forcelist=RETRY_STATUSES,
+                      allowed_methods=allowed_methods, raise_on_status=False)
+        return TimeoutHTTPAdapter(timeout=timeout, max_retries=retry,
+                                  pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    default = adapter(Retry.DEFAULT_ALLOWED_METHODS)
+    session.mount('https://', default)
+    session.mount('http://', default)
+    if idempotent_posts:
+        # Önek eşleşmesinde en uzun önek kazanır; dosya gövdesi tekrarda başa sarılır
+        post_adapter = adapter(Retry.DEFAULT_ALLOWED_METHODS | {'POST'})
+        for prefix in idempotent_posts:
+            session.mount(prefix, post_adapter)
+    return session
+
+
+def file_digest(path, algorithm='sha1'):
+    """Dosyanın onaltılık özeti; dosya parça parça okunur"""
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DIGEST_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def git_blob_sha(path):
+    """Dosyanın git blob SHA1'i (git hash-object ile aynı); dosya parça parça okunur"""
+    digest = hashlib.sha1(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DIGEST_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_parallel(func, items, workers=UPLOAD_WORKERS):
+    """func'u öğelere en fazla workers iş parçacığıyla uygular; sonuçlar sırayla döner"""
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
 
 class WebUploader:
-    def __init__(self):
+    def __init__(self, session=None, netlify_api=NETLIFY_API, vercel_api=VERCEL_API, github_api=GITHUB_API,
+                 workers=UPLOAD_WORKERS):
         self.html_file = None
         self.project_name = "cafe-life-menu"
+        self.netlify_api = netlify_api.rstrip('/')
+        self.vercel_api = vercel_api.rstrip('/')
+        self.github_api = github_api.rstrip('/')
+        # Tüm yüklemeler aynı bağlantı havuzunu kullanır; Vercel dosyaları SHA ile
+        # adreslendiğinden /v2/files POST'u güvenle tekrarlanabilir
+        self.session = session or create_session(idempotent_posts=[f'{self.vercel_api}/v2/files'])
+        self.workers = workers
+
+    def close(self):
+        """Havuzdaki bağlantıları kapatır"""
+        self.session.close()
 
     def find_html_file(self):
         """HTML dosyasını bulur"""
@@ -33,177 +159,290 @@ class WebUploader:
         print("HTML dosyası bulunamadı!")
         return False
 
-    def upload_to_netlify_drop(self):
-        """Netlify Drop API ile yükleme"""
+    def site_files(self):
+        """
+        Sitedeki dosyalar: {site yolu: yerel yol}. HTML index.html olarak,
+        görseller HTML'in yanındaki assets/images klasöründen aynı yollarla eklenir.
+        """
+        files = {'index.html': self.html_file}
+        images_dir = os.path.join(os.path.dirname(self.html_file), SITE_IMAGE_DIR)
+        if os.path.isdir(images_dir):
+            for filename in sorted(os.listdir(images_dir)):
+                if filename.lower().endswith(SITE_IMAGE_EXTENSIONS):
+                    files[f"{SITE_IMAGE_DIR.replace(os.sep, '/')}/{filename}"] = os.path.join(images_dir, filename)
+        return files
+
+    def _netlify_site(self, headers, site_id):
+        """Netlify sitesini bulur, yoksa proje adıyla oluşturur; site bilgisi döner"""
+        response = self.session.get(f'{self.netlify_api}/sites/{site_id}', headers=headers)
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code != 404:
+            raise RuntimeError(f"Site sorgulanamadı: {response.status_code} - {response.text}")
+
+        response = self.session.post(f'{self.netlify_api}/sites', headers=headers,
+                                     json={'name': self.project_name})
+        if response.status_code != 201:
+            raise RuntimeError(f"Site oluşturulamadı: {response.status_code} - {response.text}")
+        return response.json()
+
+    def upload_to_netlify(self, netlify_token=None, site_id=None):
+        """
+        Netlify'a özet tabanlı deploy: tüm dosyaların SHA1 listesi gönderilir,
+        sadece sunucuda olmayan dosyalar (genelde değişen HTML) paralel yüklenir.
+        site_id verilmezse proje adındaki site kullanılır (yoksa oluşturulur).
+        """
         print("Netlify'a yükleniyor...")
 
-        try:
-            # HTML dosyasını oku
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            # Netlify'nin deploy API'sine POST
-            files = {
-                'index.html': html_content
-            }
+        netlify_token = netlify_token or os.environ.get('NETLIFY_AUTH_TOKEN')
+        if not netlify_token:
+            print("Netlify token gerekli!")
+            print("Token almak için: https://app.netlify.com/user/applications#personal-access-tokens")
+            netlify_token = input("Netlify Token girin: ").strip()
+        site_id = site_id or os.environ.get('NETLIFY_SITE_ID') or f"{self.project_name}.netlify.app"
 
-            # Zip dosyası oluştur
-            zip_path = tempfile.mktemp(suffix='.zip')
-            with zipfile.ZipFile(zip_path, 'w') as zip_file:
-                zip_file.writestr('index.html', html_content)
-
-            # Netlify'e yükle
-            with open(zip_path, 'rb') as zip_file:
-                response = requests.post(
-                    'https://api.netlify.com/api/v1/sites',
-                    files={'zip': zip_file},
-                    headers={'Content-Type': 'application/zip'}
-                )
+        try:
+            headers = {'Authorization': f'Bearer {netlify_token}'}
+            site = self._netlify_site(headers, site_id)
 
-            os.unlink(zip_path)
+            # Dosya özetleri (Netlify yolları / ile başlar)
+            files = {f'/{path}': local for path, local in self.site_files().items()}
+            digests = dict(zip(files, run_parallel(file_digest, files.values(), self.workers)))
 
-            if response.status_code == 201:
-                site_data = response.json()
-                url = f"https://{site_data['subdomain']}.netlify.app"
-                print(f"Başarılı! URL: {url}")
-                return url
-            else:
+            response = self.session.post(
+                f"{self.netlify_api}/sites/{site['id']}/deploys",
+                headers=headers,
+                json={'files': digests}
+            )
+            if response.status_code not in [200, 201]:
                 print(f"Hata: {response.status_code} - {response.text}")
                 return None
+            deploy = response.json()
+
+            # Sunucuda olmayan her özet için bir dosya yüklenir
+            required = set(deploy.get('required') or [])
+            uploads = {}
+            for path, sha in digests.items():
+                if sha in required and sha not in uploads:
+                    uploads[sha] = path
+
+            def upload(path):
+                with open(files[path], 'rb') as f:
+                    response = self.session.put(
+                        f"{self.netlify_api}/deploys/{deploy['id']}/files{quote(path)}",
+                        headers={**headers, 'Content-Type': 'application/octet-stream'},
+                        data=f
+                    )
+                if response.status_code not in [200, 201]:
+                    raise RuntimeError(f"{path} yüklenemedi: {response.status_code} - {response.text}")
+                return os.path.getsize(files[path])
+
+            uploaded = sum(run_parallel(upload, uploads.values(), self.workers))
+            print(f"{len(files)} dosya, {len(uploads)} yüklendi ({uploaded / 1024:.0f} KB), "
+                  f"{len(files) - len(uploads)} değişmemiş")
+
+            url = site.get('ssl_url') or deploy.get('ssl_url') or f"https://{site['name']}.netlify.app"
+            print(f"Başarılı! URL: {url}")
+            return url
 
         except Exception as e:
             print(f"Netlify yükleme hatası: {e}")
             return None
 
-    def upload_to_github_pages(self, github_token=None, repo_name=None):
-        """GitHub Pages'e yükleme"""
+    def _github(self, method, path, headers, expected, **kwargs):
+        """GitHub API isteği; beklenmeyen durum kodunda hata verir, JSON döner"""
+        response = self.session.request(method, f'{self.github_api}{path}', headers=headers, **kwargs)
+        if response.status_code not in expected:
+            raise RuntimeError(f"{method} {path}: {response.status_code} - {response.text}")
+        return response.json() if response.content else {}
+
+    def _github_repo(self, headers, owner, repo_name):
+        """Sabit Pages reposunu bulur, yoksa oluşturur (auto_init: dal ilk commit ile açılır)"""
+        response = self.session.get(f'{self.github_api}/repos/{owner}/{repo_name}', headers=headers)
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code != 404:
+            raise RuntimeError(f"Repo sorgulanamadı: {response.status_code} - {response.text}")
+        repo_data = {
+            'name': repo_name,
+            'description': 'Cafe Life Digital Menu',
+            'private': False,
+            'auto_init': True
+        }
+        return self._github('POST', '/user/repos', headers, [201], json=repo_data)
+
+    def upload_to_github_pages(self, github_token=None, repo_name=None, branch=None):
+        """
+        GitHub Pages'e tek commit ile yayın (Git Data API). Her dosyanın git
+        blob SHA'sı yerelde hesaplanıp daldaki ağaçla karşılaştırılır; sadece
+        değişen dosyalar için blob oluşturulur (paralel), sonra tek ağaç +
+        commit ile dal güncellenir. Repo her seferinde aynıdır (proje adı).
+        branch verilmezse Pages'in yayın dalı ve klasörü, Pages kapalıysa
+        reponun varsayılan dalı (gh-pages, master, main...) kullanılır.
+        """
         print("GitHub Pages'e yükleniyor...")
 
+        github_token = github_token or os.environ.get('GITHUB_TOKEN')
         if not github_token:
             print("GitHub token gerekli!")
             print("Token almak için: https://github.com/settings/tokens")
             print("'repo' ve 'pages' yetkilerini verin")
             github_token = input("GitHub Token girin: ").strip()
 
-        if not repo_name:
-            repo_name = f"{self.project_name}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        repo_name = repo_name or os.environ.get('GITHUB_REPO') or self.project_name
+        branch = branch or os.environ.get('GITHUB_BRANCH')
 
         try:
             headers = {
                 'Authorization': f'token {github_token}',
-                'Accept': 'application/vnd.github.v3+json',
-                'Content-Type': 'application/json'
+                'Accept': 'application/vnd.github.v3+json'
             }
 
-            # Repository oluştur
-            repo_data = {
-                'name': repo_name,
-                'description': 'Cafe Life Digital Menu',
-                'homepage': f'https://github.com/{github_token.split("_")[0]}/{repo_name}',
-                'private': False,
-                'auto_init': True
-            }
+            owner = self._github('GET', '/user', headers, [200])['login']
+            repo_info = self._github_repo(headers, owner, repo_name)
+            repo = f'/repos/{owner}/{repo_info["name"]}'
+
+            # Pages açıksa yayınladığı dal ve klasör (örn. gh-pages veya main:/docs)
+            response = self.session.get(f'{self.github_api}{repo}/pages', headers=headers)
+            if response.status_code not in [200, 404]:
+                raise RuntimeError(f"Pages sorgulanamadı: {response.status_code} - {response.text}")
+            source = None
+            if response.status_code == 200:
+                source = response.json().get('source') or {}
+
+            folder = ''
+            if source is not None:
+                if branch and branch != source.get('branch'):
+                    print(f"Not: Pages '{source.get('branch')}' dalından yayında; '{branch}' dalı yayınlanmaz")
+                else:
+                    branch = source.get('branch')
+                    folder = (source.get('path') or '/').strip('/')
+            branch = branch or repo_info['default_branch']
+
+            # Daldaki son commit ve ağacındaki dosyaların blob SHA'ları
+            head = self._github('GET', f'{repo}/git/ref/heads/{branch}', headers, [200])['object']['sha']
+            base_tree = self._github('GET', f'{repo}/git/commits/{head}', headers, [200])['tree']['sha']
+            tree = self._github('GET', f'{repo}/git/trees/{base_tree}', headers, [200], params={'recursive': '1'})
+            remote = {entry['path']: entry['sha'] for entry in tree.get('tree', []) if entry['type'] == 'blob'}
+
+            files = {f'{folder}/{path}' if folder else path: local
+                     for path, local in self.site_files().items()}
+            local = dict(zip(files, run_parallel(git_blob_sha, files.values(), self.workers)))
+            changed = [path for path, sha in local.items() if remote.get(path) != sha]
 
-            response = requests.post(
-                'https://api.github.com/user/repos',
-                headers=headers,
-                json=repo_data
-            )
-
-            if response.status_code not in [201, 422]:  # 422 = repo zaten var
-                print(f"Repo oluşturma hatası: {response.status_code}")
-                return None
-
-            repo_info = response.json()
-            owner = repo_info['owner']['login']
-
-            # HTML dosyasını oku ve encode et
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            content_encoded = base64.b64encode(html_content.encode()).decode()
-
-            # index.html dosyasını repo'ya yükle
-            file_data = {
-                'message': 'Add cafe menu HTML',
-                'content': content_encoded,
-                'branch': 'main'
-            }
-
-            response = requests.put(
-                f'https://api.github.com/repos/{owner}/{repo_name}/contents/index.html',
-                headers=headers,
-                json=file_data
-            )
-
-            if response.status_code not in [201, 200]:
-                print(f"Dosya yükleme hatası: {response.status_code}")
-                return None
-
-            # Pages'i aktifleştir
-            pages_data = {
-                'source': {
-                    'branch': 'main',
-                    'path': '/'
+            url = f'https://{owner}.github.io/{repo_name}'
+            if changed:
+                def create_blob(path):
+                    with open(files[path], 'rb') as f:
+                        content = base64.b64encode(f.read()).decode()
+                    blob = self._github('POST', f'{repo}/git/blobs', headers, [201],
+                                        json={'content': content, 'encoding': 'base64'})
+                    return {'path': path, 'mode': '100644', 'type': 'blob', 'sha': blob['sha']}
+
+                entries = run_parallel(create_blob, changed, self.workers)
+                new_tree = self._github('POST', f'{repo}/git/trees', headers, [201],
+                                        json={'base_tree': base_tree, 'tree': entries})
+                commit = self._github('POST', f'{repo}/git/commits', headers, [201], json={
+                    'message': f"Menü güncellendi ({len(changed)} dosya)",
+                    'tree': new_tree['sha'],
+                    'parents': [head]
+                })
+                self._github('PATCH', f'{repo}/git/refs/heads/{branch}', headers, [200], json={'sha': commit['sha']})
+
+            print(f"{len(files)} dosya, {len(changed)} değişti, {len(files) - len(changed)} aynı"
+                  + ("" if changed else " (commit gerekmedi)"))
+
+            # Pages'i aktifleştir (zaten açıksa dokunma)
+            if source is None:
+                pages_data = {
+                    'source': {
+                        'branch': branch,
+                        'path': '/'
+                    }
                 }
-            }
-
-            response = requests.post(
-                f'https://api.github.com/repos/{owner}/{repo_name}/pages',
-                headers=headers,
-                json=pages_data
-            )
+                self._github('POST', f'{repo}/pages', headers, [201, 409], json=pages_data)
+                print("Not: GitHub Pages'in aktif olması birkaç dakika sürebilir")
 
-            url = f'https://{owner}.github.io/{repo_name}'
             print(f"Başarılı! URL: {url}")
-            print("Not: GitHub Pages'in aktif olması birkaç dakika sürebilir")
-
             return url
 
         except Exception as e:
             print(f"GitHub yükleme hatası: {e}")
             return None
 
+    def _vercel_upload_files(self, headers, blobs, shas):
+        """
+        Eksik blobları /v2/files'a paralel yükler (diskten akış, base64 yok);
+        blobs: {sha: yerel yol}. Yüklenen bayt sayısı döner.
+        """
+        def upload(sha):
+            local = blobs[sha]
+            size = os.path.getsize(local)
+            with open(local, 'rb') as f:
+                response = self.session.post(
+                    f'{self.vercel_api}/v2/files',
+                    headers={**headers, 'Content-Type': 'application/octet-stream',
+                             'Content-Length': str(size), 'x-vercel-digest': sha},
+                    data=f
+                )
+            if response.status_code != 200:
+                raise RuntimeError(f"{local} yüklenemedi: {response.status_code} - {response.text}")
+            return size
+
+        return sum(run_parallel(upload, shas, self.workers))
+
     def upload_to_vercel(self, vercel_token=None):
-        """Vercel'e yükleme"""
+        """
+        Vercel'e SHA ile deploy: deployment dosyaların SHA1 ve boyutuyla
+        oluşturulur; Vercel'de olmayan bloblar (missing_files) yüklenip
+        deployment tekrar istenir. Değişmemiş dosyalar hiç gönderilmez.
+        """
         print("Vercel'e yükleniyor...")
 
+        vercel_token = vercel_token or os.environ.get('VERCEL_TOKEN')
         if not vercel_token:
             print("Vercel token gerekli!")
             print("Token almak için: https://vercel.com/account/tokens")
             vercel_token = input("Vercel Token girin: ").strip()
 
         try:
-            headers = {
-                'Authorization': f'Bearer {vercel_token}',
-                'Content-Type': 'application/json'
-            }
+            headers = {'Authorization': f'Bearer {vercel_token}'}
 
-            # HTML dosyasını oku
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            site = self.site_files()
+            shas = run_parallel(file_digest, site.values(), self.workers)
+            blobs = dict(zip(shas, site.values()))
 
-            # Deployment verisi hazırla
+            # Deployment verisi: dosya içeriği yerine SHA ve boyut
             deployment_data = {
                 'name': self.project_name,
                 'files': [
-                    {
-                        'file': 'index.html',
-                        'data': base64.b64encode(html_content.encode()).decode()
-                    }
+                    {'file': path, 'sha': sha, 'size': os.path.getsize(local)}
+                    for (path, local), sha in zip(site.items(), shas)
                 ],
                 'projectSettings': {
                     'framework': None
                 }
             }
 
-            response = requests.post(
-                'https://api.vercel.com/v13/deployments',
-                headers=headers,
-                json=deployment_data
-            )
+            uploaded = 0
+            missing = []
+            for _ in range(2):
+                response = self.session.post(
+                    f'{self.vercel_api}/v13/deployments',
+                    headers=headers,
+                    json=deployment_data
+                )
+                error = response.json().get('error', {}) if response.status_code == 400 else {}
+                if error.get('code') != 'missing_files' or missing:
+                    break
+                # Sadece Vercel'de olmayan bloblar yüklenir
+                missing = error.get('missing') or []
+                uploaded = self._vercel_upload_files(headers, blobs, missing)
 
-            if response.status_code == 201:
+            print(f"{len(site)} dosya, {len(missing)} yüklendi ({uploaded / 1024:.0f} KB), "
+                  f"{len(site) - len(missing)} Vercel'de mevcut")
+
+            if response.status_code in [200, 201]:
                 deployment_info = response.json()
                 url = f"https://{deployment_info['url']}"
                 print(f"Başarılı! URL: {url}")
@@ -216,6 +455,62 @@ class WebUploader:
             print(f"Vercel yükleme hatası: {e}")
             return None
 
+    def deploy_all(self, targets=tuple(DEPLOY_TARGETS), tokens=None, interactive=True):
+        """
+        Aynı siteyi verilen platformlara aynı anda yükler. Tokenlar yükleme
+        başlamadan bu iş parçacığında toplanır (ortam değişkeni, interactive
+        ise giriş); eksik token varsa hiçbir hedef başlamadan ValueError.
+        Sonra her hedef kendi iş parçacığında çalışır; toplam süre en yavaş
+        hedef kadardır. Hedef başına {'url', 'ok', 'seconds'} döner.
+        """
+        unknown = [target for target in targets if target not in DEPLOY_TARGETS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen hedef: {', '.join(unknown)} ({', '.join(DEPLOY_TARGETS)})")
+
+        # İş parçacıklarında input() çalışmasın: tüm tokenlar şimdi ve dolu olmalı
+        tokens = dict(tokens or {})
+        missing = []
+        for target in targets:
+            env, prompt = DEPLOY_TARGETS[target]
+            token = (tokens.get(target) or os.environ.get(env) or '').strip()
+            if not token and interactive:
+                try:
+                    token = input(prompt).strip()
+                except EOFError:
+                    token = ''
+            if not token:
+                missing.append(f"{target} ({env})")
+            tokens[target] = token
+        if missing:
+            raise ValueError(f"Token eksik: {', '.join(missing)}")
+
+        uploaders = {
+            'netlify': self.upload_to_netlify,
+            'vercel': self.upload_to_vercel,
+            'github': self.upload_to_github_pages,
+        }
+
+        def deploy(target):
+            start = time.perf_counter()
+            try:
+                url = uploaders[target](tokens[target])
+            except Exception as e:
+                print(f"{target} yükleme hatası: {e}")
+                url = None
+            return target, {'url': url, 'ok': bool(url), 'seconds': round(time.perf_counter() - start, 2)}
+
+        print(f"Paralel yükleme: {', '.join(targets)}")
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, len(targets))) as pool:
+            results = dict(pool.map(deploy, targets))
+
+        print(f"\n{'hedef':<10} {'süre':>7}  sonuç")
+        for target, result in results.items():
+            print(f"{target:<10} {result['seconds']:>6.2f}s  {result['url'] or 'HATA'}")
+        print(f"Toplam: {time.perf_counter() - start:.2f} sn, "
+              f"{sum(result['ok'] for result in results.values())}/{len(results)} başarılı")
+        return results
+
     def create_zip_for_manual_upload(self):
         """Manuel yükleme için ZIP dosyası oluştur"""
         print("Manuel yükleme için ZIP dosyası oluşturuluyor...")
@@ -262,17 +557,18 @@ class WebUploader:
             return
 
         print("\nYükleme Platformu Seçin:")
-        print("1. Netlify (Otomatik) - Önerilen")
+        print("1. Netlify (Token gerekli) - Önerilen")
         print("2. GitHub Pages (Token gerekli)")
         print("3. Vercel (Token gerekli)")
-        print("4. Manuel ZIP oluştur")
-        print("5. Çıkış")
+        print("4. Hepsi aynı anda (Netlify + GitHub Pages + Vercel)")
+        print("5. Manuel ZIP oluştur")
+        print("6. Çıkış")
 
         while True:
-            choice = input("\nSeçim (1-5): ").strip()
+            choice = input("\nSeçim (1-6): ").strip()
 
             if choice == "1":
-                url = self.upload_to_netlify_drop()
+                url = self.upload_to_netlify()
                 break
             elif choice == "2":
                 url = self.upload_to_github_pages()
@@ -281,13 +577,22 @@ class WebUploader:
                 url = self.upload_to_vercel()
                 break
             elif choice == "4":
+                # İlk başarılı adres ana adres olarak kullanılır
+                try:
+                    results = self.deploy_all()
+                except ValueError as e:
+                    print(f"Yükleme başlatılmadı: {e}")
+                    return None
+                url = next((result['url'] for result in results.values() if result['ok']), None)
+                break
+            elif choice == "5":
                 zip_path = self.create_zip_for_manual_upload()
                 return zip_path
-            elif choice == "5":
+            elif choice == "6":
                 print("Çıkılıyor...")
                 return None
             else:
-                print("Geçersiz seçim! Lütfen 1-5 arası bir sayı girin.")
+                print("Geçersiz seçim! Lütfen 1-6 arası bir sayı girin.")
 
         if 'url' in locals() and url:
             print(f"\n" + "=" * 50)
@@ -323,11 +628,29 @@ class WebUploader:
         return None
 
 
-def main():
-    """Ana program"""
+def main(argv=None):
+    """Ana program: --deploy verilirse menüsüz paralel yükleme, yoksa menü"""
+    parser = argparse.ArgumentParser(description="Cafe Life web yükleyici")
+    parser.add_argument('--deploy', nargs='+', choices=list(DEPLOY_TARGETS), metavar='HEDEF',
+                        help=f"Menüsüz, aynı anda yüklenecek platformlar ({', '.join(DEPLOY_TARGETS)})")
+    args = parser.parse_args(argv)
+
     uploader = WebUploader()
-    uploader.show_menu()
+    try:
+        if not args.deploy:
+            uploader.show_menu()
+            return 0
+        if not uploader.find_html_file():
+            return 2
+        try:
+            results = uploader.deploy_all(args.deploy, interactive=sys.stdin.isatty())
+        except ValueError as e:
+            print(f"Yükleme başlatılmadı: {e}")
+            return 2
+        return 0 if all(result['ok'] for result in results.values()) else 1
+    finally:
+        uploader.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file